@@ -0,0 +1,153 @@
+"""
+Utilitários compartilhados pelos benchmarks de `eithers`.
+
+Cada benchmark produz uma lista de `Measurement` (nome, valor, unidade) e
+delega a `main` a leitura dos argumentos, a escrita do JSON e a comparação
+com um resultado anterior. Todas as métricas são "menor é melhor".
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import importlib
+import io
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from types import ModuleType
+from typing import Callable, Sequence
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """Uma métrica de benchmark. `value` é sempre "menor é melhor"."""
+
+    name: str
+    value: float
+    unit: str
+
+
+def load_variant(name: str) -> ModuleType | None:
+    """
+    Importa `eithers.<name>` descartando o que ele imprimir. Retorna None
+    (e avisa em stderr) se a variante não puder ser importada neste Python.
+    """
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return importlib.import_module(f"eithers.{name}")
+    except ImportError as exc:
+        # Ex.: `typing.override` só existe a partir do Python 3.12.
+        print(f"ignorando {name}: {exc}", file=sys.stderr)
+        return None
+
+
+def ns_per_call(stmt: Callable[[], object], *, number: int | None = None, repeat: int = 5) -> float:
+    """Retorna o melhor tempo (em nanossegundos) por chamada de `stmt`."""
+    timer = timeit.Timer(stmt)
+    if number is None:
+        number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e9
+
+
+def bytes_per_instance(factory: Callable[[], object], *, count: int = 10_000) -> float:
+    """
+    Mede, com tracemalloc, quantos bytes cada objeto criado por `factory`
+    mantém vivos. A lista que guarda os objetos é alocada antes da medição.
+    """
+    keep: list[object] = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(count):
+            keep[i] = factory()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count
+
+
+def allocations_per_call(stmt: Callable[[], object], *, count: int = 1_000) -> float:
+    """
+    Conta quantos blocos de memória continuam vivos por chamada de `stmt`
+    quando os resultados são mantidos.
+    """
+    keep: list[object] = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for i in range(count):
+            keep[i] = stmt()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return blocks / count
+
+
+def _compare(current: Sequence[Measurement], baseline_path: str, tolerance: float) -> list[str]:
+    with open(baseline_path, encoding="utf-8") as fp:
+        baseline = {m["name"]: m["value"] for m in json.load(fp)["results"]}
+
+    regressions: list[str] = []
+    for m in current:
+        old = baseline.get(m.name)
+        if old is None or old <= 0:
+            continue
+        ratio = m.value / old
+        if ratio > 1 + tolerance:
+            regressions.append(f"{m.name}: {old:.1f} -> {m.value:.1f} {m.unit} ({ratio:.2f}x)")
+    return regressions
+
+
+def main(
+    benchmark: str,
+    collect: Callable[[argparse.Namespace], list[Measurement]],
+    argv: Sequence[str] | None = None,
+    configure: Callable[[argparse.ArgumentParser], None] | None = None,
+) -> int:
+    """
+    Ponto de entrada comum: executa `collect`, escreve o JSON em `--output`
+    (ou na saída padrão) e, com `--baseline`, falha se alguma métrica piorar
+    mais do que `--tolerance`.
+    """
+    parser = argparse.ArgumentParser(prog=f"benchmarks.{benchmark}")
+    parser.add_argument("--output", help="arquivo JSON de saída (padrão: stdout)")
+    parser.add_argument("--baseline", help="JSON de uma execução anterior para comparar")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="piora relativa aceita (padrão: 0.25)")
+    parser.add_argument("--quick", action="store_true", help="menos repetições, para verificações rápidas")
+    if configure is not None:
+        configure(parser)
+    args = parser.parse_args(argv)
+
+    results = collect(args)
+    payload = {
+        "benchmark": benchmark,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "results": [asdict(m) for m in results],
+    }
+    text = json.dumps(payload, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            fp.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        regressions = _compare(results, args.baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSÃO {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
@@ -0,0 +1,96 @@
+"""
+`bind_cached`/`map_cached`/`cached_either` (eithers.cache) contra o
+`flat_map`/`map` direto do either7, numa carga em que poucos valores
+distintos se repetem muito e a função custa alguns microssegundos.
+
+Também mede o custo de um acerto com uma função trivial (o overhead do
+cache em si), com e sem lock, e a taxa de acertos com um cache menor do que
+o número de valores distintos.
+
+Uso:
+    python -m benchmarks.bench_cache [--lookups N] [--distinct K]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from typing import Any, Callable
+
+from ._harness import Measurement, main, ns_per_call
+
+
+def _expensive(x: int) -> int:
+    # Simula uma consulta pura e cara (~alguns µs)
+    return sum(i * x for i in range(200))
+
+
+def _per_lookup(run: Callable[[], object], lookups: int) -> float:
+    start = time.perf_counter()
+    run()
+    return (time.perf_counter() - start) / lookups * 1e9
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers.cache import EitherCache, bind_cached, cached_either, map_cached
+    from eithers.either7 import Left, Right
+
+    lookups = 10_000 if args.quick else args.lookups
+    rng = random.Random(0)
+    # Distribuição enviesada: poucos valores concentram a maior parte das consultas
+    keys = [int(rng.paretovariate(1.2)) % args.distinct for _ in range(lookups)]
+    inputs = [Right(k) for k in keys]
+
+    def lookup(x: int) -> Any:
+        value = _expensive(x)
+        return Left("ímpar") if value % 7 == 0 else Right(value)
+
+    results: list[Measurement] = []
+    results.append(Measurement("flat_map.uncached", _per_lookup(lambda: [e.flat_map(lookup) for e in inputs], lookups), "ns/lookup"))
+    results.append(Measurement("map.uncached", _per_lookup(lambda: [e.map(_expensive) for e in inputs], lookups), "ns/lookup"))
+
+    for thread_safe in (False, True):
+        suffix = ".locked" if thread_safe else ""
+        cache: EitherCache[Any, Any, Any] = EitherCache(args.distinct, thread_safe=thread_safe)
+        results.append(Measurement(f"bind_cached{suffix}", _per_lookup(lambda: [bind_cached(e, lookup, cache) for e in inputs], lookups), "ns/lookup"))
+        cache = EitherCache(args.distinct, thread_safe=thread_safe)
+        results.append(Measurement(f"map_cached{suffix}", _per_lookup(lambda: [map_cached(e, _expensive, cache) for e in inputs], lookups), "ns/lookup"))
+
+    decorated = cached_either(args.distinct)(lookup)
+    results.append(Measurement("cached_either", _per_lookup(lambda: [e.flat_map(decorated) for e in inputs], lookups), "ns/lookup"))
+
+    # Chaves tipadas: 1, 1.0 e True não dividem a mesma entrada
+    typed = cached_either(16)(lambda x: Right(repr(x)))
+    typed_cache: EitherCache[Any, Any, Any] = EitherCache(16)
+    expected = [Right("1"), Right("1.0"), Right("True")]
+    assert [typed(v) for v in (1, 1.0, True)] == expected, "cached_either confundiu 1, 1.0 e True"
+    assert [map_cached(Right(v), repr, typed_cache) for v in (1, 1.0, True)] == expected, "map_cached confundiu 1, 1.0 e True"
+
+    # Overhead de um acerto, com uma função que não custa nada
+    number = 20_000 if args.quick else None
+    hit = Right(1)
+    for thread_safe in (False, True):
+        suffix = ".locked" if thread_safe else ""
+        cache = EitherCache(16, thread_safe=thread_safe)
+        results.append(Measurement(f"hit.bind_cached{suffix}", ns_per_call(lambda: bind_cached(hit, Right, cache), number=number), "ns/call"))
+    results.append(Measurement("hit.flat_map", ns_per_call(lambda: hit.flat_map(Right), number=number), "ns/call"))
+
+    # Taxa de faltas com um cache de 1/10 dos valores distintos (LRU despejando)
+    small: EitherCache[Any, Any, Any] = EitherCache(max(1, args.distinct // 10))
+    for e in inputs:
+        _ = bind_cached(e, lookup, small)
+    stats = small.stats()
+    results.append(Measurement("small_cache.miss_ratio", stats.misses / lookups, "ratio"))
+    results.append(Measurement("small_cache.evictions", stats.evictions, "entries"))
+    return results
+
+
+def _configure(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--lookups", type=int, default=200_000, help="consultas por medida (padrão: 2×10⁵)")
+    parser.add_argument("--distinct", type=int, default=1_000, help="valores distintos (padrão: 1000)")
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_cache", collect, configure=_configure))
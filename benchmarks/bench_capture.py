@@ -0,0 +1,79 @@
+"""
+Memória e pausas de GC ao guardar falhas capturadas: `try_catch` (o Left
+guarda a exceção viva, com traceback, frames e locais) contra
+`try_catch_record` (o Left guarda um ErrorRecord compacto).
+
+Guarda 10⁶ falhas no modo ErrorRecord; o modo com exceções vivas usa
+`--live-count` (padrão 10⁵) porque cada falha prende vários frames. Os
+resultados são por falha, então os dois modos são comparáveis.
+
+Uso:
+    python -m benchmarks.bench_capture [--count N] [--live-count N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from ._harness import Measurement, main
+
+
+def _parse(i: int, payload: list[int]) -> int:
+    if i >= 0:
+        raise ValueError(f"item {i} inválido")
+    return payload[0]
+
+
+def _validate(i: int) -> int:
+    # Locais que ficam presos ao frame enquanto o traceback existir
+    payload = list(range(32))
+    return _parse(i, payload)
+
+
+def _keep(capture: Callable[[Callable[[], int]], Any], count: int) -> tuple[list[Any], float]:
+    start = time.perf_counter()
+    kept = [capture(lambda i=i: _validate(i)) for i in range(count)]
+    return kept, time.perf_counter() - start
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers.capture import try_catch_record
+    from eithers.either7 import try_catch
+
+    count = 20_000 if args.quick else args.count
+    live_count = min(count, 20_000 if args.quick else args.live_count)
+    results: list[Measurement] = []
+    for name, capture, n in (("exception", try_catch, live_count), ("record", try_catch_record, count)):
+        gc.collect()
+        tracemalloc.start()
+        kept, _ = _keep(capture, n)
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results.append(Measurement(f"{name}.bytes_per_failure", current / n, "bytes"))
+
+        # Pausa de uma coleta completa com as falhas ainda vivas
+        start = time.perf_counter()
+        gc.collect()
+        results.append(Measurement(f"{name}.gc_collect.n{n}", (time.perf_counter() - start) * 1e3, "ms"))
+        del kept
+        gc.collect()
+
+        _, elapsed = _keep(capture, n)
+        results.append(Measurement(f"{name}.capture", elapsed / n * 1e9, "ns/failure"))
+        gc.collect()
+    return results
+
+
+def _configure(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--count", type=int, default=1_000_000, help="falhas guardadas com ErrorRecord (padrão: 10⁶)")
+    parser.add_argument("--live-count", type=int, default=100_000, help="falhas guardadas com a exceção viva (padrão: 10⁵)")
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_capture", collect, configure=_configure))
@@ -0,0 +1,107 @@
+"""
+Formato binário de eithers.codec contra `pickle` (protocolo mais alto):
+bytes por item e tempo de codificação/decodificação por item, em lotes de
+Either do either7 e do either9 com payloads típicos (inteiros, floats,
+strings, vetores de floats e de inteiros e registros), e para um único
+Either.
+
+O tamanho do codec não pode passar o do pickle em nenhum dos casos, menos
+nos registros: o pickle grava cada chave repetida de dict uma vez só e
+depois a referencia, e o codec repete a chave em todo item (cerca de 55
+contra 49 bytes por registro). Em tempo, o pickle é código C; o codec
+ganha na codificação de escalares e perde na decodificação e nos payloads
+aninhados, e o benchmark só mede, sem afirmar nada sobre isso.
+
+Uso:
+    python -m benchmarks.bench_codec [--size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import pickle
+import random
+import sys
+import time
+from typing import Any, Callable
+
+from ._harness import Measurement, load_variant, main, ns_per_call
+
+
+def _per_item(run: Callable[[], object], size: int, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best / size * 1e9
+
+
+def _payloads(size: int) -> dict[str, list[tuple[bool, Any]]]:
+    rng = random.Random(0)
+    return {
+        "int": [(i % 10 != 0, i if i % 10 else "valor inválido") for i in range(size)],
+        "float": [(True, rng.random()) for _ in range(size)],
+        "str": [(True, f"user-{i}") for i in range(size)],
+        "vector": [(True, [rng.random() for _ in range(16)]) for _ in range(size // 10)],
+        "int_vector": [(True, [rng.randrange(-1000, 1000) for _ in range(16)]) for _ in range(size // 10)],
+        "record": [(True, {"id": i, "name": f"user-{i}", "tags": ["a", "b"], "score": i / 3}) for i in range(size // 10)],
+    }
+
+
+# Payloads em que o codec pode ser maior que o pickle (ver o docstring)
+_LARGER_THAN_PICKLE = {"record"}
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers import codec
+
+    size = 10_000 if args.quick else args.size
+    payloads = _payloads(size)
+    results: list[Measurement] = []
+    for variant in ("either7", "either9"):
+        module = load_variant(variant)
+        if module is None:
+            continue
+        left, right = module.Left, module.Right
+        for kind, rows in payloads.items():
+            items = [right(value) if ok else left(value) for ok, value in rows]
+            n = len(items)
+            encoded = codec.encode_batch(items)
+            pickled = pickle.dumps(items, pickle.HIGHEST_PROTOCOL)
+            prefix = f"{variant}.{kind}"
+            if kind not in _LARGER_THAN_PICKLE:
+                assert len(encoded) <= len(pickled), f"{prefix}: {len(encoded)} bytes no codec, {len(pickled)} no pickle"
+            results.append(Measurement(f"{prefix}.codec.size", len(encoded) / n, "bytes/item"))
+            results.append(Measurement(f"{prefix}.pickle.size", len(pickled) / n, "bytes/item"))
+            results.append(Measurement(f"{prefix}.codec.encode", _per_item(lambda: codec.encode_batch(items), n), "ns/item"))
+            results.append(Measurement(f"{prefix}.pickle.encode", _per_item(lambda: pickle.dumps(items, pickle.HIGHEST_PROTOCOL), n), "ns/item"))
+            results.append(
+                Measurement(f"{prefix}.codec.decode", _per_item(lambda: codec.decode_batch(encoded, left=left, right=right), n), "ns/item")
+            )
+            results.append(Measurement(f"{prefix}.pickle.decode", _per_item(lambda: pickle.loads(pickled), n), "ns/item"))
+
+        # Listas de inteiros avulsas: vão na menor largura em que cabem
+        for name, values in (("range100", list(range(100))), ("zeros1000", [0] * 1000)):
+            data, blob = codec.encode(right(values)), pickle.dumps(right(values), pickle.HIGHEST_PROTOCOL)
+            assert len(data) <= len(blob), f"{variant}.{name}: {len(data)} bytes no codec, {len(blob)} no pickle"
+            results.append(Measurement(f"{variant}.{name}.codec.size", len(data), "bytes"))
+            results.append(Measurement(f"{variant}.{name}.pickle.size", len(blob), "bytes"))
+
+        # Um Either avulso, como numa mensagem entre processos
+        single = right(42)
+        data, blob = codec.encode(single), pickle.dumps(single, pickle.HIGHEST_PROTOCOL)
+        number = 20_000 if args.quick else None
+        results.append(Measurement(f"{variant}.single.codec.size", len(data), "bytes"))
+        results.append(Measurement(f"{variant}.single.pickle.size", len(blob), "bytes"))
+        results.append(Measurement(f"{variant}.single.codec.roundtrip", ns_per_call(lambda: codec.decode(codec.encode(single), left=left, right=right), number=number), "ns/call"))
+        results.append(Measurement(f"{variant}.single.pickle.roundtrip", ns_per_call(lambda: pickle.loads(pickle.dumps(single, pickle.HIGHEST_PROTOCOL)), number=number), "ns/call"))
+    return results
+
+
+def _configure(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--size", type=int, default=100_000, help="itens por lote (padrão: 10⁵)")
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_codec", collect, configure=_configure))
@@ -0,0 +1,50 @@
+"""
+Custo de produzir uma falha: Left com uma exceção nova (como nos exemplos
+de `divide`), Left com uma exceção pré-alocada, o Left pré-alocado de um
+ErrorCode (eithers.codes) e um ErrorCode com payload. Mede tempo,
+blocos alocados e bytes mantidos por falha, e o custo de criar a exceção
+sob demanda a partir do código.
+
+Uso:
+    python -m benchmarks.bench_codes
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Any, Callable
+
+from ._harness import Measurement, allocations_per_call, bytes_per_instance, main, ns_per_call
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers.codes import ErrorCode
+    from eithers.either7 import Left
+
+    class MathError(ErrorCode):
+        DIVISION_BY_ZERO = ("Division by zero", ZeroDivisionError)
+
+    code = MathError.DIVISION_BY_ZERO
+    shared = ZeroDivisionError("Division by zero")
+    number = 20_000 if args.quick else None
+
+    cases: dict[str, Callable[[], Any]] = {
+        "exception_left": lambda: Left(ZeroDivisionError("Division by zero")),
+        "shared_exception_left": lambda: Left(shared),
+        "code_left": lambda: code.left,
+        "code_payload_left": lambda: code.with_payload(0),
+    }
+    results: list[Measurement] = []
+    for name, make in cases.items():
+        results.append(Measurement(f"{name}.time", ns_per_call(make, number=number), "ns/call"))
+        results.append(Measurement(f"{name}.allocations", allocations_per_call(make), "blocks/call"))
+        results.append(Measurement(f"{name}.bytes", bytes_per_instance(make), "bytes"))
+
+    # Exceção criada só quando alguém pede
+    results.append(Measurement("code.to_exception.time", ns_per_call(code.to_exception, number=number), "ns/call"))
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_codes", collect))
@@ -0,0 +1,145 @@
+"""
+Latência de cauda de uma cadeia de três estágios com prazo (eithers.deadline)
+e sem prazo. Cada estágio costuma levar `--fast-ms`, mas com probabilidade
+`--tail-prob` leva `--tail-ms` (um backend engasgado). Sem prazo, o p99
+acompanha a cauda; com `deadline(--budget-ms)`, a requisição vira
+`Left(DeadlineExceeded)` quando o prazo acaba e o p99 fica perto do prazo.
+Mede as versões com threads (`call_in`) e com asyncio (`acall`), a fração
+de requisições que estourou o prazo e o custo de `guard` por estágio.
+
+Uso:
+    python -m benchmarks.bench_deadline [--requests 400] [--budget-ms 20] [--tail-ms 100] [--tail-prob 0.03]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from ._harness import Measurement, main, ns_per_call
+
+_STAGES = 3
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[int(fraction * (len(ordered) - 1))]
+
+
+def _summary(name: str, latencies: list[float], timeouts: int) -> list[Measurement]:
+    return [
+        Measurement(f"{name}.p50", _percentile(latencies, 0.5) * 1e3, "ms"),
+        Measurement(f"{name}.p99", _percentile(latencies, 0.99) * 1e3, "ms"),
+        Measurement(f"{name}.max", max(latencies) * 1e3, "ms"),
+        Measurement(f"{name}.timeouts", timeouts / len(latencies), "ratio"),
+    ]
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers.deadline import DeadlineExceeded, acall, call_in, deadline, guard
+    from eithers.either7 import Either, Right
+
+    requests: int = args.requests // 4 if args.quick else args.requests
+    budget: float = args.budget_ms / 1000
+
+    def delays() -> list[list[float]]:
+        # Mesma sequência de latências para todos os modos
+        rng = random.Random(args.seed)
+        return [[args.tail_ms / 1000 if rng.random() < args.tail_prob else args.fast_ms / 1000 for _ in range(_STAGES)] for _ in range(requests)]
+
+    def stage(delay: float, value: int) -> int:
+        time.sleep(delay)
+        return value + 1
+
+    async def astage(delay: float, value: int) -> int:
+        await asyncio.sleep(delay)
+        return value + 1
+
+    def timed(run: Callable[[], Either[Exception, int]]) -> tuple[float, bool]:
+        start = time.perf_counter()
+        result = run()
+        return time.perf_counter() - start, result.fold(lambda e: isinstance(e, DeadlineExceeded), lambda _: False)
+
+    results: list[Measurement] = []
+    # Pool próprio e largo: threads que estouraram o prazo continuam ocupadas até o fim do sleep
+    with ThreadPoolExecutor(max_workers=32) as pool:
+
+        def sync_chain(steps: list[float], bounded: bool) -> Either[Exception, int]:
+            either: Either[Exception, int] = Right(0)
+            for delay in steps:
+                if bounded:
+                    either = either.flat_map(lambda value, delay=delay: call_in(pool, stage, delay, value))
+                else:
+                    either = either.map(lambda value, delay=delay: stage(delay, value))
+            return either
+
+        def sync_run(steps: list[float], bounded: bool) -> Either[Exception, int]:
+            if not bounded:
+                return sync_chain(steps, False)
+            with deadline(budget):
+                return sync_chain(steps, True)
+
+        for name, bounded in (("sync_no_deadline", False), ("sync_deadline", True)):
+            samples = [timed(lambda steps=steps: sync_run(steps, bounded)) for steps in delays()]
+            results += _summary(name, [latency for latency, _ in samples], sum(timeout for _, timeout in samples))
+
+    async def async_run(steps: list[float], bounded: bool) -> Either[Exception, int]:
+        if not bounded:
+            value = 0
+            for delay in steps:
+                value = await astage(delay, value)
+            return Right(value)
+        with deadline(budget):
+            either: Either[Exception, int] = Right(0)
+            for delay in steps:
+                # Para no primeiro Left, como flat_map
+                either = await either.fold(_left_now, lambda value, delay=delay: acall(astage, delay, value))
+            return either
+
+    async def async_all(bounded: bool) -> list[tuple[float, bool]]:
+        samples: list[tuple[float, bool]] = []
+        for steps in delays():
+            start = time.perf_counter()
+            result = await async_run(steps, bounded)
+            samples.append((time.perf_counter() - start, result.fold(lambda e: isinstance(e, DeadlineExceeded), lambda _: False)))
+        return samples
+
+    for name, bounded in (("async_no_deadline", False), ("async_deadline", True)):
+        samples = asyncio.run(async_all(bounded))
+        results += _summary(name, [latency for latency, _ in samples], sum(timeout for _, timeout in samples))
+
+    # Custo da verificação de prazo em um estágio que não faz nada
+    def noop(value: int) -> Any:
+        return Right(value)
+
+    guarded = guard(noop)
+    number = 20_000 if args.quick else None
+    results.append(Measurement("stage.plain", ns_per_call(lambda: noop(1), number=number), "ns/call"))
+    results.append(Measurement("stage.guard_no_deadline", ns_per_call(lambda: guarded(1), number=number), "ns/call"))
+    with deadline(3600):
+        results.append(Measurement("stage.guard_deadline", ns_per_call(lambda: guarded(1), number=number), "ns/call"))
+    return results
+
+
+async def _left_now(error: Exception) -> Any:
+    from eithers.either7 import Left
+
+    return Left(error)
+
+
+def _configure(parser: argparse.ArgumentParser) -> None:
+    _ = parser.add_argument("--requests", type=int, default=400, help="requisições por modo")
+    _ = parser.add_argument("--budget-ms", type=float, default=20.0, help="prazo de cada requisição")
+    _ = parser.add_argument("--fast-ms", type=float, default=1.0, help="latência normal de um estágio")
+    _ = parser.add_argument("--tail-ms", type=float, default=100.0, help="latência de um estágio na cauda")
+    _ = parser.add_argument("--tail-prob", type=float, default=0.03, help="probabilidade de um estágio cair na cauda")
+    _ = parser.add_argument("--seed", type=int, default=1, help="semente das latências simuladas")
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_deadline", collect, configure=_configure))
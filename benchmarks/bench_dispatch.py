@@ -0,0 +1,160 @@
+"""
+Custo de descobrir o lado de um resultado: propriedade, método, atributo de
+classe (`is_right`/`tag`), `type(x) is Right`, `isinstance` e `match`, em
+10⁷ verificações (metade Left, metade Right) por variante.
+
+`abc_property` reproduz o desenho antigo de either8/either9 (ABC com
+`is_right` como propriedade abstrata) como referência.
+
+Uso:
+    python -m benchmarks.bench_dispatch [--count N] [--variant either9 ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from abc import ABC, abstractmethod
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from ._harness import Measurement, load_variant, main
+
+VARIANTS = ("either6", "either7", "either8", "either9", "my_either")
+
+# Resultados distintos reaproveitados até completar `--count` verificações
+POOL_SIZE = 10_000
+
+
+class _Either(ABC):
+    __slots__ = ("value",)
+
+    def __init__(self, value: object) -> None:
+        self.value = value
+
+    @property
+    @abstractmethod
+    def is_right(self) -> bool:
+        pass
+
+
+class _Left(_Either):
+    __slots__ = ()
+
+    @property
+    def is_right(self) -> bool:
+        return False
+
+
+class _Right(_Either):
+    __slots__ = ()
+
+    @property
+    def is_right(self) -> bool:
+        return True
+
+
+def _by_property(pool: list[Any], rounds: int, right: type) -> int:
+    n = 0
+    for _ in range(rounds):
+        for x in pool:
+            if x.is_right:
+                n += 1
+    return n
+
+
+def _by_method(pool: list[Any], rounds: int, right: type) -> int:
+    n = 0
+    for _ in range(rounds):
+        for x in pool:
+            if x.is_right():
+                n += 1
+    return n
+
+
+def _by_tag(pool: list[Any], rounds: int, right: type) -> int:
+    n = 0
+    for _ in range(rounds):
+        for x in pool:
+            if x.tag == "right":
+                n += 1
+    return n
+
+
+def _by_type(pool: list[Any], rounds: int, right: type) -> int:
+    n = 0
+    for _ in range(rounds):
+        for x in pool:
+            if type(x) is right:
+                n += 1
+    return n
+
+
+def _by_isinstance(pool: list[Any], rounds: int, right: type) -> int:
+    n = 0
+    for _ in range(rounds):
+        for x in pool:
+            if isinstance(x, right):
+                n += 1
+    return n
+
+
+def _by_match(pool: list[Any], rounds: int, right: type[object]) -> int:
+    n = 0
+    for _ in range(rounds):
+        for x in pool:
+            match x:
+                case right():
+                    n += 1
+                case _:
+                    pass
+    return n
+
+
+# Estilo de despacho -> (função, o que a variante precisa oferecer)
+STYLES: dict[str, tuple[Callable[[list[Any], int, type], int], Callable[[Any], bool]]] = {
+    "property": (_by_property, lambda right: isinstance(right.__dict__.get("is_right"), property)),
+    "class_attr": (_by_property, lambda right: isinstance(right.__dict__.get("is_right"), bool)),
+    "method": (_by_method, lambda right: callable(right.__dict__.get("is_right"))),
+    "tag": (_by_tag, lambda right: hasattr(right, "tag")),
+    "type_is": (_by_type, lambda right: True),
+    "isinstance": (_by_isinstance, lambda right: True),
+    "match": (_by_match, lambda right: True),
+}
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    count = 100_000 if args.quick else args.count
+    pool_size = min(POOL_SIZE, count)
+    rounds = max(1, count // pool_size)
+    checks = pool_size * rounds
+
+    modules: list[tuple[str, Any]] = [("abc_property", SimpleNamespace(Left=_Left, Right=_Right))]
+    for name in args.variant or VARIANTS:
+        module = load_variant(name)
+        if module is not None:
+            modules.append((name, module))
+
+    results: list[Measurement] = []
+    for name, module in modules:
+        left, right = module.Left, module.Right
+        pool = [right(i) if i % 2 else left(i) for i in range(pool_size)]
+        for style, (run, supported) in STYLES.items():
+            if not supported(right):
+                continue
+            start = time.perf_counter()
+            found = run(pool, rounds, right)
+            elapsed = time.perf_counter() - start
+            assert found == checks // 2, (name, style, found)
+            results.append(Measurement(f"{name}.{style}", elapsed / checks * 1e9, "ns/check"))
+    return results
+
+
+def _configure(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--count", type=int, default=10_000_000, help="verificações por medida (padrão: 10⁷)")
+    parser.add_argument("--variant", action="append", choices=VARIANTS, help="mede só esta variante (repetível)")
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_dispatch", collect, configure=_configure))
@@ -0,0 +1,101 @@
+"""
+Quatro passos dependentes no either9 escritos de quatro jeitos: `bind`
+aninhado com lambdas, código manual com `if isinstance(r, Left)`, `@do` compilado
+e `@do` executando o gerador (eithers.do). Mede o caminho em que todos os
+passos dão Right e o caminho em que o terceiro passo devolve Left.
+
+Uso:
+    python -m benchmarks.bench_do
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import sys
+from typing import Any, Callable
+
+from ._harness import Measurement, main, ns_per_call
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers.do import Do, do, do_generator, is_compiled
+    from eithers.either9 import Left, Result, Right
+
+    def step(x: int) -> Result[str, int]:
+        return Right(x + 1) if x < 2 else Left("limite")
+
+    def nested_bind(raw: int, step: Callable[[int], Result[str, int]]) -> Result[str, int]:
+        return step(raw).bind(lambda a: step(a).bind(lambda b: step(b).bind(lambda c: step(c).map(lambda d: a + b + c + d))))
+
+    def hand_written(raw: int, step: Callable[[int], Result[str, int]]) -> Result[str, int]:
+        a = step(raw)
+        if isinstance(a, Left):
+            return a
+        b = step(a.value)
+        if isinstance(b, Left):
+            return b
+        c = step(b.value)
+        if isinstance(c, Left):
+            return c
+        d = step(c.value)
+        if isinstance(d, Left):
+            return d
+        return Right(a.value + b.value + c.value + d.value)
+
+    # Sem closures (o passo vem como argumento), para o `@do` poder compilar
+    def generator(raw: int, step: Callable[[int], Result[str, int]]) -> Do[str, int]:
+        a = yield step(raw)
+        b = yield step(a)
+        c = yield step(b)
+        d = yield step(c)
+        return a + b + c + d
+
+    # `return` dentro de try/with/match também precisa virar Right
+    def return_in_try(either: Result[str, int]) -> Do[str, int]:
+        a: int = yield either
+        try:
+            return a + 1
+        except ValueError:
+            return -1
+
+    def return_in_with(either: Result[str, int]) -> Do[str, int]:
+        a: int = yield either
+        with contextlib.nullcontext():
+            return a + 1
+
+    def return_in_match(either: Result[str, int]) -> Do[str, str]:
+        a: int = yield either
+        match a:
+            case 1:
+                return "one"
+            case _:
+                return "other"
+
+    for shape, expected in ((return_in_try, Right(2)), (return_in_with, Right(2)), (return_in_match, Right("one"))):
+        for runner in (do, do_generator):
+            got = runner(shape)(Right(1))
+            assert type(got) is Right and got.value == expected.value, (shape.__name__, runner.__name__, got)
+
+    compiled = do(generator)
+    assert is_compiled(compiled), "o gerador do benchmark deveria ser compilado"
+    cases: dict[str, Callable[[int, Callable[[int], Result[str, int]]], Result[str, int]]] = {
+        "nested_bind": nested_bind,
+        "hand_written": hand_written,
+        "do_compiled": compiled,
+        "do_generator": do_generator(generator),
+    }
+    number = 20_000 if args.quick else None
+    results: list[Measurement] = []
+    # -10 passa pelos quatro passos; 0 chega a 2 e falha no terceiro
+    for path, raw in (("right", -10), ("left", 0)):
+        expected = hand_written(raw, step).value
+        for name, run in cases.items():
+            assert run(raw, step).value == expected, name
+            call: Callable[[], Any] = lambda run=run, raw=raw: run(raw, step)
+            results.append(Measurement(f"{name}.{path}", ns_per_call(call, number=number), "ns/call"))
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_do", collect))
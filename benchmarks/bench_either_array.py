@@ -0,0 +1,126 @@
+"""
+Vazão de EitherArray (colunar, NumPy) contra a lista de objetos Left/Right
+do either7, para o `divide` de either.py seguido de map, fold e get_or_else.
+
+Antes de medir, confere linha a linha que `where`, `bind`, `map_left` e
+`from_eithers` dão o mesmo que os Left/Right do either9 calculados um a um,
+inclusive com um erro que é uma tupla.
+
+Uso:
+    python -m benchmarks.bench_either_array --size 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Any, Callable
+
+from ._harness import Measurement, main
+
+
+def _best(stmt: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stmt()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _rows(eithers: list[Any]) -> list[tuple[bool, Any]]:
+    """(é Left?, valor) de cada Either, do either7 (método) ou do either9 (atributo)."""
+    return [(e.tag == "left", e.value) for e in eithers]
+
+
+def _check_matches_objects(a_list: list[float], b_list: list[float]) -> None:
+    import numpy as np
+
+    from eithers import either9
+    from eithers.either_array import EitherArray, divide
+
+    a, b = np.array(a_list), np.array(b_list)
+    for error in (ZeroDivisionError("Division by zero"), ("E_DIV", "Division by zero")):
+        expected = [either9.Left(error) if y == 0 else either9.Right(x / y) for x, y in zip(a_list, b_list)]
+        ok = b != 0
+        with np.errstate(divide="ignore"):
+            column = EitherArray.where(ok, a / b, error)
+        assert _rows(column.to_eithers()) == _rows(expected), f"where difere do either9 com erro {error!r}"
+
+        # O mesmo resultado por bind, a partir de uma coluna toda Right
+        start = EitherArray(np.ones(len(a), dtype=np.bool_), np.stack([a, b], axis=1))
+        with np.errstate(divide="ignore"):
+            bound = start.bind(lambda pairs: (pairs[:, 1] != 0, pairs[:, 0] / pairs[:, 1]), error=error)
+        assert _rows(bound.to_eithers()) == _rows(expected), f"bind difere do either9 com erro {error!r}"
+
+        assert _rows(EitherArray.from_eithers(column.to_eithers()).to_eithers()) == _rows(expected), "from_eithers não faz a ida e volta"
+
+    # Erros por linha em tupla, pelo bind de três colunas e pelo map_left
+    coded = [either9.Left(("E_DIV", x)) if y == 0 else either9.Right(x / y) for x, y in zip(a_list, b_list)]
+    start = EitherArray(np.ones(len(a), dtype=np.bool_), np.stack([a, b], axis=1))
+    with np.errstate(divide="ignore"):
+        bound = start.bind(lambda pairs: (pairs[:, 1] != 0, pairs[:, 0] / pairs[:, 1], [("E_DIV", x) for x in pairs[:, 0].tolist()]))
+    assert _rows(bound.to_eithers()) == _rows(coded), "bind com erros por linha difere do either9"
+    relabeled = divide(a, b).map_left(lambda errors: [("E_DIV", x) for x in a[b == 0].tolist()])
+    assert _rows(relabeled.to_eithers()) == _rows(coded), "map_left com tuplas difere do either9"
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    import numpy as np
+
+    from eithers.either7 import Either, Left, Right
+    from eithers.either_array import divide
+
+    size = 100_000 if args.quick else args.size
+    repeat = 3 if args.quick else 5
+    rng = np.random.default_rng(0)
+    a = rng.uniform(1, 100, size)
+    b = rng.integers(0, 10, size).astype(np.float64)  # ~10% de divisões por zero
+    a_list, b_list = a.tolist(), b.tolist()
+    error = ZeroDivisionError("Division by zero")
+
+    def divide_one(x: float, y: float) -> Either[ZeroDivisionError, float]:
+        if y == 0:
+            return Left(error)
+        return Right(x / y)
+
+    _check_matches_objects(a_list[:10_000], b_list[:10_000])
+    objects = [divide_one(x, y) for x, y in zip(a_list, b_list)]
+    column = divide(a, b)
+
+    cases: dict[str, tuple[Callable[[], object], Callable[[], object]]] = {
+        "divide": (
+            lambda: [divide_one(x, y) for x, y in zip(a_list, b_list)],
+            lambda: divide(a, b),
+        ),
+        "map": (
+            lambda: [e.map(lambda v: v * 2) for e in objects],
+            lambda: column.map(lambda v: v * 2),
+        ),
+        "fold": (
+            lambda: [e.fold(lambda _: -1.0, lambda v: v + 1) for e in objects],
+            lambda: column.fold(lambda errs: np.full(len(errs), -1.0), lambda v: v + 1),
+        ),
+        "get_or_else": (
+            lambda: [e.get_or_else(0.0) for e in objects],
+            lambda: column.get_or_else(0.0),
+        ),
+    }
+
+    results: list[Measurement] = []
+    for name, (per_object, vectorized) in cases.items():
+        slow = _best(per_object, repeat) / size * 1e9
+        fast = _best(vectorized, repeat) / size * 1e9
+        results.append(Measurement(f"objects.{name}", slow, "ns/elem"))
+        results.append(Measurement(f"either_array.{name}", fast, "ns/elem"))
+        results.append(Measurement(f"either_array.{name}.relative", fast / slow, "x"))
+    return results
+
+
+def _configure(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--size", type=int, default=1_000_000, help="número de elementos (padrão: 10⁶)")
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_either_array", collect, configure=_configure))
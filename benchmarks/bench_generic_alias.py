@@ -0,0 +1,109 @@
+"""
+Garante que o caminho quente de either6/either7/either9 não volte a construir
+resultados com `Left[L, T](...)`/`Right[L, T](...)`.
+
+Cada subscrição cria um `typing._GenericAlias` e passa pelo seu `__call__`,
+que custa várias vezes uma construção direta. O benchmark:
+
+- conta as chamadas a `_GenericAlias.__call__` durante as operações (deve ser zero);
+- compara o tempo de cada operação com o de um construtor simples e falha se
+  a razão passar de `--max-ratio`.
+
+Uso:
+    python -m benchmarks.bench_generic_alias
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import typing
+from types import ModuleType
+from typing import Any, Callable
+
+from ._harness import Measurement, load_variant, main, ns_per_call
+
+MODULES = ("either6", "either7", "either9")
+
+
+def _operations(mod: ModuleType) -> dict[str, Callable[[], object]]:
+    left, right = mod.Left("erro"), mod.Right(1)
+
+    def ident(x: Any) -> Any:
+        return x
+
+    ops: dict[str, Callable[[], object]] = {
+        "left.map": lambda: left.map(ident),
+        "right.map": lambda: right.map(ident),
+    }
+    if hasattr(mod, "try_catch"):
+        ops["left.flat_map"] = lambda: left.flat_map(mod.Right)
+        ops["left.map_left"] = lambda: left.map_left(ident)
+        ops["right.map_left"] = lambda: right.map_left(ident)
+        ops["of_right"] = lambda: mod.of_right(1)
+        ops["of_left"] = lambda: mod.of_left("erro")
+        ops["try_catch"] = lambda: mod.try_catch(lambda: 1)
+    else:
+        ops["left.bind"] = lambda: left.bind(mod.Right)
+        ops["left_fn"] = lambda: mod.left("erro")
+        ops["right_fn"] = lambda: mod.right(1)
+    return ops
+
+
+def _count_alias_calls(ops: dict[str, Callable[[], object]]) -> dict[str, int]:
+    alias_type: Any = getattr(typing, "_BaseGenericAlias")
+    original = alias_type.__call__
+    calls = 0
+
+    def counting(self: Any, *args: Any, **kwargs: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        return original(self, *args, **kwargs)
+
+    counts: dict[str, int] = {}
+    alias_type.__call__ = counting
+    try:
+        for name, op in ops.items():
+            calls = 0
+            op()
+            counts[name] = calls
+    finally:
+        alias_type.__call__ = original
+    return counts
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    number = 2_000 if args.quick else None
+    results: list[Measurement] = []
+    failures: list[str] = []
+    for name in MODULES:
+        mod = load_variant(name)
+        if mod is None:
+            continue
+
+        ops = _operations(mod)
+        for op, calls in _count_alias_calls(ops).items():
+            results.append(Measurement(f"{name}.{op}.alias_calls", calls, "calls"))
+            if calls:
+                failures.append(f"{name}.{op} chamou _GenericAlias.__call__ {calls}x")
+
+        baseline = ns_per_call(lambda mod=mod: mod.Right(1), number=number)
+        for op, stmt in ops.items():
+            ratio = ns_per_call(stmt, number=number) / baseline
+            results.append(Measurement(f"{name}.{op}.ratio", ratio, "x"))
+            if ratio > args.max_ratio:
+                failures.append(f"{name}.{op} custa {ratio:.2f}x um construtor simples")
+
+    for line in failures:
+        print(f"FALHA {line}", file=sys.stderr)
+    if failures:
+        raise SystemExit(1)
+    return results
+
+
+def _configure(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--max-ratio", type=float, default=2.5, help="razão máxima operação/construtor (padrão: 2.5)")
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_generic_alias", collect, configure=_configure))
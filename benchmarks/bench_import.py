@@ -0,0 +1,94 @@
+"""
+Tempo de import a frio do pacote `eithers`, medido com `python -X importtime`
+em processos novos (mediana de `--runs` execuções).
+
+Falha se:
+- `import eithers` passar de `--budget-ms`, carregar algum submódulo ou
+  imprimir algo;
+- `from eithers import Left, Right, try_catch` passar de `--api-budget-ms`;
+- importar qualquer variante imprimir algo.
+
+Uso:
+    python -m benchmarks.bench_import
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+from ._harness import Measurement, main
+from .bench_variants import VARIANTS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    "package": "import eithers",
+    "api": "from eithers import Left, Right, try_catch",
+}
+
+
+def _run(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True)
+
+
+def _import_us(stderr: str) -> int:
+    """Soma o tempo acumulado (us) das linhas de primeiro nível de `eithers` na saída do -X importtime."""
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        # Linhas aninhadas são indentadas e já contam no acumulado de quem as importou
+        if cumulative.strip().isdigit() and name[1:].startswith("eithers"):
+            total += int(cumulative)
+    return total
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    runs = 3 if args.quick else args.runs
+    results: list[Measurement] = []
+    failures: list[str] = []
+    budgets = {"package": args.budget_ms, "api": args.api_budget_ms}
+
+    for case, code in CASES.items():
+        samples = []
+        for _ in range(runs):
+            proc = _run(code)
+            if proc.returncode:
+                raise SystemExit(f"{code!r} falhou:\n{proc.stderr.splitlines()[-1]}")
+            if proc.stdout:
+                failures.append(f"{code!r} imprimiu {proc.stdout!r}")
+            samples.append(_import_us(proc.stderr) / 1000)
+        median = statistics.median(samples)
+        results.append(Measurement(f"{case}.import", median, "ms"))
+        if median > budgets[case]:
+            failures.append(f"{code!r} levou {median:.2f} ms (orçamento: {budgets[case]} ms)")
+
+    loaded = _run("import sys, eithers; print(sorted(m for m in sys.modules if m.startswith('eithers.')))").stdout.strip()
+    if loaded != "[]":
+        failures.append(f"import eithers carregou submódulos: {loaded}")
+
+    for variant in VARIANTS:
+        proc = subprocess.run([sys.executable, "-c", f"import eithers.{variant.module}"], cwd=ROOT, capture_output=True, text=True)
+        if proc.stdout:
+            failures.append(f"import eithers.{variant.module} imprimiu {proc.stdout[:60]!r}")
+
+    for line in failures:
+        print(f"FALHA {line}", file=sys.stderr)
+    if failures:
+        raise SystemExit(1)
+    return results
+
+
+def _configure(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--runs", type=int, default=10, help="processos por caso (padrão: 10)")
+    parser.add_argument("--budget-ms", type=float, default=3.0, help="orçamento de `import eithers` (padrão: 3 ms)")
+    parser.add_argument("--api-budget-ms", type=float, default=25.0, help="orçamento da API canônica, incluindo typing (padrão: 25 ms)")
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_import", collect, configure=_configure))
@@ -0,0 +1,63 @@
+"""
+Custo da instrumentação de estágios (eithers.instrument) em `map` e
+`flat_map` do either7 e do either9: função crua, estágio criado com a
+instrumentação desligada (deve custar o mesmo que a função crua) e
+estágio instrumentado. Também mede a geração dos snapshots exportados.
+
+Uso:
+    python -m benchmarks.bench_instrument
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Any, Callable
+
+from ._harness import Measurement, load_variant, main, ns_per_call
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers import instrument
+
+    number = 20_000 if args.quick else None
+    results: list[Measurement] = []
+    for variant in ("either7", "either9"):
+        module = load_variant(variant)
+        if module is None:
+            continue
+        right = module.Right
+        value = right(1)
+        flat_map: Callable[[Any, Any], Any] = (lambda e, f: e.flat_map(f)) if variant == "either7" else (lambda e, f: e.bind(f))
+
+        def inc(x: int) -> int:
+            return x + 1
+
+        def check(x: int) -> Any:
+            return right(x)
+
+        instrument.disable()
+        disabled = (instrument.stage("inc", inc), instrument.stage("check", check))
+        instrument.enable()
+        enabled = (instrument.stage("inc", inc, instrument.Registry()), instrument.stage("check", check, instrument.Registry()))
+        instrument.disable()
+
+        for mode, (m, b) in (("raw", (inc, check)), ("disabled", disabled), ("enabled", enabled)):
+            results.append(Measurement(f"{variant}.map.{mode}", ns_per_call(lambda: value.map(m), number=number), "ns/call"))
+            results.append(Measurement(f"{variant}.flat_map.{mode}", ns_per_call(lambda: flat_map(value, b), number=number), "ns/call"))
+
+    registry = instrument.Registry()
+    for i in range(20):
+        for _ in range(100):
+            registry.record(f"stage{i}", 1_000 * i, "left" if i % 3 == 0 else "right")
+    snapshot = registry.snapshot()
+    results.append(Measurement("snapshot.stages20", ns_per_call(registry.snapshot, number=200 if args.quick else None), "ns/call"))
+    results.append(Measurement("to_json.stages20", ns_per_call(lambda: instrument.to_json(snapshot), number=200 if args.quick else None), "ns/call"))
+    results.append(
+        Measurement("to_prometheus.stages20", ns_per_call(lambda: instrument.to_prometheus(snapshot), number=200 if args.quick else None), "ns/call")
+    )
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_instrument", collect))
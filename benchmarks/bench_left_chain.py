@@ -0,0 +1,57 @@
+"""
+Custo de propagar um Left por cadeias de map/bind/flat_map.
+
+Para cada comprimento de cadeia conta quantos objetos Left novos a cadeia
+cria (guardando todos os intermediários) e quanto tempo ela leva. Um Left
+que já falhou deveria atravessar a cadeia inteira sem alocar.
+
+Uso:
+    python -m benchmarks.bench_left_chain
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Any, Callable
+
+from ._harness import Measurement, load_variant, main, ns_per_call
+
+LENGTHS = (1, 5, 10, 20)
+CHAINS = {
+    "either6": ("map", "flat_map"),
+    "either7": ("map", "flat_map"),
+    "either8": ("map", "bind"),
+    "either9": ("map", "bind"),
+}
+
+
+def _steps(start: Any, method: str, length: int, f: Callable[[Any], Any]) -> list[Any]:
+    steps = [start]
+    for _ in range(length):
+        steps.append(getattr(steps[-1], method)(f))
+    return steps
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    number = 2_000 if args.quick else None
+    results: list[Measurement] = []
+    for name, methods in CHAINS.items():
+        mod = load_variant(name)
+        if mod is None:
+            continue
+        start = mod.Left(ValueError("erro"))
+        for method in methods:
+            f = mod.Right
+            for length in LENGTHS:
+                prefix = f"{name}.{method}.len{length}"
+                # Todos os intermediários ficam vivos, então ids distintos = objetos alocados.
+                steps = _steps(start, method, length, f)
+                allocated = len({id(step) for step in steps}) - 1
+                results.append(Measurement(f"{prefix}.allocations", allocated, "objects"))
+                results.append(Measurement(f"{prefix}.time", ns_per_call(lambda: _steps(start, method, length, f), number=number), "ns"))
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_left_chain", collect))
@@ -0,0 +1,47 @@
+"""
+Memória e alocações por instância de Left/Right em cada variante.
+
+Mede bytes retidos (tracemalloc), blocos alocados por instância, se a
+instância carrega `__dict__`, quantos objetos ela põe sob o GC e o custo de
+construção. Útil para comparar antes/depois de mudanças na representação.
+
+Uso:
+    python -m benchmarks.bench_memory --output memory.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+
+from ._harness import Measurement, allocations_per_call, bytes_per_instance, load_variant, main, ns_per_call
+from .bench_variants import VARIANTS
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    count = 2_000 if args.quick else 50_000
+    number = 2_000 if args.quick else None
+    error = ValueError("erro")
+    results: list[Measurement] = []
+    for variant in VARIANTS:
+        mod = load_variant(variant.module)
+        if mod is None:
+            continue
+        for side, factory in (("right", lambda mod=mod: mod.Right(1)), ("left", lambda mod=mod: mod.Left(error))):
+            prefix = f"{variant.module}.{side}"
+            sample = factory()
+            has_dict = type(sample).__dictoffset__ != 0
+            tracked = int(gc.is_tracked(sample)) + int(has_dict and gc.is_tracked(vars(sample)))
+            results += [
+                Measurement(f"{prefix}.bytes", bytes_per_instance(factory, count=count), "B"),
+                Measurement(f"{prefix}.blocks", allocations_per_call(factory, count=count), "blocks"),
+                Measurement(f"{prefix}.has_dict", int(has_dict), "bool"),
+                Measurement(f"{prefix}.gc_tracked", tracked, "objects"),
+                Measurement(f"{prefix}.construct", ns_per_call(factory, number=number), "ns"),
+            ]
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_memory", collect))
@@ -0,0 +1,102 @@
+"""
+Escala de `par_map`/`par_traverse` (eithers.parallel) com um passo que só
+gasta CPU (hash repetido de um bloco de bytes), de 1 processo até o número
+de CPUs, contra `Right.map` no processo atual. Mede o tempo total e o
+ganho (`speedup`) sobre a versão serial; com escala linear, o ganho com N
+processos fica perto de N. Também mede o efeito do tamanho do bloco com
+todos os processos.
+
+O pool de cada medição é criado e aquecido antes de o relógio começar.
+Com mais de uma CPU, falha se `par_map` com o maior número de processos
+não ganhar da versão serial. Com uma CPU só não há ganho possível: o pool
+só acrescenta o envio dos blocos (0,7 a 1x numa VM de uma CPU), e a
+verificação é pulada. A métrica `cpus` registra em que máquina os números
+foram tirados.
+
+Uso:
+    python -m benchmarks.bench_parallel [--count 20000] [--rounds 200] [--workers 1 2 4 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+from ._harness import Measurement, main
+
+
+def _work(seed: int, rounds: int) -> str:
+    digest = seed.to_bytes(8, "little") * 8
+    for _ in range(rounds):
+        digest = hashlib.sha256(digest).digest()
+    return digest.hex()
+
+
+def _check(seed: int, rounds: int) -> Any:
+    from eithers.either7 import Right
+
+    return Right(_work(seed, rounds))
+
+
+def _noop(_: int) -> None:
+    return None
+
+
+def _elapsed(run: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers.either7 import Left, Right
+    from eithers.parallel import DEFAULT_CHUNK_SIZE, par_map, par_traverse
+
+    # partial de funções do módulo: serializável, ao contrário de uma lambda
+    work = partial(_work, rounds=args.rounds)
+    check = partial(_check, rounds=args.rounds)
+    count: int = args.count // 10 if args.quick else args.count
+    cpus = os.cpu_count() or 1
+    workers: list[int] = args.workers or sorted({1, *(2**k for k in range(1, cpus.bit_length()) if 2**k <= cpus), cpus})
+    # Um Left a cada 10 itens, que par_map não envia aos processos
+    eithers = [Left(i) if i % 10 == 0 else Right(i) for i in range(count)]
+
+    serial = _elapsed(lambda: [either.map(work) for either in eithers])
+    results = [
+        Measurement("cpus", cpus, "count"),
+        Measurement("serial_map.time", serial, "s"),
+    ]
+    for n in workers:
+        with ProcessPoolExecutor(max_workers=n) as pool:
+            _ = list(pool.map(_noop, range(n)))
+            mapped = _elapsed(lambda: par_map(eithers, work, executor=pool, workers=n, chunk_size=args.chunk_size))
+            traversed = _elapsed(lambda: par_traverse(range(count), check, executor=pool, workers=n, chunk_size=args.chunk_size))
+        results.append(Measurement(f"par_map.w{n}.time", mapped, "s"))
+        results.append(Measurement(f"par_map.w{n}.speedup", serial / mapped, "x"))
+        results.append(Measurement(f"par_traverse.w{n}.time", traversed, "s"))
+        if cpus > 1 and n == max(workers) > 1:
+            assert serial / mapped > 1, f"par_map com {n} processos não ganhou da versão serial ({serial / mapped:.2f}x)"
+
+    with ProcessPoolExecutor(max_workers=max(workers)) as pool:
+        _ = list(pool.map(_noop, range(max(workers))))
+        for chunk_size in (1, 16, DEFAULT_CHUNK_SIZE, 4096):
+            elapsed = _elapsed(lambda: par_map(eithers, work, executor=pool, workers=max(workers), chunk_size=chunk_size))
+            results.append(Measurement(f"par_map.chunk{chunk_size}.time", elapsed, "s"))
+    return results
+
+
+def _configure(parser: argparse.ArgumentParser) -> None:
+    _ = parser.add_argument("--count", type=int, default=20_000, help="itens por medição")
+    _ = parser.add_argument("--rounds", type=int, default=200, help="hashes por item (custo de CPU de cada passo)")
+    _ = parser.add_argument("--workers", type=int, nargs="+", help="números de processos (padrão: potências de 2 até o número de CPUs)")
+    _ = parser.add_argument("--chunk-size", type=int, default=256, help="itens por bloco nas medições de escala")
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_parallel", collect, configure=_configure))
@@ -0,0 +1,61 @@
+"""
+Pipeline preguiçoso (maps fundidos, uma passada) contra o encadeamento
+eager de map/bind do either9, para cadeias de 1, 5 e 20 estágios.
+
+Uso:
+    python -m benchmarks.bench_pipeline
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Any, Callable
+
+from ._harness import Measurement, main, ns_per_call
+
+LENGTHS = (1, 5, 20)
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers.either9 import Right
+    from eithers.pipeline import Pipeline
+
+    number = 2_000 if args.quick else None
+
+    def inc(x: int) -> int:
+        return x + 1
+
+    def inc_either(x: int) -> Any:
+        return Right(x + 1)
+
+    start = Right(0)
+    results: list[Measurement] = []
+    for kind in ("map", "bind", "mixed"):
+        for length in LENGTHS:
+            methods = [kind] * length if kind != "mixed" else ["bind" if i % 5 == 4 else "map" for i in range(length)]
+            pipeline: Pipeline[Any, Any, Any] = Pipeline()
+            for method in methods:
+                pipeline = pipeline.map(inc) if method == "map" else pipeline.bind(inc_either)
+
+            def eager(methods: list[str] = methods) -> Any:
+                e: Any = start
+                for method in methods:
+                    e = e.map(inc) if method == "map" else e.bind(inc_either)
+                return e
+
+            lazy: Callable[[], Any] = lambda pipeline=pipeline: pipeline(start)  # noqa: E731
+            assert eager().value == lazy().value == length
+            slow = ns_per_call(eager, number=number)
+            fast = ns_per_call(lazy, number=number)
+            prefix = f"{kind}.len{length}"
+            results += [
+                Measurement(f"{prefix}.eager", slow, "ns"),
+                Measurement(f"{prefix}.pipeline", fast, "ns"),
+                Measurement(f"{prefix}.relative", fast / slow, "x"),
+            ]
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_pipeline", collect))
@@ -0,0 +1,105 @@
+"""
+Custo do modo de proveniência (eithers.provenance) numa cadeia de 15 binds
+do either9, eager e com Pipeline: sem proveniência, com os estágios
+marcados por `traced` mas desligada, ligada e ligada com call sites. O
+caminho de sucesso do Pipeline não deve mudar. Desligada, `traced` devolve
+a própria função e o eager marcado custa o mesmo que o sem marca; ligada,
+o eager paga a chamada do invólucro por passo, e o caminho de falha paga
+um TracedLeft e um Origin.
+
+As medições são repetidas em `--rounds` rodadas, com os modos intercalados
+e em ordem rotativa, para o ruído de fundo (frequência da CPU, outros
+processos) cair igualmente em todos. Cada métrica é a mediana das rodadas,
+com a amplitude relativa (`.spread`); o overhead por passo é a mediana das
+diferenças dentro de cada rodada, com a amplitude dessas diferenças
+(`.range`). Um overhead menor que o próprio `.range` é ruído.
+
+Uso:
+    python -m benchmarks.bench_provenance [--rounds 9]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+from typing import Any, Callable
+
+from ._harness import Measurement, main, ns_per_call
+
+STEPS = 15
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers import provenance
+    from eithers.either9 import Left, Right
+    from eithers.pipeline import Pipeline
+
+    rounds: int = 3 if args.quick else args.rounds
+    number = 1_000 if args.quick else 5_000
+
+    def step(x: int) -> Any:
+        return Right(x + 1) if x >= 0 else Left("negativo")
+
+    plain = [step] * STEPS
+    pipeline: Pipeline[Any, Any, Any] = Pipeline()
+    for func in plain:
+        pipeline = pipeline.bind(func)
+
+    def eager(binds: list[Callable[[Any], Any]], start: Any) -> Callable[[], Any]:
+        def run() -> Any:
+            e = start
+            for func in binds:
+                e = e.bind(func)
+            return e
+
+        return run
+
+    ok, failing = Right(0), Right(-1)
+    # (modo, como ligar, se o caminho eager marca os estágios com `traced`)
+    modes: list[tuple[str, Callable[[], None], bool]] = [
+        ("disabled", provenance.disable, False),
+        ("traced_disabled", provenance.disable, True),
+        ("enabled", provenance.enable, True),
+        ("call_sites", lambda: provenance.enable(call_sites=True), True),
+    ]
+    samples: dict[str, list[float]] = {}
+    try:
+        for round_ in range(rounds):
+            shift = round_ % len(modes)
+            for mode, switch, marked in modes[shift:] + modes[:shift]:
+                switch()
+                # `traced` decide na hora de marcar, então marca depois de ligar
+                binds = [provenance.traced(func, index) for index, func in enumerate(plain)] if marked else plain
+                if marked and not provenance.is_enabled():
+                    assert binds == plain, "desligada, traced deveria devolver a própria função"
+                cases: tuple[tuple[str, Callable[[], Any]], ...] = (
+                    ("eager.success", eager(binds, ok)),
+                    ("eager.failure", eager(binds, failing)),
+                    ("pipeline.success", lambda: pipeline(ok)),
+                    ("pipeline.failure", lambda: pipeline(failing)),
+                )
+                for case, run in cases:
+                    samples.setdefault(f"{case}.{mode}", []).append(ns_per_call(run, number=number, repeat=3))
+    finally:
+        provenance.disable()
+
+    results: list[Measurement] = []
+    for name, values in samples.items():
+        median = statistics.median(values)
+        results.append(Measurement(name, median, "ns/chain"))
+        results.append(Measurement(f"{name}.spread", (max(values) - min(values)) / median, "ratio"))
+    for kind in ("eager", "pipeline"):
+        # Diferenças pareadas dentro de cada rodada
+        diffs = [on - off for on, off in zip(samples[f"{kind}.success.enabled"], samples[f"{kind}.success.disabled"])]
+        results.append(Measurement(f"{kind}.success.overhead_per_step", statistics.median(diffs) / STEPS, "ns/step"))
+        results.append(Measurement(f"{kind}.success.overhead_per_step.range", (max(diffs) - min(diffs)) / STEPS, "ns/step"))
+    return results
+
+
+def _configure(parser: argparse.ArgumentParser) -> None:
+    _ = parser.add_argument("--rounds", type=int, default=9, help="rodadas intercaladas de medição")
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_provenance", collect, configure=_configure))
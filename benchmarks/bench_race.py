@@ -0,0 +1,141 @@
+"""
+Latência de cauda de uma consulta a réplicas (eithers.race). O serviço
+local simulado responde em `--fast-ms` (com ±50% de variação) e, com
+probabilidade `--slow-prob`, em `--slow-ms`; uma fração `--fail-prob` das
+respostas é Left. Compara uma réplica só, `race` entre `--replicas`
+réplicas e `hedge` com `--hedge-ms` de espera, nas versões com threads e
+async. Mede p50, p99, máximo, taxa de Left e a carga (chamadas ao serviço
+por consulta), que é o custo do hedge.
+
+Uso:
+    python -m benchmarks.bench_race [--requests 400] [--replicas 3] [--hedge-ms 10] [--slow-ms 80] [--slow-prob 0.05]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from ._harness import Measurement, main
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[int(fraction * (len(ordered) - 1))]
+
+
+class _Service:
+    """Réplica simulada: latência sorteada por chamada, com contador de chamadas."""
+
+    __slots__ = ("args", "rng", "calls", "lock")
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def draw(self) -> tuple[float, bool]:
+        args = self.args
+        with self.lock:
+            self.calls += 1
+            slow = self.rng.random() < args.slow_prob
+            jitter = self.rng.uniform(0.5, 1.5)
+            failed = self.rng.random() < args.fail_prob
+        delay = args.slow_ms if slow else args.fast_ms * jitter
+        return delay / 1000, failed
+
+    def lookup(self, key: int) -> Any:
+        from eithers.either7 import Left, Right
+
+        delay, failed = self.draw()
+        time.sleep(delay)
+        return Left(f"réplica falhou para {key}") if failed else Right(key)
+
+    async def alookup(self, key: int) -> Any:
+        from eithers.either7 import Left, Right
+
+        delay, failed = self.draw()
+        await asyncio.sleep(delay)
+        return Left(f"réplica falhou para {key}") if failed else Right(key)
+
+
+def _summary(name: str, latencies: list[float], lefts: int, calls: int) -> list[Measurement]:
+    count = len(latencies)
+    return [
+        Measurement(f"{name}.p50", _percentile(latencies, 0.5) * 1e3, "ms"),
+        Measurement(f"{name}.p99", _percentile(latencies, 0.99) * 1e3, "ms"),
+        Measurement(f"{name}.max", max(latencies) * 1e3, "ms"),
+        Measurement(f"{name}.left_rate", lefts / count, "ratio"),
+        Measurement(f"{name}.load", calls / count, "calls/request"),
+    ]
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers.either7 import Either
+    from eithers.race import ahedge, arace, hedge, race
+
+    requests: int = args.requests // 4 if args.quick else args.requests
+    replicas: int = args.replicas
+    delay: float = args.hedge_ms / 1000
+    results: list[Measurement] = []
+
+    # Threads sobrando: réplicas perdedoras continuam dormindo depois da resposta
+    with ThreadPoolExecutor(max_workers=4 * replicas) as pool:
+        modes: dict[str, Callable[[_Service, int], Either[Any, int]]] = {
+            "sync_single": lambda service, key: service.lookup(key),
+            "sync_race": lambda service, key: race([lambda: service.lookup(key)] * replicas, executor=pool),
+            "sync_hedge": lambda service, key: hedge([lambda: service.lookup(key)] * replicas, delay, executor=pool),
+        }
+        for name, run in modes.items():
+            service = _Service(args)
+            latencies: list[float] = []
+            lefts = 0
+            for key in range(requests):
+                start = time.perf_counter()
+                result = run(service, key)
+                latencies.append(time.perf_counter() - start)
+                lefts += result.is_left()
+            results += _summary(name, latencies, lefts, service.calls)
+
+    async def async_mode(name: str) -> list[Measurement]:
+        service = _Service(args)
+        latencies: list[float] = []
+        lefts = 0
+        for key in range(requests):
+            sources = [lambda key=key: service.alookup(key)] * replicas
+            start = time.perf_counter()
+            if name == "async_single":
+                result = await service.alookup(key)
+            elif name == "async_race":
+                result = await arace(sources)
+            else:
+                result = await ahedge(sources, delay)
+            latencies.append(time.perf_counter() - start)
+            lefts += result.is_left()
+        return _summary(name, latencies, lefts, service.calls)
+
+    for name in ("async_single", "async_race", "async_hedge"):
+        results += asyncio.run(async_mode(name))
+    return results
+
+
+def _configure(parser: argparse.ArgumentParser) -> None:
+    _ = parser.add_argument("--requests", type=int, default=400, help="consultas por modo")
+    _ = parser.add_argument("--replicas", type=int, default=3, help="réplicas consultadas por race/hedge")
+    _ = parser.add_argument("--hedge-ms", type=float, default=10.0, help="espera antes de acionar a próxima réplica no hedge")
+    _ = parser.add_argument("--fast-ms", type=float, default=4.0, help="latência típica de uma réplica")
+    _ = parser.add_argument("--slow-ms", type=float, default=80.0, help="latência de uma réplica lenta")
+    _ = parser.add_argument("--slow-prob", type=float, default=0.05, help="probabilidade de uma chamada ser lenta")
+    _ = parser.add_argument("--fail-prob", type=float, default=0.02, help="probabilidade de uma chamada devolver Left")
+    _ = parser.add_argument("--seed", type=int, default=1, help="semente das latências simuladas")
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_race", collect, configure=_configure))
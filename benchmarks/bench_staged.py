@@ -0,0 +1,102 @@
+"""
+Vazão de uma cadeia ler → parsear → enriquecer → gravar: `bind` sequencial
+do either9 contra `StagedExecutor` (eithers.staged) com paralelismo por
+estágio. Os estágios de I/O são simulados com `time.sleep`, que libera o
+GIL como uma leitura de rede ou disco; o parse gasta CPU. Um item a cada
+20 vira Left no parse e pula os estágios seguintes. Também registra a
+ocupação e a capacidade de cada estágio e o gargalo apontado pelas métricas.
+
+Uso:
+    python -m benchmarks.bench_staged [--count 2000] [--read-ms 2] [--enrich-ms 1] [--write-ms 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Any, Callable
+
+from ._harness import Measurement, main
+
+
+def _elapsed(run: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers.either9 import Left, Right
+    from eithers.staged import Stage, StagedExecutor
+
+    count: int = args.count // 10 if args.quick else args.count
+    read_s: float = args.read_ms / 1000
+    enrich_s: float = args.enrich_ms / 1000
+    write_s: float = args.write_ms / 1000
+
+    def read(x: int) -> Any:
+        time.sleep(read_s)
+        return Right(x)
+
+    def parse(x: int) -> Any:
+        if x % 20 == 0:
+            return Left(f"registro {x} inválido")
+        return Right(sum(range(200)) + x)
+
+    def enrich(x: int) -> Any:
+        time.sleep(enrich_s)
+        return Right(x * 2)
+
+    def write(x: int) -> Any:
+        time.sleep(write_s)
+        return Right(x)
+
+    items = [Right(i) for i in range(count)]
+
+    def sequential() -> list[Any]:
+        return [either.bind(read).bind(parse).bind(enrich).bind(write) for either in items]
+
+    results: list[Measurement] = []
+    serial = _elapsed(sequential)
+    results.append(Measurement("sequential_bind.throughput", count / serial, "items/s"))
+
+    configurations = {
+        # Uma thread por estágio: só a sobreposição entre estágios
+        "staged_1x": (1, 1, 1, 1),
+        # Threads proporcionais ao custo de cada estágio
+        "staged_balanced": (2 * args.read_ms or 1, 1, 2 * args.enrich_ms or 1, 2 * args.write_ms or 1),
+    }
+    expected = sequential() if args.quick else None
+    for name, (read_w, parse_w, enrich_w, write_w) in configurations.items():
+        executor: StagedExecutor[str, int, int] = StagedExecutor(
+            Stage("read", read, read_w),
+            Stage("parse", parse, parse_w),
+            Stage("enrich", enrich, enrich_w),
+            Stage("write", write, write_w),
+            queue_size=args.queue_size,
+        )
+        output: list[Any] = []
+        elapsed = _elapsed(lambda: output.extend(executor.run(items)))
+        if expected is not None:
+            assert [(type(e), e.value) for e in output] == [(type(e), e.value) for e in expected], name
+        results.append(Measurement(f"{name}.throughput", count / elapsed, "items/s"))
+        results.append(Measurement(f"{name}.speedup", serial / elapsed, "x"))
+        for stage, metrics in executor.metrics().items():
+            results.append(Measurement(f"{name}.{stage}.utilization", metrics["utilization"], "ratio"))
+            results.append(Measurement(f"{name}.{stage}.capacity", metrics["capacity"], "items/s"))
+            results.append(Measurement(f"{name}.{stage}.max_queue_depth", metrics["max_queue_depth"], "items"))
+        print(f"{name}: gargalo = {executor.bottleneck()}", file=sys.stderr)
+    return results
+
+
+def _configure(parser: argparse.ArgumentParser) -> None:
+    _ = parser.add_argument("--count", type=int, default=2_000, help="itens processados")
+    _ = parser.add_argument("--read-ms", type=int, default=2, help="latência simulada da leitura")
+    _ = parser.add_argument("--enrich-ms", type=int, default=1, help="latência simulada do enriquecimento")
+    _ = parser.add_argument("--write-ms", type=int, default=3, help="latência simulada da gravação")
+    _ = parser.add_argument("--queue-size", type=int, default=64, help="vagas de cada fila entre estágios")
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_staged", collect, configure=_configure))
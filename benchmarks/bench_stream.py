@@ -0,0 +1,77 @@
+"""
+Pico de memória de um pipeline EitherStream em função do tamanho da entrada.
+
+A entrada é gerada linha a linha (sem lista), passa por map/bind/filter_right
+e termina em `partition` com callbacks que só contam. O pico medido pelo
+tracemalloc deve ficar constante; para comparação, mede também o mesmo
+fluxo materializando a lista de Either.
+
+Uso:
+    python -m benchmarks.bench_stream
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator
+
+from ._harness import Measurement, main
+
+
+def _lines(size: int) -> Iterator[str]:
+    for i in range(size):
+        yield "erro\n" if i % 10 == 0 else f"{i}\n"
+
+
+def _peak(run: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _elapsed(run: Callable[[], object]) -> float:
+    # Medido fora do tracemalloc, que deixa cada alocação bem mais lenta
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers.either7 import Either, Left, Right
+    from eithers.stream import EitherStream
+
+    def parse(line: str) -> Either[str, int]:
+        return Right(int(line)) if line.isdigit() else Left(line)
+
+    counts = [0, 0]
+
+    def on_left(_: Any) -> None:
+        counts[0] += 1
+
+    def on_right(_: Any) -> None:
+        counts[1] += 1
+
+    def streamed(size: int) -> object:
+        return EitherStream.of_values(_lines(size)).map(str.strip).bind(parse).filter_right(lambda v: v % 2 == 0).partition(on_left, on_right)
+
+    def materialized(size: int) -> object:
+        eithers = [parse(line.strip()) for line in _lines(size)]
+        return [e for e in eithers if e.is_right()], [e for e in eithers if not e.is_right()]
+
+    sizes = (10_000, 100_000) if args.quick else (10_000, 100_000, 1_000_000)
+    results: list[Measurement] = []
+    for size in sizes:
+        for name, run in (("stream", streamed), ("list", materialized)):
+            results.append(Measurement(f"{name}.n{size}.peak", _peak(lambda: run(size)), "B"))
+            results.append(Measurement(f"{name}.n{size}.time", _elapsed(lambda: run(size)) / size * 1e9, "ns/elem"))
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_stream", collect))
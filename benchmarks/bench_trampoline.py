@@ -0,0 +1,62 @@
+"""
+Recursão monádica profunda: `Trampoline` (eithers.trampoline) de 10³ a 10⁶
+passos, comparado com a recursão direta via `Right.bind` do either9, que só
+é medida enquanto cabe no limite de recursão do Python.
+
+Uso:
+    python -m benchmarks.bench_trampoline
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Any, Callable
+
+from ._harness import Measurement, main
+
+
+def _elapsed(run: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers.either9 import Right
+    from eithers.trampoline import Trampoline, done, suspend
+
+    def recursive(n: int) -> Any:
+        if n == 0:
+            return Right(0)
+        return Right(n).bind(lambda x: recursive(x - 1)).map(lambda x: x + 1)
+
+    def trampolined(n: int) -> Trampoline[Any, int]:
+        if n == 0:
+            return done(Right(0))
+        return suspend(lambda: trampolined(n - 1)).map(lambda x: x + 1)
+
+    def chained(n: int) -> Trampoline[Any, int]:
+        # Cadeia "para a esquerda": bind(...).bind(...) n vezes
+        t: Trampoline[Any, int] = done(Right(0))
+        for _ in range(n):
+            t = t.bind(lambda x: Right(x + 1))
+        return t
+
+    results: list[Measurement] = []
+    for depth in (100, 300):
+        assert recursive(depth).value == depth
+        results.append(Measurement(f"recursive_bind.depth{depth}", _elapsed(lambda: recursive(depth)) / depth * 1e9, "ns/step"))
+
+    depths = (1_000, 10_000, 100_000) if args.quick else (1_000, 10_000, 100_000, 1_000_000)
+    for depth in depths:
+        assert trampolined(depth).run() == Right(depth)
+        results.append(Measurement(f"trampoline.recursion.depth{depth}", _elapsed(lambda: trampolined(depth).run()) / depth * 1e9, "ns/step"))
+        chain = chained(depth)
+        results.append(Measurement(f"trampoline.chain.depth{depth}", _elapsed(chain.run) / depth * 1e9, "ns/step"))
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_trampoline", collect))
@@ -0,0 +1,62 @@
+"""
+Escala de `sequence`/`traverse` (eithers.traverse) até 10⁶ elementos,
+comparada com o `reduce` sobre `bind` com concatenação de listas que era
+usado antes (O(n²), medido só até 10⁴), e custo da parada antecipada
+quando o primeiro elemento de um gerador de 10⁶ itens é Left.
+
+Uso:
+    python -m benchmarks.bench_traverse
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from functools import reduce
+from typing import Any, Callable, Iterator
+
+from ._harness import Measurement, main
+
+
+def _elapsed(run: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers.either9 import Left, Right
+    from eithers.traverse import sequence, traverse
+
+    def check(x: int) -> Any:
+        return Right(x)
+
+    def naive(items: list[Any]) -> Any:
+        return reduce(lambda acc, e: acc.bind(lambda xs: e.map(lambda x: xs + [x])), items, Right([]))
+
+    sizes = (1_000, 10_000, 100_000) if args.quick else (1_000, 10_000, 100_000, 1_000_000)
+    results: list[Measurement] = []
+    for size in sizes:
+        items = [Right(i) for i in range(size)]
+        results.append(Measurement(f"sequence.n{size}", _elapsed(lambda: sequence(items)) / size * 1e9, "ns/elem"))
+        results.append(Measurement(f"traverse.n{size}", _elapsed(lambda: traverse(range(size), check)) / size * 1e9, "ns/elem"))
+        if size <= 10_000:
+            results.append(Measurement(f"reduce_bind.n{size}", _elapsed(lambda: naive(items)) / size * 1e9, "ns/elem"))
+
+    consumed = 0
+
+    def lazy(size: int) -> Iterator[Any]:
+        nonlocal consumed
+        for i in range(size):
+            consumed += 1
+            yield Left("erro") if i == 0 else Right(i)
+
+    elapsed = _elapsed(lambda: sequence(lazy(1_000_000)))
+    results.append(Measurement("sequence.early_exit.n1000000", elapsed * 1e9, "ns"))
+    results.append(Measurement("sequence.early_exit.consumed", consumed, "items"))
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_traverse", collect))
@@ -0,0 +1,82 @@
+"""
+Acúmulo de erros em um registro com n campos inválidos: a concatenação de
+listas dentro de `fold` (como é feito hoje, O(n²)) contra `traverse` e
+`Invalid.combine` de eithers.validated (O(n)). Mede o tempo por erro para
+cada tamanho; se o custo por erro fica constante quando n cresce, o
+acúmulo é linear. A versão com listas só roda até `--list-limit` erros.
+
+Uso:
+    python -m benchmarks.bench_validated [--sizes 1000 10000 100000] [--list-limit 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from functools import reduce
+from typing import Any, Callable
+
+from ._harness import Measurement, main, ns_per_call
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    from eithers.either7 import Either, Left, Right
+    from eithers.validated import Invalid, Valid, traverse
+
+    sizes: list[int] = [size // 10 for size in args.sizes] if args.quick else args.sizes
+    repeat = 1 if args.quick else 3
+
+    def check(field: int) -> Either[str, int]:
+        return Left(f"campo {field} inválido") if field >= 0 else Right(field)
+
+    def list_fold(n: int) -> Callable[[], Any]:
+        lefts = [check(field) for field in range(n)]
+
+        def concat(acc: Either[list[str], None], either: Either[str, int]) -> Either[list[str], None]:
+            # Cada erro copia a lista inteira acumulada até aqui
+            previous: list[str] = acc.fold(lambda errors: errors, lambda _: [])
+            return either.fold(lambda error: Left(previous + [error]), lambda _: acc)
+
+        return lambda: reduce(concat, lefts, Right(None)).fold(_errors, _no_errors)
+
+    def combine(n: int) -> Callable[[], Any]:
+        invalids = [Invalid[str, None].of(f"campo {field} inválido") for field in range(n)]
+
+        def run() -> Any:
+            acc: Valid[str, None] | Invalid[str, None] = Valid(None)
+            for invalid in invalids:
+                acc = acc.combine(invalid, lambda a, _: a)
+            return acc.to_either().fold(_errors, _no_errors)
+
+        return run
+
+    def traverse_case(n: int) -> Callable[[], Any]:
+        fields = range(n)
+        return lambda: traverse(fields, check).to_either().fold(_errors, _no_errors)
+
+    results: list[Measurement] = []
+    for n in sizes:
+        cases = {"traverse": traverse_case(n), "combine": combine(n)}
+        if n <= args.list_limit:
+            cases["list_fold"] = list_fold(n)
+        for name, make in cases.items():
+            assert len(make()) == n
+            results.append(Measurement(f"{name}.{n}", ns_per_call(make, number=1, repeat=repeat) / n, "ns/error"))
+    return results
+
+
+def _errors(errors: list[str]) -> list[str]:
+    return errors
+
+
+def _no_errors(_: object) -> list[str]:
+    return []
+
+
+def _configure(parser: argparse.ArgumentParser) -> None:
+    _ = parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="erros por registro")
+    _ = parser.add_argument("--list-limit", type=int, default=20_000, help="maior n para a concatenação de listas")
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_validated", collect, configure=_configure))
@@ -0,0 +1,110 @@
+"""
+Compara o custo das implementações de Either em `eithers/`.
+
+Para cada variante mede construção de Left/Right, cadeias longas de
+map/bind/flat_map, get_or_else, fold (onde existe) e memória por instância.
+
+Uso:
+    python -m benchmarks.bench_variants --output variants.json
+    python -m benchmarks.bench_variants --baseline variants.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Callable
+
+from ._harness import Measurement, bytes_per_instance, load_variant, main, ns_per_call
+
+CHAIN_LENGTH = 20
+
+
+@dataclass(frozen=True)
+class Variant:
+    """Descreve o que cada módulo oferece além de Left/Right."""
+
+    module: str
+    chains: tuple[str, ...]
+    fold: bool = False
+
+
+VARIANTS = (
+    Variant("either", ("map", "bind")),
+    Variant("either2", ("map", "bind")),
+    Variant("either2_1", ("map", "bind")),
+    Variant("either3", ()),
+    Variant("either5", ("map", "bind")),
+    Variant("either6", ("map", "flat_map"), fold=True),
+    Variant("either7", ("map", "flat_map"), fold=True),
+    Variant("either8", ("map", "bind")),
+    Variant("either9", ("map", "bind")),
+    Variant("my_either", ("map", "bind")),
+)
+
+
+def _chain(start: Any, method: str, f: Callable[[Any], Any]) -> Callable[[], Any]:
+    def run() -> Any:
+        e = start
+        for _ in range(CHAIN_LENGTH):
+            e = getattr(e, method)(f)
+        return e
+
+    return run
+
+
+def _measure(variant: Variant, mod: ModuleType, args: argparse.Namespace) -> list[Measurement]:
+    repeat, number = (3, 1_000) if args.quick else (5, None)
+    left_cls, right_cls = mod.Left, mod.Right
+    error = ValueError("erro")
+    left, right = left_cls(error), right_cls(1)
+
+    def inc(x: int) -> int:
+        return x + 1
+
+    def inc_either(x: int) -> Any:
+        return right_cls(x + 1)
+
+    timings: dict[str, Callable[[], object]] = {
+        "construct_right": lambda: right_cls(1),
+        "construct_left": lambda: left_cls(error),
+    }
+    for method in variant.chains:
+        f = inc if method == "map" else inc_either
+        timings[f"{method}_chain{CHAIN_LENGTH}_right"] = _chain(right, method, f)
+        timings[f"{method}_chain{CHAIN_LENGTH}_left"] = _chain(left, method, f)
+    if hasattr(right, "get_or_else"):
+        timings["get_or_else_right"] = lambda: right.get_or_else(0)
+        timings["get_or_else_left"] = lambda: left.get_or_else(0)
+    if variant.fold:
+        timings["fold_right"] = lambda: right.fold(str, inc)
+        timings["fold_left"] = lambda: left.fold(str, inc)
+
+    results = [Measurement(f"{variant.module}.{key}", ns_per_call(stmt, number=number, repeat=repeat), "ns") for key, stmt in timings.items()]
+    count = 2_000 if args.quick else 20_000
+    results.append(Measurement(f"{variant.module}.bytes_right", bytes_per_instance(lambda: right_cls(1), count=count), "B"))
+    results.append(Measurement(f"{variant.module}.bytes_left", bytes_per_instance(lambda: left_cls(error), count=count), "B"))
+    return results
+
+
+def collect(args: argparse.Namespace) -> list[Measurement]:
+    selected = set(args.variant or [v.module for v in VARIANTS])
+    results: list[Measurement] = []
+    for variant in VARIANTS:
+        if variant.module not in selected:
+            continue
+        mod = load_variant(variant.module)
+        if mod is None:
+            continue
+        results.extend(_measure(variant, mod, args))
+    return results
+
+
+def _configure(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--variant", action="append", help="mede apenas esta variante (pode repetir)")
+
+
+if __name__ == "__main__":
+    sys.exit(main("bench_variants", collect, configure=_configure))
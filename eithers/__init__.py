@@ -0,0 +1,151 @@
+"""
+Implementações de Either.
+
+A API canônica é a de `either7` (Either, Left, Right, of_left, of_right,
+try_catch) mais os utilitários construídos sobre ela. Nada é importado junto
+com o pacote: cada nome é carregado do seu módulo no primeiro acesso, e as
+variantes (`eithers.either9`, `eithers.my_either`, ...) só quando usadas.
+
+    from eithers import Left, Right, try_catch
+
+As variantes até o `either5` ficam como estão: têm `__slots__`, mas
+continuam mutáveis e com igualdade por identidade. Left e Right imutáveis,
+com igualdade, hash e pickle por valor, existem do `either6` em diante.
+
+Os demais módulos (pipeline, trampoline, traverse, codec, instrument,
+provenance, do, parallel, staged, deadline e race) só são acessíveis como
+submódulos: a maioria trabalha com o either9, não com a API canônica, e
+nomes como `traverse`, `do` ou `race` ficariam ambíguos na raiz do pacote.
+
+    from eithers.pipeline import Pipeline
+    from eithers.race import hedge
+"""
+
+import sys
+
+# Nome público -> módulo que o define
+_EXPORTS = {
+    "Either": "either7",
+    "Left": "either7",
+    "Right": "either7",
+    "of_left": "either7",
+    "of_right": "either7",
+    "try_catch": "either7",
+    "EitherArray": "either_array",
+    "AsyncEither": "async_either",
+    "gather": "async_either",
+    "gather_all": "async_either",
+    "try_catch_many": "threaded",
+    "try_catch_stream": "threaded",
+    "EitherStream": "stream",
+    "EitherCache": "cache",
+    "cached_either": "cache",
+    "map_cached": "cache",
+    "bind_cached": "cache",
+    "ErrorRecord": "capture",
+    "try_catch_record": "capture",
+    "ErrorCode": "codes",
+    "Valid": "validated",
+    "Invalid": "validated",
+}
+
+# Submódulos acessíveis como atributo (`eithers.either9`) sem import explícito
+_SUBMODULES = frozenset(
+    {
+        "either",
+        "either2",
+        "either2_1",
+        "either3",
+        "either4",
+        "either5",
+        "either6",
+        "either7",
+        "either8",
+        "either9",
+        "my_either",
+        "either_array",
+        "pipeline",
+        "async_either",
+        "threaded",
+        "stream",
+        "traverse",
+        "trampoline",
+        "cache",
+        "codec",
+        "capture",
+        "codes",
+        "instrument",
+        "provenance",
+        "validated",
+        "do",
+        "parallel",
+        "staged",
+        "deadline",
+        "race",
+    }
+)
+
+# Mesmos nomes de _EXPORTS, por extenso para o verificador de tipos
+__all__ = [
+    "AsyncEither",
+    "Either",
+    "EitherArray",
+    "EitherCache",
+    "EitherStream",
+    "ErrorCode",
+    "ErrorRecord",
+    "Invalid",
+    "Left",
+    "Right",
+    "Valid",
+    "bind_cached",
+    "cached_either",
+    "gather",
+    "gather_all",
+    "map_cached",
+    "of_left",
+    "of_right",
+    "try_catch",
+    "try_catch_many",
+    "try_catch_record",
+    "try_catch_stream",
+]
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from .async_either import AsyncEither, gather, gather_all
+    from .cache import EitherCache, bind_cached, cached_either, map_cached
+    from .capture import ErrorRecord, try_catch_record
+    from .codes import ErrorCode
+    from .either7 import Either, Left, Right, of_left, of_right, try_catch
+    from .either_array import EitherArray
+    from .stream import EitherStream
+    from .threaded import try_catch_many, try_catch_stream
+    from .validated import Invalid, Valid
+
+
+# Anotação entre aspas: `types` não é importado em tempo de execução, e
+# `from __future__ import annotations` custaria o import de `__future__`
+def _import(module: str) -> "ModuleType":
+    name = f"{__name__}.{module}"
+    __import__(name)
+    return sys.modules[name]
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is not None:
+        value: object = getattr(_import(module), name)  # pyright: ignore[reportAny]
+    elif name in _SUBMODULES:
+        value = _import(name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Guarda no módulo para que os próximos acessos não passem por aqui
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
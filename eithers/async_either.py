@@ -0,0 +1,190 @@
+from __future__ import annotations
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Generator, Generic, Iterable, TypeAlias, TypeVar, cast
+
+from .either7 import Either, Left, Right
+
+# Define tipos genéricos para Left, Right e transformações
+L = TypeVar("L")  # Tipo do erro
+R = TypeVar("R")  # Tipo do sucesso
+T = TypeVar("T")  # Tipo para transformações
+U = TypeVar("U")  # Tipo adicional para transformações do Left
+
+# Funções aceitas pelos combinadores: síncronas ou async
+MaybeAwaitable: TypeAlias = "T | Awaitable[T]"
+
+
+async def _resolve(value: MaybeAwaitable[T]) -> T:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class AsyncEither(Generic[L, R]):
+    """
+    Either cujo resultado ainda vai ser calculado.
+
+    Envolve um awaitable de `Either[L, R]` (either7). `map`, `map_left`,
+    `bind` e `flat_map` aceitam funções síncronas ou async e devolvem um novo
+    AsyncEither; `await` produz o Either final. Cada estágio aguarda o
+    anterior diretamente, sem criar tasks, e guarda o Either resolvido, então
+    o mesmo AsyncEither pode ser aguardado de novo ou ramificado (`a.map(f)` e
+    `a.map(g)`) sem recalcular a origem. Um Future só é criado quando um
+    segundo consumidor chega enquanto a origem ainda está sendo aguardada.
+    Depois que a cadeia vira Left, nenhuma das funções seguintes é chamada
+    nem agendada.
+
+        user = await AsyncEither.of(fetch_user(1)).bind(fetch_profile).map(render)
+    """
+
+    __slots__ = ("_source", "_result", "_error", "_waiter")
+
+    def __init__(self, source: Awaitable[Either[L, R]]) -> None:
+        # Origem ainda não aguardada; None depois que o primeiro consumidor começa
+        self._source: Awaitable[Either[L, R]] | None = source
+        self._result: Either[L, R] | None = None
+        self._error: BaseException | None = None
+        # Criado só se outro consumidor chegar com a origem em andamento
+        self._waiter: asyncio.Future[Either[L, R]] | None = None
+
+    async def _get(self) -> Either[L, R]:
+        """O Either da origem, aguardada uma única vez."""
+        if self._result is not None:
+            return self._result
+        if self._error is not None:
+            raise self._error
+        source = self._source
+        if source is None:
+            waiter = self._waiter
+            if waiter is None:
+                waiter = self._waiter = asyncio.get_running_loop().create_future()
+            # shield: cancelar este consumidor não cancela o resultado dos outros
+            return await asyncio.shield(waiter)
+        self._source = None
+        try:
+            result = await source
+        except BaseException as e:
+            self._error = e
+            waiter = self._waiter
+            if waiter is not None and not waiter.done():
+                if isinstance(e, asyncio.CancelledError):
+                    _ = waiter.cancel()
+                else:
+                    waiter.set_exception(e)
+            raise
+        self._result = result
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(result)
+        return result
+
+    @staticmethod
+    def of(value: Either[L, R] | Awaitable[Either[L, R]]) -> AsyncEither[L, R]:
+        """Cria um AsyncEither a partir de um Either pronto ou de um awaitable de Either."""
+        if isinstance(value, Either):
+            return _ready(value)
+        return AsyncEither(value)
+
+    @staticmethod
+    def right(value: R) -> AsyncEither[Any, R]:
+        return _ready(Right(value))
+
+    @staticmethod
+    def left(error: L) -> AsyncEither[L, Any]:
+        return _ready(Left(error))
+
+    def __await__(self) -> Generator[Any, None, Either[L, R]]:
+        return self._get().__await__()
+
+    def map(self, f: Callable[[R], MaybeAwaitable[T]]) -> AsyncEither[L, T]:
+        """Aplica `f` ao valor se for Right; um Left segue adiante sem chamar `f`."""
+        if self._result is not None and not self._result.is_right():
+            # Left já resolvido: nada a agendar
+            return cast("AsyncEither[L, T]", self)
+
+        async def run() -> Either[L, T]:
+            either = await self._get()
+            if not either.is_right():
+                return cast("Either[L, T]", either)
+            return Right(await _resolve(f(cast("Right[L, R]", either).value)))
+
+        return AsyncEither(run())
+
+    def map_left(self, f: Callable[[L], MaybeAwaitable[U]]) -> AsyncEither[U, R]:
+        """Aplica `f` ao erro se for Left; um Right segue adiante sem chamar `f`."""
+        if self._result is not None and self._result.is_right():
+            return cast("AsyncEither[U, R]", self)
+
+        async def run() -> Either[U, R]:
+            either = await self._get()
+            if either.is_right():
+                return cast("Either[U, R]", either)
+            return Left(await _resolve(f(cast("Left[L, R]", either).value)))
+
+        return AsyncEither(run())
+
+    def flat_map(self, f: Callable[[R], MaybeAwaitable[Either[L, T]]]) -> AsyncEither[L, T]:
+        """Aplica uma função que retorna Either (ou awaitable de Either) ao valor se for Right."""
+        if self._result is not None and not self._result.is_right():
+            return cast("AsyncEither[L, T]", self)
+
+        async def run() -> Either[L, T]:
+            either = await self._get()
+            if not either.is_right():
+                return cast("Either[L, T]", either)
+            return await _resolve(f(cast("Right[L, R]", either).value))
+
+        return AsyncEither(run())
+
+    bind = flat_map
+
+    async def get_or_else(self, default: R) -> R:
+        return (await self._get()).get_or_else(default)
+
+    async def fold(self, left_f: Callable[[L], MaybeAwaitable[T]], right_f: Callable[[R], MaybeAwaitable[T]]) -> T:
+        either = await self._get()
+        if either.is_right():
+            return await _resolve(right_f(cast("Right[L, R]", either).value))
+        return await _resolve(left_f(cast("Left[L, R]", either).value))
+
+
+def _ready(either: Either[L, R]) -> AsyncEither[L, R]:
+    """AsyncEither já resolvido, sem corrotina nenhuma por trás."""
+    ready = cast("AsyncEither[L, R]", object.__new__(AsyncEither))
+    ready._source = None  # pyright: ignore[reportPrivateUsage]
+    ready._result = either  # pyright: ignore[reportPrivateUsage]
+    ready._error = None  # pyright: ignore[reportPrivateUsage]
+    ready._waiter = None  # pyright: ignore[reportPrivateUsage]
+    return ready
+
+
+async def gather(*aws: Awaitable[Either[L, R]]) -> Either[L, list[R]]:
+    """
+    Executa os awaitables concorrentemente. Retorna Right com a lista de
+    valores (na ordem dos argumentos) se todos derem Right; no primeiro Left
+    que terminar, cancela os demais e o retorna.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        for done in asyncio.as_completed(tasks):
+            either = await done
+            if not either.is_right():
+                return cast("Either[L, list[R]]", either)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            _ = task.cancel()
+        if pending:
+            # Espera o cancelamento terminar, para nenhuma task ficar solta
+            _ = await asyncio.gather(*pending, return_exceptions=True)
+    return Right([cast("Right[L, R]", task.result()).value for task in tasks])
+
+
+async def gather_all(*aws: Awaitable[Either[L, R]]) -> list[Either[L, R]]:
+    """Executa os awaitables concorrentemente e devolve todos os resultados, na ordem dos argumentos."""
+    return list(await asyncio.gather(*aws))
+
+
+async def traverse(items: Iterable[T], f: Callable[[T], Awaitable[Either[L, R]]]) -> Either[L, list[R]]:
+    """Aplica `f` a cada item concorrentemente; equivale a `gather(*map(f, items))`."""
+    return await gather(*(f(item) for item in items))
@@ -0,0 +1,208 @@
+from __future__ import annotations
+import contextlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, NamedTuple, TypeVar, cast, override
+
+from .either7 import Either, Left, Right
+
+# Define tipos genéricos para Left, Right e transformações
+L = TypeVar("L")  # Tipo do erro
+R = TypeVar("R")  # Tipo do sucesso
+T = TypeVar("T")  # Tipo para transformações
+K = TypeVar("K", bound=Hashable)  # Tipo da chave do cache
+
+# Tamanho padrão dos caches criados sem `maxsize`
+DEFAULT_MAXSIZE = 1024
+
+
+class CacheStats(NamedTuple):
+    """Fotografia dos contadores de um EitherCache (`_asdict()` para exportar)."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    maxsize: int
+
+
+class EitherCache(Generic[K, L, R]):
+    """
+    Cache limitado de resultados Either, com despejo LRU e TTL opcional.
+
+    Guarda o próprio Either devolvido (Left e Right do either7 são imutáveis,
+    então a mesma instância pode ser entregue a vários chamadores). Com
+    `cache_lefts=False` só os Right ficam guardados e um Left é recalculado
+    na próxima chamada. Entradas com mais de `ttl` segundos são descartadas
+    na leitura.
+
+    Com `thread_safe=True` um lock protege o dicionário e os contadores; o
+    cálculo em si roda fora do lock, então duas threads que erram a mesma
+    chave ao mesmo tempo podem calcular o valor duas vezes.
+    """
+
+    __slots__ = (
+        "maxsize",
+        "ttl",
+        "cache_lefts",
+        "_clock",
+        "_lock",
+        "_entries",
+        "_hits",
+        "_misses",
+        "_evictions",
+        "_expirations",
+    )
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float | None = None,
+        *,
+        cache_lefts: bool = True,
+        thread_safe: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize deve ser pelo menos 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl deve ser positivo")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.cache_lefts = cache_lefts
+        self._clock = clock
+        self._lock: contextlib.AbstractContextManager[object] = threading.Lock() if thread_safe else contextlib.nullcontext()
+        # chave -> (resultado, instante de expiração ou None); a ordem é a de uso
+        self._entries: OrderedDict[K, tuple[Either[L, R], float | None]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Either[L, R] | None:
+        """Resultado guardado para `key`, ou None se não houver (ou tiver expirado)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                either, expires = entry
+                if expires is None or expires > self._clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return either
+                del self._entries[key]
+                self._expirations += 1
+            self._misses += 1
+            return None
+
+    def put(self, key: K, either: Either[L, R]) -> None:
+        """Guarda `either` para `key`, despejando as entradas menos usadas se passar de `maxsize`."""
+        if not self.cache_lefts and type(either) is Left:
+            return
+        expires = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            entries = self._entries
+            entries[key] = (either, expires)
+            entries.move_to_end(key)
+            while len(entries) > self.maxsize:
+                _ = entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_compute(self, key: K, compute: Callable[[], Either[L, R]]) -> Either[L, R]:
+        """Devolve o resultado guardado para `key` ou calcula, guarda e devolve `compute()`."""
+        either = self.get(key)
+        if either is None:
+            either = compute()
+            self.put(key, either)
+        return either
+
+    def clear(self) -> None:
+        """Descarta todas as entradas (os contadores continuam)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Contadores atuais de acertos, faltas, despejos por tamanho e expirações."""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, self._expirations, len(self._entries), self.maxsize)
+
+
+def map_cached(either: Either[L, R], f: Callable[[R], T], cache: EitherCache[tuple[object, type[R], R], L, T]) -> Either[L, T]:
+    """
+    `either.map(f)` que reaproveita o Right já calculado para o mesmo valor.
+
+    A chave é `(f, type(valor), valor)`, então um mesmo cache pode servir a
+    várias funções, e valores iguais de tipos diferentes (1, 1.0 e True) não
+    se confundem, como no `lru_cache(typed=True)`. Um Left é devolvido sem
+    consultar o cache.
+    """
+    if type(either) is not Right:
+        return cast("Left[L, T]", either)
+    value = cast("Right[L, R]", either).value
+    return cache.get_or_compute((f, type(value), value), lambda: Right(f(value)))
+
+
+def bind_cached(either: Either[L, R], f: Callable[[R], Either[L, T]], cache: EitherCache[tuple[object, type[R], R], L, T]) -> Either[L, T]:
+    """
+    `either.flat_map(f)` que reaproveita o resultado já calculado para o
+    mesmo valor, com a mesma chave de `map_cached`. Os Left devolvidos por
+    `f` só são guardados se o cache tiver `cache_lefts=True`.
+    """
+    if type(either) is not Right:
+        return cast("Left[L, T]", either)
+    value = cast("Right[L, R]", either).value
+    return cache.get_or_compute((f, type(value), value), lambda: f(value))
+
+
+class CachedFunction(Generic[K, L, R]):
+    """
+    Função de um argumento que retorna Either, com as chamadas passando por
+    `cache`. A chave é `(type(arg), arg)`, como em `map_cached`: 1, 1.0 e
+    True são chamadas diferentes.
+    """
+
+    __slots__ = ("func", "cache")
+
+    def __init__(self, func: Callable[[K], Either[L, R]], cache: EitherCache[tuple[type[K], K], L, R]) -> None:
+        self.func = func
+        self.cache = cache
+
+    def __call__(self, arg: K) -> Either[L, R]:
+        key = (type(arg), arg)
+        either = self.cache.get(key)
+        if either is None:
+            either = self.func(arg)
+            self.cache.put(key, either)
+        return either
+
+    @override
+    def __repr__(self) -> str:
+        return f"CachedFunction({self.func!r})"
+
+
+def cached_either(
+    maxsize: int = DEFAULT_MAXSIZE,
+    ttl: float | None = None,
+    *,
+    cache_lefts: bool = True,
+    thread_safe: bool = False,
+) -> Callable[[Callable[[K], Either[L, R]]], CachedFunction[K, L, R]]:
+    """
+    Decorador para funções de um argumento que retornam Either: cada função
+    decorada ganha um EitherCache próprio, acessível como `.cache`.
+
+        @cached_either(maxsize=10_000, ttl=60)
+        def find_user(user_id: int) -> Either[str, User]: ...
+
+        Right(42).flat_map(find_user)
+        find_user.cache.stats()
+    """
+
+    def decorate(f: Callable[[K], Either[L, R]]) -> CachedFunction[K, L, R]:
+        return CachedFunction(f, EitherCache(maxsize, ttl, cache_lefts=cache_lefts, thread_safe=thread_safe))
+
+    return decorate
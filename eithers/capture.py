@@ -0,0 +1,98 @@
+from __future__ import annotations
+import traceback
+from types import CodeType, TracebackType
+from typing import Callable, TypeVar, cast, override
+
+from .either7 import Either, Left, Right
+
+R = TypeVar("R")  # Tipo do sucesso
+
+
+class ErrorRecord:
+    """
+    Resumo compacto de uma exceção capturada: tipo, mensagem, argumentos e a
+    pilha reduzida a pares (código, linha).
+
+    Não guarda o traceback, então os frames e suas variáveis locais são
+    liberados na hora. As linhas de código só são lidas quando a pilha é
+    pedida (`stack`, `format`), e `to_exception` recria a exceção com a
+    pilha original como nota.
+    """
+
+    __slots__ = ("exc_type", "message", "args", "_frames")
+
+    def __init__(self, exc_type: type[BaseException], message: str, args: tuple[object, ...], frames: tuple[CodeType | int, ...] = ()) -> None:
+        self.exc_type = exc_type
+        self.message = message
+        self.args = args
+        # Código e linha de cada frame, alternados em uma tupla só
+        self._frames = frames
+
+    @classmethod
+    def from_exception(cls, exc: BaseException) -> ErrorRecord:
+        """Resume `exc` sem alterá-la."""
+        return cls(type(exc), str(exc), exc.args, _summarize(exc.__traceback__))
+
+    @property
+    def stack(self) -> traceback.StackSummary:
+        """Pilha no formato de `traceback`, montada a cada acesso."""
+        codes = cast("tuple[CodeType, ...]", self._frames[::2])
+        linenos = cast("tuple[int, ...]", self._frames[1::2])
+        return traceback.StackSummary.from_list(
+            [traceback.FrameSummary(code.co_filename, lineno, code.co_name, lookup_line=False) for code, lineno in zip(codes, linenos)]
+        )
+
+    def format(self) -> str:
+        """Texto equivalente ao de `traceback.format_exception`."""
+        lines = ["Traceback (most recent call last):\n", *self.stack.format()] if self._frames else []
+        lines.append(f"{self}\n")
+        return "".join(lines)
+
+    def to_exception(self) -> BaseException:
+        """
+        Nova instância da exceção original, criada com os mesmos argumentos.
+        A pilha capturada vai como nota (`__notes__`), já que os frames não
+        existem mais.
+        """
+        try:
+            exc = self.exc_type(*self.args)
+        except Exception:
+            # Construtores que não aceitam os próprios args de volta
+            exc = self.exc_type.__new__(self.exc_type)
+            exc.args = self.args
+        if self._frames:
+            exc.add_note("".join(["Pilha original (mais recente por último):\n", *self.stack.format()]))
+        return exc
+
+    @override
+    def __str__(self) -> str:
+        name = self.exc_type.__qualname__
+        return f"{name}: {self.message}" if self.message else name
+
+    @override
+    def __repr__(self) -> str:
+        return f"ErrorRecord({self.exc_type.__qualname__}, {self.message!r})"
+
+
+def _summarize(tb: TracebackType | None) -> tuple[CodeType | int, ...]:
+    frames: list[CodeType | int] = []
+    while tb is not None:
+        frames.append(tb.tb_frame.f_code)
+        frames.append(tb.tb_lineno)
+        tb = tb.tb_next
+    return tuple(frames)
+
+
+def try_catch_record(f: Callable[[], R]) -> Either[ErrorRecord, R]:
+    """
+    Como `try_catch`, mas o Left guarda um ErrorRecord em vez da exceção.
+
+    O traceback é descartado assim que o resumo é feito, então falhas
+    guardadas em massa não mantêm frames nem variáveis locais vivos.
+    """
+    try:
+        return Right(f())
+    except Exception as e:
+        record = ErrorRecord.from_exception(e)
+        e.__traceback__ = None
+        return Left(record)
@@ -0,0 +1,365 @@
+"""
+Formato binário compacto para Either, avulsos ou em lote.
+
+Cada Either é um byte de tag seguido do payload. O bit mais alto da tag diz
+o lado (0 = Left, 1 = Right) e os outros sete, o tipo do valor:
+
+    None, True, False     só a tag
+    int                   varint zigzag (qualquer tamanho)
+    float                 8 bytes (double little-endian)
+    str, bytes            varint do tamanho + bytes (str em UTF-8)
+    list, tuple, dict     varint da quantidade + cada item (sem bit de lado)
+    list de int           largura (1, 2, 4 ou 8) + varint da quantidade + os
+                          itens na menor largura em que todos cabem
+    list de float         varint da quantidade + 8 bytes por item, de uma vez
+    outros                varint do tamanho + pickle
+
+Um lote é o cabeçalho `BATCH_MAGIC` seguido dos itens, um após o outro, sem
+contagem: dá para escrever (`dump`) e ler (`iter_decode`) em fluxo. Como o
+último caso usa pickle, só decodifique dados de fontes confiáveis.
+
+    data = encode_batch(results)
+    results = decode_batch(data)
+"""
+
+from __future__ import annotations
+import pickle
+import struct
+import sys
+from array import array
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from .either7 import Either, Left, Right
+
+# Cabeçalho dos lotes: "EB" + versão do formato (2: listas de int com largura)
+BATCH_MAGIC = b"EB\x02"
+
+# Bit de lado na tag
+_RIGHT = 0x80
+
+# Tipos de payload (os sete bits baixos da tag)
+_NONE = 0
+_TRUE = 1
+_FALSE = 2
+_INT = 3
+_FLOAT = 4
+_STR = 5
+_BYTES = 6
+_LIST = 7
+_TUPLE = 8
+_DICT = 9
+_INT_ARRAY = 10
+_FLOAT_ARRAY = 11
+_PICKLE = 12
+
+# Listas menores que isso não compensam o teste de homogeneidade
+_MIN_ARRAY = 4
+
+_INTS = {int}
+_FLOATS = {float}
+
+# Typecodes de inteiro com sinal, do mais estreito ao mais largo, com o
+# limite de cada um (cabe se -limite <= n < limite); a largura gravada é o
+# `itemsize`
+_INT_CODES = tuple((code, 1 << (8 * array(code).itemsize - 1)) for code in "bhiq")
+_INT_WIDTHS = {array(code).itemsize: code for code in "bhiq"}
+
+_DOUBLE = struct.Struct("<d")
+_SWAP = sys.byteorder == "big"
+
+# Construtor de Left ou de Right usado na decodificação
+Factory = Callable[[Any], Any]
+
+
+class _Truncated(Exception):
+    pass
+
+
+# Erros que indicam que o buffer acabou no meio de um item
+_TRUNCATED = (_Truncated, IndexError, struct.error)
+
+
+def _write_uvarint(out: bytearray, n: int) -> None:
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_uvarint(buf: bytes | bytearray, pos: int) -> tuple[int, int]:
+    byte = buf[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    result = byte & 0x7F
+    shift = 7
+    while True:
+        pos += 1
+        byte = buf[pos]
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos + 1
+        shift += 7
+
+
+def _write_array(out: bytearray, side: int, kind: int, typecode: str, items: list[Any]) -> None:
+    packed = array(typecode, items)
+    if _SWAP:
+        packed.byteswap()
+    out.append(side | kind)
+    if kind == _INT_ARRAY:
+        out.append(packed.itemsize)
+    _write_uvarint(out, len(items))
+    out += packed.tobytes()
+
+
+def _int_code(items: list[int]) -> str | None:
+    """Typecode mais estreito em que todos os `items` cabem; None se nem "q" serve."""
+    low, high = min(items), max(items)
+    for code, limit in _INT_CODES:
+        if -limit <= low and high < limit:
+            return code
+    return None
+
+
+def _encode_value(out: bytearray, value: Any, side: int) -> None:
+    kind = type(value)
+    if kind is int:
+        zz = value << 1 if value >= 0 else (~value << 1) | 1
+        out.append(side | _INT)
+        if zz < 0x80:
+            out.append(zz)
+        else:
+            _write_uvarint(out, zz)
+    elif kind is str:
+        data: bytes = value.encode("utf-8", "surrogatepass")
+        out.append(side | _STR)
+        _write_uvarint(out, len(data))
+        out += data
+    elif kind is float:
+        out.append(side | _FLOAT)
+        out += _DOUBLE.pack(value)
+    elif value is None:
+        out.append(side | _NONE)
+    elif value is True:
+        out.append(side | _TRUE)
+    elif value is False:
+        out.append(side | _FALSE)
+    elif kind is bytes:
+        out.append(side | _BYTES)
+        _write_uvarint(out, len(value))
+        out += value
+    elif kind is list:
+        if len(value) >= _MIN_ARRAY:
+            kinds = set(map(type, value))
+            if kinds == _INTS:
+                code = _int_code(value)
+                if code is not None:
+                    _write_array(out, side, _INT_ARRAY, code, value)
+                    return
+            elif kinds == _FLOATS:
+                _write_array(out, side, _FLOAT_ARRAY, "d", value)
+                return
+        out.append(side | _LIST)
+        _write_uvarint(out, len(value))
+        for item in value:
+            _encode_value(out, item, 0)
+    elif kind is tuple:
+        out.append(side | _TUPLE)
+        _write_uvarint(out, len(value))
+        for item in value:
+            _encode_value(out, item, 0)
+    elif kind is dict:
+        out.append(side | _DICT)
+        _write_uvarint(out, len(value))
+        for key, item in value.items():
+            _encode_value(out, key, 0)
+            _encode_value(out, item, 0)
+    else:
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        out.append(side | _PICKLE)
+        _write_uvarint(out, len(data))
+        out += data
+
+
+def _read_sized(buf: bytes | bytearray, pos: int) -> tuple[bytes | bytearray, int]:
+    size, pos = _read_uvarint(buf, pos)
+    end = pos + size
+    if end > len(buf):
+        raise _Truncated
+    return buf[pos:end], end
+
+
+def _read_array(buf: bytes | bytearray, pos: int, typecode: str) -> tuple[list[Any], int]:
+    items = array(typecode)
+    count, pos = _read_uvarint(buf, pos)
+    end = pos + count * items.itemsize
+    if end > len(buf):
+        raise _Truncated
+    items.frombytes(buf[pos:end])
+    if _SWAP:
+        items.byteswap()
+    return items.tolist(), end
+
+
+def _decode_value(buf: bytes | bytearray, pos: int) -> tuple[object, int]:
+    kind = buf[pos] & 0x7F
+    pos += 1
+    if kind == _INT:
+        zz = buf[pos]
+        if zz < 0x80:
+            return (zz >> 1) ^ -(zz & 1), pos + 1
+        zz, pos = _read_uvarint(buf, pos)
+        return (zz >> 1) ^ -(zz & 1), pos
+    if kind == _STR:
+        data, pos = _read_sized(buf, pos)
+        return data.decode("utf-8", "surrogatepass"), pos
+    if kind == _FLOAT:
+        return _DOUBLE.unpack_from(buf, pos)[0], pos + 8
+    if kind == _NONE:
+        return None, pos
+    if kind == _TRUE:
+        return True, pos
+    if kind == _FALSE:
+        return False, pos
+    if kind == _BYTES:
+        data, pos = _read_sized(buf, pos)
+        return bytes(data), pos
+    if kind == _INT_ARRAY:
+        code = _INT_WIDTHS.get(buf[pos])
+        if code is None:
+            raise ValueError(f"largura de inteiro inválida: {buf[pos]}")
+        return _read_array(buf, pos + 1, code)
+    if kind == _FLOAT_ARRAY:
+        return _read_array(buf, pos, "d")
+    if kind == _LIST or kind == _TUPLE:
+        count, pos = _read_uvarint(buf, pos)
+        items: list[object] = []
+        for _ in range(count):
+            item, pos = _decode_value(buf, pos)
+            items.append(item)
+        return (items if kind == _LIST else tuple(items)), pos
+    if kind == _DICT:
+        count, pos = _read_uvarint(buf, pos)
+        mapping: dict[object, object] = {}
+        for _ in range(count):
+            key, pos = _decode_value(buf, pos)
+            mapping[key], pos = _decode_value(buf, pos)
+        return mapping, pos
+    if kind == _PICKLE:
+        data, pos = _read_sized(buf, pos)
+        return pickle.loads(data), pos
+    raise ValueError(f"tipo de payload desconhecido: {kind}")
+
+
+def _decode_item(buf: bytes | bytearray, pos: int, left: Factory, right: Factory) -> tuple[Any, int]:
+    value, end = _decode_value(buf, pos)
+    return (right(value) if buf[pos] & _RIGHT else left(value)), end
+
+
+def encode_into(out: bytearray, either: Any) -> None:
+    """Acrescenta `either` codificado a `out`. Aceita as variantes com `tag` (6, 7, 8, 9 e my_either)."""
+    _encode_value(out, either.value, _RIGHT if either.tag == "right" else 0)
+
+
+def encode(either: Any) -> bytes:
+    """Codifica um único Either."""
+    out = bytearray()
+    encode_into(out, either)
+    return bytes(out)
+
+
+def decode(data: bytes | bytearray, *, left: Factory = Left, right: Factory = Right) -> Either[Any, Any]:
+    """
+    Decodifica um único Either. `left`/`right` constroem o resultado
+    (padrão: Left e Right do either7).
+    """
+    try:
+        either, end = _decode_item(data, 0, left, right)
+    except _TRUNCATED:
+        raise ValueError("dados truncados") from None
+    if end != len(data):
+        raise ValueError(f"{len(data) - end} bytes sobrando depois do Either")
+    return either
+
+
+def encode_batch(eithers: Iterable[Any]) -> bytes:
+    """Codifica uma sequência de Either como um lote."""
+    out = bytearray(BATCH_MAGIC)
+    for either in eithers:
+        _encode_value(out, either.value, _RIGHT if either.tag == "right" else 0)
+    return bytes(out)
+
+
+def _check_magic(buf: bytes | bytearray) -> None:
+    if buf[: len(BATCH_MAGIC)] != BATCH_MAGIC:
+        raise ValueError("cabeçalho de lote inválido")
+
+
+def decode_batch(data: bytes | bytearray, *, left: Factory = Left, right: Factory = Right) -> list[Either[Any, Any]]:
+    """Decodifica um lote inteiro em uma lista."""
+    _check_magic(data)
+    pos = len(BATCH_MAGIC)
+    end = len(data)
+    items: list[Either[Any, Any]] = []
+    try:
+        while pos < end:
+            value, next_pos = _decode_value(data, pos)
+            items.append(right(value) if data[pos] & _RIGHT else left(value))
+            pos = next_pos
+    except _TRUNCATED:
+        raise ValueError(f"lote truncado depois de {len(items)} itens") from None
+    return items
+
+
+def dump(eithers: Iterable[Any], fp: IO[bytes], *, flush_size: int = 1 << 16) -> int:
+    """
+    Escreve um lote em `fp` aos poucos, em blocos de cerca de `flush_size`
+    bytes. Devolve a quantidade de itens escritos.
+    """
+    out = bytearray(BATCH_MAGIC)
+    count = 0
+    for either in eithers:
+        _encode_value(out, either.value, _RIGHT if either.tag == "right" else 0)
+        count += 1
+        if len(out) >= flush_size:
+            _ = fp.write(out)
+            out.clear()
+    if out:
+        _ = fp.write(out)
+    return count
+
+
+def iter_decode(
+    fp: IO[bytes], *, left: Factory = Left, right: Factory = Right, chunk_size: int = 1 << 16
+) -> Iterator[Either[Any, Any]]:
+    """
+    Lê um lote de `fp` em blocos de `chunk_size` bytes e produz os Either um
+    a um, sem carregar o lote inteiro na memória.
+    """
+    buf = bytearray()
+    pos = 0
+    header = False
+    while True:
+        chunk = fp.read(chunk_size)
+        buf += chunk
+        if not header:
+            if len(buf) < len(BATCH_MAGIC) and chunk:
+                continue
+            _check_magic(buf)
+            header = True
+            pos = len(BATCH_MAGIC)
+        end = len(buf)
+        while pos < end:
+            try:
+                value, next_pos = _decode_value(buf, pos)
+            except _TRUNCATED:
+                break
+            yield right(value) if buf[pos] & _RIGHT else left(value)
+            pos = next_pos
+        if not chunk:
+            if pos < end:
+                raise ValueError("lote truncado no fim do arquivo")
+            return
+        # Descarta o que já foi lido; sobra só um item incompleto, se houver
+        del buf[:pos]
+        pos = 0
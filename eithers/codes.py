@@ -0,0 +1,94 @@
+"""
+Códigos de erro pré-alocados para Left baratos em caminhos quentes.
+
+Cada membro de um enum derivado de ErrorCode já nasce com o seu Left
+(`code.left`), então devolver uma falha não aloca nada. Quando a falha
+precisa carregar um dado, `code.with_payload(x)` cria só um CodedError
+pequeno e o Left. A exceção correspondente só é criada se alguém chamar
+`to_exception()`.
+
+    class MathError(ErrorCode):
+        DIVISION_BY_ZERO = ("Division by zero", ZeroDivisionError)
+        NEGATIVE_SQRT = "Raiz de número negativo"
+
+    def divide(a: float, b: float) -> Either[MathError, float]:
+        if b == 0:
+            return MathError.DIVISION_BY_ZERO.left
+        return Right(a / b)
+"""
+
+from __future__ import annotations
+from enum import Enum
+from typing import Generic, TypeVar, cast, override
+
+from .either7 import Left
+
+P = TypeVar("P")  # Tipo do payload
+
+
+class ErrorCode(Enum):
+    """
+    Base para enums de códigos de erro.
+
+    O valor de cada membro é a mensagem ou `(mensagem, tipo de exceção)`;
+    sem tipo, a exceção é ValueError. Internamente o valor vira um número
+    sequencial (`code.value`), estável enquanto a ordem dos membros não mudar,
+    e membros com a mesma mensagem continuam distintos.
+    """
+
+    def __new__(cls, *_: object) -> ErrorCode:
+        member = object.__new__(cls)
+        member._value_ = len(cls.__members__) + 1
+        return member
+
+    def __init__(self, message: str, exc_type: type[Exception] = ValueError) -> None:
+        self.message = message
+        self.exc_type = exc_type
+        # Único Left deste código, compartilhado por todas as falhas
+        self.left: Left[ErrorCode, object] = Left(self)
+
+    def with_payload(self, payload: P) -> Left[CodedError[P], object]:
+        """Left com este código e um dado associado (ex.: o valor que falhou)."""
+        return Left(CodedError(self, payload))
+
+    def to_exception(self) -> Exception:
+        """Cria a exceção correspondente (uma nova a cada chamada)."""
+        return self.exc_type(self.message)
+
+    @override
+    def __str__(self) -> str:
+        return f"{type(self).__name__}.{self.name}: {self.message}"
+
+
+class CodedError(Generic[P]):
+    """Código de erro acompanhado de um payload."""
+
+    __slots__ = ("code", "payload")
+
+    def __init__(self, code: ErrorCode, payload: P) -> None:
+        self.code = code
+        self.payload = payload
+
+    @property
+    def message(self) -> str:
+        return self.code.message
+
+    def to_exception(self) -> Exception:
+        """Cria a exceção do código, com o payload como segundo argumento."""
+        return self.code.exc_type(self.code.message, self.payload)
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if type(other) is CodedError:
+            other = cast("CodedError[object]", other)
+            return self.code is other.code and self.payload == other.payload
+        return NotImplemented
+
+    @override
+    def __hash__(self) -> int:
+        return hash((self.code, self.payload))
+
+    @override
+    def __repr__(self) -> str:
+        return f"CodedError({self.code!s}, {self.payload!r})"
+
@@ -0,0 +1,194 @@
+"""
+Prazos para cadeias de Either do either7.
+
+Um prazo é anexado a uma execução com `deadline(segundos)` e fica visível
+para todo o código chamado dentro dela (inclusive em tasks do asyncio e nas
+threads de `call`), por uma ContextVar. Cada estágio pode consultá-lo com
+custo de uma leitura da ContextVar e uma comparação:
+
+    with deadline(0.25):
+        result = Right(request).flat_map(guard(parse)).flat_map(lambda r: call(fetch, r)).map(render)
+
+`guard(f)` devolve `Left(DeadlineExceeded)` sem chamar `f` se o prazo já
+passou. `call(f, ...)` vai além: executa `f` em uma thread e para de esperar
+quando o prazo acaba, então um passo lento não segura a cadeia. A thread
+não é interrompida (o Python não permite); ela termina em segundo plano e
+o resultado é descartado. `acall` faz o mesmo com asyncio, e aí a task é
+cancelada de verdade.
+
+Prazos aninhados valem pelo menor: um `deadline(5)` dentro de um
+`deadline(1)` termina junto com o de fora.
+"""
+
+from __future__ import annotations
+import asyncio
+import contextvars
+import inspect
+import time
+from concurrent.futures import Executor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Iterator, ParamSpec, TypeVar, cast, override
+
+from .either7 import Either, Left, Right
+from .threaded import default_executor
+
+P = ParamSpec("P")
+R = TypeVar("R")  # Tipo do sucesso
+T = TypeVar("T")  # Tipo do valor de entrada de um estágio
+L = TypeVar("L")  # Tipo do erro
+
+
+class DeadlineExceeded(TimeoutError):
+    """TimeoutError de um prazo esgotado; `budget` é o prazo original em segundos."""
+
+    def __init__(self, budget: float) -> None:
+        super().__init__(f"prazo de {budget:g}s esgotado")
+        self.budget = budget
+
+
+class Deadline:
+    """Instante limite (no relógio monotônico) de uma execução."""
+
+    __slots__ = ("expires_at", "budget", "clock")
+
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.budget = seconds
+        self.clock = clock
+        self.expires_at = clock() + seconds
+
+    def remaining(self) -> float:
+        """Segundos restantes (negativo se já passou)."""
+        return self.expires_at - self.clock()
+
+    def expired(self) -> bool:
+        return self.clock() >= self.expires_at
+
+    def error(self) -> DeadlineExceeded:
+        return DeadlineExceeded(self.budget)
+
+    def check(self) -> Either[DeadlineExceeded, None]:
+        """Right(None) se ainda há tempo, Left(DeadlineExceeded) se não."""
+        return Left(self.error()) if self.expired() else Right(None)
+
+    @override
+    def __repr__(self) -> str:
+        return f"Deadline({self.budget:g}s, restam {self.remaining():.3f}s)"
+
+
+_current: contextvars.ContextVar[Deadline | None] = contextvars.ContextVar("eithers_deadline", default=None)
+
+
+def current() -> Deadline | None:
+    """Prazo da execução atual, se houver."""
+    return _current.get()
+
+
+@contextmanager
+def deadline(seconds: float, clock: Callable[[], float] = time.monotonic) -> Iterator[Deadline]:
+    """Anexa um prazo de `seconds` ao código executado dentro do bloco."""
+    new = Deadline(seconds, clock)
+    outer = _current.get()
+    # O prazo de fora continua valendo se terminar antes
+    active = outer if outer is not None and outer.expires_at <= new.expires_at else new
+    token = _current.set(active)
+    try:
+        yield active
+    finally:
+        _current.reset(token)
+
+
+def guard(f: Callable[[T], Either[L, R]]) -> Callable[[T], Either[L | DeadlineExceeded, R]]:
+    """
+    Versão de um estágio de `flat_map` que não é chamada depois do prazo:
+    devolve `Left(DeadlineExceeded)` no lugar. Sem prazo ativo, chama `f`.
+    """
+
+    def guarded(value: T) -> Either[L | DeadlineExceeded, R]:
+        active = _current.get()
+        if active is not None and active.clock() >= active.expires_at:
+            return Left(active.error())
+        return cast("Either[L | DeadlineExceeded, R]", f(value))
+
+    guarded.__name__ = guarded.__qualname__ = f"guard_{getattr(f, '__name__', 'stage')}"
+    return guarded
+
+
+def _catching(f: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> Either[Exception, R]:
+    try:
+        return Right(f(*args, **kwargs))
+    except Exception as e:
+        return Left(e)
+
+
+def call(f: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> Either[Exception, R]:
+    """
+    Como `try_catch`, mas respeitando o prazo atual: `f` roda em uma thread
+    do pool compartilhado (eithers.threaded) e, se o prazo acabar antes,
+    devolve `Left(DeadlineExceeded)` sem esperar o fim de `f`. Exceções de
+    `f` viram Left. Sem prazo ativo, `f` roda na thread atual.
+    """
+    return call_in(default_executor(), f, *args, **kwargs)
+
+
+def call_in(executor: Executor, f: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> Either[Exception, R]:
+    """`call` usando `executor` no lugar do pool compartilhado."""
+    active = _current.get()
+    if active is None:
+        return _catching(f, *args, **kwargs)
+    remaining = active.remaining()
+    if remaining <= 0:
+        return Left(active.error())
+    # A thread enxerga o mesmo prazo, para os estágios internos também o respeitarem
+    context = contextvars.copy_context()
+    future = executor.submit(context.run, _catching, f, *args, **kwargs)
+    try:
+        return future.result(timeout=remaining)
+    except FutureTimeoutError:
+        _ = future.cancel()
+        return Left(active.error())
+
+
+async def _resolve(value: Awaitable[R] | R) -> R:
+    if inspect.isawaitable(value):
+        return await cast("Awaitable[R]", value)
+    return cast("R", value)
+
+
+async def acall(f: Callable[P, Awaitable[R] | R], *args: P.args, **kwargs: P.kwargs) -> Either[Exception, R]:
+    """
+    Versão async de `call`: espera `f(*args, **kwargs)` (função async ou
+    comum) até o fim do prazo atual; se o prazo acabar, a task é cancelada e
+    o resultado é `Left(DeadlineExceeded)`. Exceções de `f` viram Left.
+    """
+    active = _current.get()
+    if active is not None and active.remaining() <= 0:
+        return Left(active.error())
+    try:
+        if active is None:
+            return Right(await _resolve(f(*args, **kwargs)))
+        async with asyncio.timeout(active.remaining()):
+            return Right(await _resolve(f(*args, **kwargs)))
+    except TimeoutError as e:
+        # Distingue o fim do prazo de um TimeoutError lançado pela própria `f`
+        return Left(active.error() if active is not None and active.expired() else e)
+    except Exception as e:
+        return Left(e)
+
+
+def run_with_deadline(seconds: float, f: Callable[[], Either[L, R]]) -> Either[L | Exception, R]:
+    """Executa `f` (uma cadeia inteira) sob um prazo de `seconds`, sem bloquear além dele."""
+    with deadline(seconds):
+        result = call(f)
+    return _flatten(result)
+
+
+async def arun_with_deadline(seconds: float, f: Callable[[], Awaitable[Either[L, R]]]) -> Either[L | Exception, R]:
+    """Versão async de `run_with_deadline`, para cadeias de AsyncEither ou corrotinas."""
+    with deadline(seconds):
+        result = await acall(f)
+    return _flatten(result)
+
+
+def _flatten(result: Either[Exception, Either[L, R]]) -> Either[L | Exception, R]:
+    return result.fold(lambda error: Left(error), lambda either: cast("Either[L | Exception, R]", either))
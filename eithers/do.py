@@ -0,0 +1,223 @@
+"""
+Notação "do" para o either9: um gerador que faz `yield` de Eithers.
+
+    @do
+    def transfer(src: str, dst: str, amount: int) -> Do[str, Receipt]:
+        a = yield load(src)
+        b = yield load(dst)
+        yield check_balance(a, amount)
+        return Receipt(a, b, amount)
+
+    transfer("x", "y", 10)  # Right(Receipt(...)) ou o primeiro Left
+
+Cada `yield` devolve o valor do Right; o primeiro Left encerra a função e
+é devolvido como está. O `return` vira Right. Substitui o encadeamento
+`load(src).bind(lambda a: load(dst).bind(lambda b: ...))` sem criar uma
+closure por passo.
+
+Sempre que possível, `do` recompila a função a partir do código-fonte,
+trocando cada `x = yield e` por uma verificação direta
+(`r = e; if r.is_left: return r; x = r.value`): o resultado é uma função
+comum, sem gerador nem `send` a cada passo. Isso vale quando os `yield`
+aparecem só como comando (`yield e`, `x = yield e`, `x: T = yield e`) no
+corpo ou dentro de `if`, `for` e `while`, e a função não usa variáveis de
+escopos externos (closures). Qualquer outro caso (`yield` ou `return`
+dentro de `try`/`with`/`match`, `yield` no meio de uma expressão,
+código-fonte indisponível, ...) usa o gerador, com o mesmo resultado.
+"""
+
+from __future__ import annotations
+import __future__
+import ast
+import functools
+import inspect
+import textwrap
+import weakref
+from typing import Any, Callable, Generator, ParamSpec, TypeAlias, TypeVar
+
+from .either9 import Result, Right
+
+P = ParamSpec("P")
+L = TypeVar("L")  # Tipo do valor de Left
+R = TypeVar("R")  # Tipo do valor de Right
+
+# Tipo de retorno das funções decoradas com `do`
+Do: TypeAlias = Generator["Result[L, Any]", Any, R]
+
+# Nomes internos da versão compilada (não colidem com identificadores do usuário)
+_RIGHT = "__do_Right"
+_RESULT = "__do_result"
+
+# Flags de `from __future__ import ...`, repassadas ao recompilar
+_FUTURE_FLAGS = functools.reduce(lambda acc, name: acc | getattr(__future__, name).compiler_flag, __future__.all_feature_names, 0)
+
+# Funções geradas pela versão compilada
+_compiled: weakref.WeakSet[Callable[..., Any]] = weakref.WeakSet()
+
+
+def _run(gen: Generator[Result[L, Any], Any, R]) -> Result[L, R]:
+    send = gen.send
+    try:
+        either = send(None)
+        while not either.is_left:
+            either = send(either.value)
+    except StopIteration as stop:
+        return Right(stop.value)
+    gen.close()
+    return either
+
+
+def do_generator(func: Callable[P, Do[L, R]]) -> Callable[P, Result[L, R]]:
+    """`do` sem compilação: sempre executa o gerador."""
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> Result[L, R]:
+        return _run(func(*args, **kwargs))
+
+    return wrapper
+
+
+def do(func: Callable[P, Do[L, R]]) -> Callable[P, Result[L, R]]:
+    """Transforma um gerador de Eithers em uma função que devolve um Either."""
+    compiled = _compile(func)
+    return compiled if compiled is not None else do_generator(func)
+
+
+def is_compiled(func: Callable[..., object]) -> bool:
+    """Se uma função decorada com `do` usa a versão compilada."""
+    return func in _compiled
+
+
+def _compile(func: Callable[..., Any]) -> Callable[..., Any] | None:
+    code = getattr(func, "__code__", None)
+    if code is None or not inspect.isgeneratorfunction(func) or code.co_freevars:
+        return None
+    try:
+        source = textwrap.dedent(inspect.getsource(func))
+        filename = inspect.getsourcefile(func) or code.co_filename
+    except (OSError, TypeError):
+        return None
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+    if len(tree.body) != 1 or not isinstance(tree.body[0], ast.FunctionDef):
+        return None
+    node = tree.body[0]
+    if _has_private_name(node):
+        # Nomes `__x` de métodos dependem da classe para o name mangling
+        return None
+    body = _rewrite(node.body)
+    if body is None:
+        return None
+    if not isinstance(body[-1], ast.Return):
+        body.append(_return_right(None, node.body[-1]))
+    node.body = body
+    node.decorator_list = []
+    # Padrões e anotações podem citar nomes do escopo da classe: vêm da função original
+    args = node.args
+    args.defaults = [ast.Constant(value=None) for _ in args.defaults]
+    args.kw_defaults = [None if default is None else ast.Constant(value=None) for default in args.kw_defaults]
+    for arg in (*args.posonlyargs, *args.args, *args.kwonlyargs, args.vararg, args.kwarg):
+        if arg is not None:
+            arg.annotation = None
+    node.returns = None
+
+    # A função fica dentro de uma fábrica que recebe o Right, para não tocar nos globais do módulo
+    module = ast.parse(f"def __do_factory({_RIGHT}):\n    return {node.name}")
+    factory = module.body[0]
+    assert isinstance(factory, ast.FunctionDef)
+    factory.body.insert(0, node)
+    _ = ast.fix_missing_locations(module)
+    # Mantém as linhas do arquivo original nos tracebacks
+    _ = ast.increment_lineno(module, code.co_firstlineno - 1)
+    namespace: dict[str, Any] = {}
+    try:
+        exec(compile(module, filename, "exec", flags=code.co_flags & _FUTURE_FLAGS, dont_inherit=True), func.__globals__, namespace)
+    except SyntaxError:
+        return None
+    compiled = namespace["__do_factory"](Right)
+    compiled.__defaults__ = getattr(func, "__defaults__", None)
+    compiled.__kwdefaults__ = getattr(func, "__kwdefaults__", None)
+    compiled = functools.update_wrapper(compiled, func)
+    _compiled.add(compiled)
+    return compiled
+
+
+def _rewrite(stmts: list[ast.stmt]) -> list[ast.stmt] | None:
+    """Reescreve um bloco; None se algum `yield` estiver fora das formas suportadas."""
+    result: list[ast.stmt] = []
+    for stmt in stmts:
+        if isinstance(stmt, (ast.Expr, ast.Assign, ast.AnnAssign)) and isinstance(stmt.value, ast.Yield):
+            yielded = stmt.value.value
+            targets: list[ast.expr] | None = list(stmt.targets) if isinstance(stmt, ast.Assign) else [stmt.target] if isinstance(stmt, ast.AnnAssign) else None
+            # `yield` sem valor ou aninhado (`x = yield (yield a)`) fica com o gerador
+            if yielded is None or _has_yield(yielded) or any(_has_yield(target) for target in targets or ()):
+                return None
+            result.extend(_unwrap(yielded, targets, stmt))
+        elif isinstance(stmt, ast.Return):
+            if stmt.value is not None and _has_yield(stmt.value):
+                return None
+            result.append(_return_right(stmt.value, stmt))
+        elif isinstance(stmt, (ast.If, ast.For, ast.While)):
+            header = stmt.test if isinstance(stmt, (ast.If, ast.While)) else stmt.iter
+            body = _rewrite(stmt.body)
+            orelse = _rewrite(stmt.orelse)
+            if body is None or orelse is None or _has_yield(header):
+                return None
+            stmt.body = body
+            stmt.orelse = orelse
+            result.append(stmt)
+        elif _contains(stmt, (ast.Yield, ast.YieldFrom, ast.Return)):
+            # `yield` ou `return` dentro de try/with/match: o gerador cuida
+            return None
+        else:
+            result.append(stmt)
+    return result
+
+
+def _unwrap(expr: ast.expr, targets: list[ast.expr] | None, origin: ast.stmt) -> list[ast.stmt]:
+    stmts: list[ast.stmt] = [
+        ast.Assign(targets=[ast.Name(id=_RESULT, ctx=ast.Store())], value=expr),
+        ast.If(
+            test=ast.Attribute(value=ast.Name(id=_RESULT, ctx=ast.Load()), attr="is_left", ctx=ast.Load()),
+            body=[ast.Return(value=ast.Name(id=_RESULT, ctx=ast.Load()))],
+            orelse=[],
+        ),
+    ]
+    if targets is not None:
+        unwrapped = ast.Attribute(value=ast.Name(id=_RESULT, ctx=ast.Load()), attr="value", ctx=ast.Load())
+        stmts.append(ast.Assign(targets=targets, value=unwrapped))
+    for stmt in stmts:
+        _ = ast.copy_location(stmt, origin)
+    return stmts
+
+
+def _return_right(value: ast.expr | None, origin: ast.stmt) -> ast.stmt:
+    call = ast.Call(func=ast.Name(id=_RIGHT, ctx=ast.Load()), args=[value if value is not None else ast.Constant(value=None)], keywords=[])
+    return ast.copy_location(ast.Return(value=call), origin)
+
+
+def _has_yield(node: ast.AST) -> bool:
+    return _contains(node, (ast.Yield, ast.YieldFrom))
+
+
+def _contains(node: ast.AST, kinds: tuple[type[ast.AST], ...]) -> bool:
+    """Se há um nó de `kinds` em `node`, sem entrar em funções, lambdas e classes internas."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, kinds):
+            return True
+        for child in ast.iter_child_nodes(current):
+            if not isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+                stack.append(child)
+    return False
+
+
+def _has_private_name(node: ast.AST) -> bool:
+    for current in ast.walk(node):
+        name = current.id if isinstance(current, ast.Name) else current.attr if isinstance(current, ast.Attribute) else None
+        if name is not None and name.startswith("__") and not name.endswith("__"):
+            return True
+    return False
@@ -11,6 +11,8 @@ class Either(Generic[T, E]):
     Classe base para representar um resultado que pode ser um sucesso (Right) ou um erro (Left).
     """
 
+    __slots__ = ("_value", "_is_right")
+
     def __init__(self, value: T | E, is_right: bool):
         self._value = value
         self._is_right = is_right
@@ -56,6 +58,8 @@ class Either(Generic[T, E]):
 class Right(Either[T, E]):
     """Classe que representa um sucesso (Right)."""
 
+    __slots__ = ()
+
     def __init__(self, value: T):
         super().__init__(value, is_right=True)
 
@@ -63,6 +67,8 @@ class Right(Either[T, E]):
 class Left(Either[T, E]):
     """Classe que representa um erro (Left)."""
 
+    __slots__ = ()
+
     def __init__(self, error: E):
         super().__init__(error, is_right=False)
 
@@ -75,23 +81,24 @@ def divide(a: float, b: float) -> Either[float, ZeroDivisionError]:
     return Right(a / b)
 
 
-# Testando a função divide
-result = divide(10, 2)
-print(result)  # Right(5.0)
+if __name__ == "__main__":
+    # Testando a função divide
+    result = divide(10, 2)
+    print(result)  # Right(5.0)
 
-result = divide(10, 0)
-print(result)  # Left(ZeroDivisionError("Division by zero"))
+    result = divide(10, 0)
+    print(result)  # Left(ZeroDivisionError("Division by zero"))
 
-# Usando map e bind
-result = divide(10, 2).map(lambda x: x * 2)
-print(result)  # Right(10.0)
+    # Usando map e bind
+    result = divide(10, 2).map(lambda x: x * 2)
+    print(result)  # Right(10.0)
 
-result = divide(10, 0).map(lambda x: x * 2)
-print(result)  # Left(ZeroDivisionError("Division by zero"))
+    result = divide(10, 0).map(lambda x: x * 2)
+    print(result)  # Left(ZeroDivisionError("Division by zero"))
 
-# Usando get_or_else
-value = divide(10, 2).get_or_else(0)
-print(value)  # 5.0
+    # Usando get_or_else
+    value = divide(10, 2).get_or_else(0)
+    print(value)  # 5.0
 
-value = divide(10, 0).get_or_else(0)
-print(value)  # 0
+    value = divide(10, 0).get_or_else(0)
+    print(value)  # 0
@@ -12,6 +12,8 @@ class Either(Generic[E, T]):
     Aqui, o erro está à esquerda (E) e o sucesso à direita (T).
     """
 
+    __slots__ = ("_value", "_is_right")
+
     def __init__(self, value: E | T, is_right: bool):
         self._value = value
         self._is_right = is_right
@@ -40,6 +42,8 @@ class Either(Generic[E, T]):
 class Right(Either[E, T]):
     """Classe que representa um sucesso (Right)."""
 
+    __slots__ = ()
+
     def __init__(self, value: T):
         super().__init__(value, is_right=True)
 
@@ -47,6 +51,8 @@ class Right(Either[E, T]):
 class Left(Either[E, T]):
     """Classe que representa um erro (Left)."""
 
+    __slots__ = ()
+
     def __init__(self, error: E):
         super().__init__(error, is_right=False)
 
@@ -59,9 +65,10 @@ def divide(a: float, b: float) -> Either[ZeroDivisionError, float]:
     return Right(a / b)
 
 
-# Testando a função divide
-result = divide(10, 2)
-print(result)  # Right(5.0)
+if __name__ == "__main__":
+    # Testando a função divide
+    result = divide(10, 2)
+    print(result)  # Right(5.0)
 
-result = divide(10, 0)
-print(result)  # Left(ZeroDivisionError("Division by zero"))
+    result = divide(10, 0)
+    print(result)  # Left(ZeroDivisionError("Division by zero"))
@@ -7,6 +7,8 @@ E = TypeVar("E")
 
 
 class Left(Generic[E, T]):
+    __slots__ = ("value",)
+
     def __init__(self, value: E) -> None:
         self.value: E = value
 
@@ -18,6 +20,8 @@ class Left(Generic[E, T]):
 
 
 class Right(Generic[E, T]):
+    __slots__ = ("value",)
+
     def __init__(self, value: T) -> None:
         self.value: T = value
 
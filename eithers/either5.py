@@ -6,6 +6,8 @@ U = TypeVar("U")
 
 
 class Left(Generic[E, T]):
+    __slots__ = ("value",)
+
     def __init__(self, value: E) -> None:
         self.value: E = value
 
@@ -26,6 +28,8 @@ class Left(Generic[E, T]):
 
 
 class Right(Generic[E, T]):
+    __slots__ = ("value",)
+
     def __init__(self, value: T) -> None:
         self.value: T = value
 
@@ -56,9 +60,10 @@ def right(value: T) -> Either[E, T]:
     return Right(value)
 
 
-# Exemplo de uso
-result: Either[str, int] = right(10).map(lambda x: x * 2)
-print(result.value)  # 20
+if __name__ == "__main__":
+    # Exemplo de uso
+    result: Either[str, int] = right(10).map(lambda x: x * 2)
+    print(result.value)  # 20
 
-result = left("error").map(lambda x: x * 2)
-print(result.value)  # "error"
+    result = left("error").map(lambda x: x * 2)
+    print(result.value)  # "error"
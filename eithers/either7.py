@@ -1,7 +1,5 @@
 from __future__ import annotations
-from typing import TypeVar, Generic, Callable, override
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, ClassVar, Literal, NoReturn, Self, TypeVar, Generic, Callable, cast, override
 
 # Define tipos genéricos para Left, Right e transformações
 L = TypeVar("L")  # Tipo do erro
@@ -10,78 +8,128 @@ T = TypeVar("T")  # Tipo para transformações
 U = TypeVar("U")  # Tipo adicional para transformações do Left
 
 
-class Either(Generic[L, R], ABC):
+class Either(Generic[L, R]):
     """
-    Classe abstrata base que representa um resultado que pode ser
-    sucesso (Right) ou erro (Left).
+    Classe base que representa um resultado que pode ser sucesso (Right)
+    ou erro (Left).
+
+    Left e Right aceitam `match`, com o valor como único campo posicional:
+
+        match either:
+            case Right(value):
+                ...
+            case Left(error):
+                ...
+
+    `tag` é um atributo de classe ("left" ou "right") para despachar no
+    caminho quente sem chamar método nenhum.
     """
 
-    @abstractmethod
-    def is_right(self) -> bool:
-        """Retorna True se é um Right, False se é um Left."""
-        pass
+    __slots__ = ()
+    tag: ClassVar[Literal["left", "right"]]
+
+    # Sem implementação na base: estes métodos existem só para o verificador
+    # de tipos, e Left e Right definem todos eles
+    if TYPE_CHECKING:
+        def is_right(self) -> bool:
+            """Retorna True se é um Right, False se é um Left."""
+            ...
+
+        def is_left(self) -> bool:
+            """Retorna True se é um Left, False se é um Right."""
+            ...
+
+        def map(self, f: Callable[[R], T]) -> Either[L, T]:  # pyright: ignore[reportUnusedParameter]
+            """
+            Aplica uma função ao valor se for Right, mantém o erro se for Left.
+            """
+            ...
+
+        def map_left(self, f: Callable[[L], U]) -> Either[U, R]:  # pyright: ignore[reportUnusedParameter]
+            """
+            Aplica uma função ao erro se for Left, mantém o valor se for Right.
+            """
+            ...
+
+        def flat_map(self, f: Callable[[R], Either[L, T]]) -> Either[L, T]:  # pyright: ignore[reportUnusedParameter]
+            """
+            Aplica uma função que retorna Either ao valor se for Right.
+            """
+            ...
+
+        def get_or_else(self, default: R) -> R:  # pyright: ignore[reportUnusedParameter]
+            """
+            Retorna o valor se for Right, ou o valor default se for Left.
+            """
+            ...
+
+        def fold(self, left_f: Callable[[L], T], right_f: Callable[[R], T]) -> T:  # pyright: ignore[reportUnusedParameter]
+            """
+            Aplica left_f se for Left, right_f se for Right.
+            """
+            ...
 
-    def is_left(self) -> bool:
-        """Retorna True se é um Left, False se é um Right."""
-        return not self.is_right()
 
-    @abstractmethod
-    def map(self, f: Callable[[R], T]) -> Either[L, T]:
-        """
-        Aplica uma função ao valor se for Right, mantém o erro se for Left.
-        """
-        pass
+class Left(Either[L, R]):
+    """Representa um erro/falha na computação."""
 
-    @abstractmethod
-    def map_left(self, f: Callable[[L], U]) -> Either[U, R]:
-        """
-        Aplica uma função ao erro se for Left, mantém o valor se for Right.
-        """
-        pass
+    # Imutável e com slots, com a mesma igualdade, hash e repr de uma
+    # dataclass frozen, mas sem importar dataclasses
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+    tag = "left"
+    value: L  # pyright: ignore[reportUninitializedInstanceVariable]
 
-    @abstractmethod
-    def flat_map(self, f: Callable[[R], Either[L, T]]) -> Either[L, T]:
-        """
-        Aplica uma função que retorna Either ao valor se for Right.
-        """
-        pass
+    def __init__(self, value: L) -> None:
+        # Escreve direto no slot, já que __setattr__ está bloqueado
+        _set_left_value(self, value)
 
-    @abstractmethod
-    def get_or_else(self, default: R) -> R:
-        """
-        Retorna o valor se for Right, ou o valor default se for Left.
-        """
-        pass
+    @override
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        raise AttributeError(f"cannot assign to field {name!r}")
 
-    @abstractmethod
-    def fold(self, left_f: Callable[[L], T], right_f: Callable[[R], T]) -> T:
-        """
-        Aplica left_f se for Left, right_f se for Right.
-        """
-        pass
+    @override
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"cannot delete field {name!r}")
 
+    @override
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return self.value == cast("Left[object, object]", other).value
+        return NotImplemented
 
-@dataclass(frozen=True)
-class Left(Either[L, R]):
-    """Representa um erro/falha na computação."""
+    @override
+    def __hash__(self) -> int:
+        return hash((self.value,))
 
-    value: L
+    @override
+    def __repr__(self) -> str:
+        return f"Left(value={self.value!r})"
+
+    @override
+    def __reduce__(self) -> tuple[type[Self], tuple[L]]:
+        return (type(self), (self.value,))
 
     @override
     def is_right(self) -> bool:
         return False
 
+    @override
+    def is_left(self) -> bool:
+        return True
+
     @override
     def map(self, f: Callable[[R], T]) -> Either[L, T]:
-        return Left[L, T](self.value)
+        # R só existe no tipo: o mesmo Left serve como Left[L, T], sem alocar
+        return cast("Left[L, T]", self)
 
     @override
     def map_left(self, f: Callable[[L], U]) -> Either[U, R]:
-        return Left[U, R](f(self.value))
+        return Left(f(self.value))
 
     @override
     def flat_map(self, f: Callable[[R], Either[L, T]]) -> Either[L, T]:
-        return Left[L, T](self.value)
+        return cast("Left[L, T]", self)
 
     @override
     def get_or_else(self, default: R) -> R:
@@ -92,23 +140,62 @@ class Left(Either[L, R]):
         return left_f(self.value)
 
 
-@dataclass(frozen=True)
 class Right(Either[L, R]):
     """Representa um sucesso na computação."""
 
-    value: R
+    # Imutável e com slots, com a mesma igualdade, hash e repr de uma
+    # dataclass frozen, mas sem importar dataclasses
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+    tag = "right"
+    value: R  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    def __init__(self, value: R) -> None:
+        # Escreve direto no slot, já que __setattr__ está bloqueado
+        _set_right_value(self, value)
+
+    @override
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    @override
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"cannot delete field {name!r}")
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return self.value == cast("Right[object, object]", other).value
+        return NotImplemented
+
+    @override
+    def __hash__(self) -> int:
+        return hash((self.value,))
+
+    @override
+    def __repr__(self) -> str:
+        return f"Right(value={self.value!r})"
+
+    @override
+    def __reduce__(self) -> tuple[type[Self], tuple[R]]:
+        return (type(self), (self.value,))
 
     @override
     def is_right(self) -> bool:
         return True
 
+    @override
+    def is_left(self) -> bool:
+        return False
+
     @override
     def map(self, f: Callable[[R], T]) -> Either[L, T]:
-        return Right[L, T](f(self.value))
+        return Right(f(self.value))
 
     @override
     def map_left(self, f: Callable[[L], U]) -> Either[U, R]:
-        return Right[U, R](self.value)
+        # L só existe no tipo: o mesmo Right serve como Right[U, R], sem alocar
+        return cast("Right[U, R]", self)
 
     @override
     def flat_map(self, f: Callable[[R], Either[L, T]]) -> Either[L, T]:
@@ -123,14 +210,18 @@ class Right(Either[L, R]):
         return right_f(self.value)
 
 
+_set_left_value = Left.__dict__["value"].__set__  # pyright: ignore[reportAny]
+_set_right_value = Right.__dict__["value"].__set__  # pyright: ignore[reportAny]
+
+
 def of_right(value: R) -> Either[object, R]:
     """Cria uma instância de Right com o valor fornecido."""
-    return Right[object, R](value)
+    return Right(value)
 
 
 def of_left(error: L) -> Either[L, object]:
     """Cria uma instância de Left com o erro fornecido."""
-    return Left[L, object](error)
+    return Left(error)
 
 
 def try_catch(f: Callable[[], R]) -> Either[Exception, R]:
@@ -140,6 +231,6 @@ def try_catch(f: Callable[[], R]) -> Either[Exception, R]:
     - Left com a exceção se falha
     """
     try:
-        return Right[Exception, R](f())
+        return Right(f())
     except Exception as e:
-        return Left[Exception, R](e)
+        return Left(e)
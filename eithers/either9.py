@@ -1,6 +1,5 @@
 from __future__ import annotations
-from typing import TypeVar, Generic, Callable, TypeAlias, override
-from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, ClassVar, Literal, NoReturn, Self, TypeVar, Generic, Callable, TypeAlias, cast, override
 
 # Definindo tipos genéricos
 L = TypeVar("L")  # Tipo do valor de Left
@@ -11,57 +10,93 @@ T = TypeVar("T")  # Tipo genérico para transformações
 Result: TypeAlias = "Left[L, R] | Right[L, R]"
 
 
-# Classe base abstrata para Either
-class Either(Generic[L, R], ABC):
-    @property
-    @abstractmethod
-    def is_left(self) -> bool:
-        pass
+# Classe base para Either
+class Either(Generic[L, R]):
+    """
+    Base comum de Left e Right.
 
-    @property
-    @abstractmethod
-    def is_right(self) -> bool:
-        pass
+    O lado é um atributo de classe, não uma propriedade: `is_left`,
+    `is_right` e `tag` custam uma leitura de atributo, sem chamada. Para
+    despachar, `match` com os padrões posicionais de Left e Right também
+    estreita o tipo para o verificador:
 
-    @abstractmethod
-    def map(self, func: Callable[[R], T]) -> Result[L, T]:
-        pass
+        match result:
+            case Right(value):
+                ...
+            case Left(error):
+                ...
 
-    @abstractmethod
-    def bind(self, func: Callable[[R], Result[L, T]]) -> Result[L, T]:
-        pass
+    No caminho quente, `result.tag == "right"` (ou `type(result) is Right`)
+    é o teste mais barato.
+    """
 
-    @abstractmethod
-    def get_or_else(self, default: R) -> R:
-        pass
+    __slots__ = ()
+    is_left: ClassVar[bool]
+    is_right: ClassVar[bool]
+    tag: ClassVar[Literal["left", "right"]]
+
+    # Sem implementação na base: estes métodos existem só para o verificador
+    # de tipos, e Left e Right definem todos eles
+    if TYPE_CHECKING:
+        def map(self, func: Callable[[R], T]) -> Result[L, T]:  # pyright: ignore[reportUnusedParameter]
+            ...
+
+        def bind(self, func: Callable[[R], Result[L, T]]) -> Result[L, T]:  # pyright: ignore[reportUnusedParameter]
+            ...
+
+        def get_or_else(self, default: R) -> R:  # pyright: ignore[reportUnusedParameter]
+            ...
 
 
 # Classe Left
 class Left(Either[L, R]):
-    value: L
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+    is_left = True
+    is_right = False
+    tag = "left"
+    value: L  # pyright: ignore[reportUninitializedInstanceVariable]
 
     def __init__(self, value: L) -> None:
-        self.value = value
+        # Escreve direto no slot, já que __setattr__ está bloqueado
+        _set_left_value(self, value)
+
+    @override
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    @override
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"cannot delete field {name!r}")
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return self.value == cast("Left[object, object]", other).value
+        return NotImplemented
 
-    @property
     @override
-    def is_left(self) -> bool:
-        return True
+    def __hash__(self) -> int:
+        return hash((self.value,))
 
-    @property
     @override
-    def is_right(self) -> bool:
-        return False
+    def __repr__(self) -> str:
+        return f"Left(value={self.value!r})"
+
+    @override
+    def __reduce__(self) -> tuple[type[Self], tuple[L]]:
+        # Só a classe e o valor: menor e mais rápido que o estado de slots padrão
+        return (type(self), (self.value,))
 
     @override
     def map(self, func: Callable[[R], T]) -> Result[L, T]:
-        # Retorna um novo Left[L, T] com o mesmo valor
-        return Left(self.value)
+        # R só existe no tipo: o mesmo Left serve como Left[L, T], sem alocar
+        return cast("Left[L, T]", self)
 
     @override
     def bind(self, func: Callable[[R], Result[L, T]]) -> Result[L, T]:
         # Left não é afetado por bind
-        return Left[L, T](self.value)
+        return cast("Left[L, T]", self)
 
     @override
     def get_or_else(self, default: R) -> R:
@@ -70,20 +105,43 @@ class Left(Either[L, R]):
 
 # Classe Right
 class Right(Either[L, R]):
-    value: R
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+    is_left = False
+    is_right = True
+    tag = "right"
+    value: R  # pyright: ignore[reportUninitializedInstanceVariable]
 
     def __init__(self, value: R) -> None:
-        self.value = value
+        # Escreve direto no slot, já que __setattr__ está bloqueado
+        _set_right_value(self, value)
+
+    @override
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    @override
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"cannot delete field {name!r}")
 
-    @property
     @override
-    def is_left(self) -> bool:
-        return False
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return self.value == cast("Right[object, object]", other).value
+        return NotImplemented
 
-    @property
     @override
-    def is_right(self) -> bool:
-        return True
+    def __hash__(self) -> int:
+        return hash((self.value,))
+
+    @override
+    def __repr__(self) -> str:
+        return f"Right(value={self.value!r})"
+
+    @override
+    def __reduce__(self) -> tuple[type[Self], tuple[R]]:
+        # Só a classe e o valor: menor e mais rápido que o estado de slots padrão
+        return (type(self), (self.value,))
 
     @override
     def map(self, func: Callable[[R], T]) -> Result[L, T]:
@@ -99,6 +157,10 @@ class Right(Either[L, R]):
         return self.value  # Retorna o valor interno
 
 
+_set_left_value = Left.__dict__["value"].__set__  # pyright: ignore[reportAny]
+_set_right_value = Right.__dict__["value"].__set__  # pyright: ignore[reportAny]
+
+
 # Funções auxiliares
 def left(value: L) -> Result[L, object]:
     return Left(value)
@@ -0,0 +1,197 @@
+from __future__ import annotations
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar, cast
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .either7 import Either, Left, Right
+
+# Define tipos genéricos para Left e Right (apenas para o type checker)
+L = TypeVar("L")  # Tipo do erro
+R = TypeVar("R")  # Tipo do sucesso
+
+
+class EitherArray(Generic[L, R]):
+    """
+    Coleção colunar de resultados Either.
+
+    Guarda uma máscara booleana `is_right`, uma coluna NumPy `values` com os
+    valores de sucesso e uma coluna de objetos `errors` com os erros. As
+    operações são vetorizadas e só tocam as linhas correspondentes: `map`
+    recebe apenas os valores das linhas Right, `map_left` apenas os erros das
+    linhas Left. O conteúdo de `values` nas linhas Left (e de `errors` nas
+    linhas Right) é indefinido.
+    """
+
+    __slots__ = ("is_right", "values", "errors")
+
+    def __init__(self, is_right: ArrayLike, values: ArrayLike, errors: ArrayLike | None = None) -> None:
+        mask = np.asarray(is_right, dtype=np.bool_)
+        column = np.asarray(values)
+        if errors is None:
+            errors = np.full(mask.shape, None, dtype=object)
+        error_column = _objects(errors)
+        if mask.ndim != 1 or column.shape[:1] != mask.shape or error_column.shape != mask.shape:
+            raise ValueError("is_right, values e errors devem ser colunas de mesmo comprimento")
+        self.is_right: NDArray[np.bool_] = mask
+        self.values: NDArray[Any] = column
+        self.errors: NDArray[np.object_] = error_column
+
+    @classmethod
+    def where(cls, ok: ArrayLike, values: ArrayLike, error: L) -> EitherArray[L, Any]:
+        """Right onde `ok` é True, Left(`error`) nas demais linhas."""
+        mask = np.asarray(ok, dtype=np.bool_)
+        errors = np.full(mask.shape, None, dtype=object)
+        _fill(errors, ~mask, error)
+        return cls(mask, values, errors)
+
+    @classmethod
+    def from_eithers(cls, items: Iterable[Either[L, R]], dtype: Any = None) -> EitherArray[L, R]:
+        """Converte uma sequência de Left/Right (either7) para a forma colunar."""
+        items = list(items)
+        mask = np.fromiter((e.is_right() for e in items), dtype=np.bool_, count=len(items))
+        values = _objects([e.value if isinstance(e, Right) else None for e in items])
+        errors = _objects([e.value if isinstance(e, Left) else None for e in items])
+        if dtype is not None:
+            column = np.zeros(len(items), dtype=dtype)
+            column[mask] = values[mask]
+            return cls(mask, column, errors)
+        return cls(mask, values, errors)
+
+    def __len__(self) -> int:
+        return len(self.is_right)
+
+    def __getitem__(self, index: int) -> Either[L, R]:
+        if self.is_right[index]:
+            return Right(self.values[index])
+        return Left(self.errors[index])
+
+    def __iter__(self) -> Iterator[Either[L, R]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"EitherArray(rights={int(self.is_right.sum())}, lefts={int((~self.is_right).sum())}, dtype={self.values.dtype})"
+
+    def to_eithers(self) -> list[Either[L, R]]:
+        """Converte de volta para uma lista de Left/Right (either7)."""
+        return list(self)
+
+    def rights(self) -> NDArray[Any]:
+        """Valores das linhas Right."""
+        return self.values[self.is_right]
+
+    def lefts(self) -> NDArray[np.object_]:
+        """Erros das linhas Left."""
+        return self.errors[~self.is_right]
+
+    def map(self, f: Callable[[NDArray[Any]], ArrayLike]) -> EitherArray[L, Any]:
+        """
+        Aplica `f` (vetorizada) aos valores das linhas Right. As linhas Left
+        mantêm o erro. `f` deve devolver uma coluna alinhada com os valores
+        recebidos; escalares não são espalhados.
+        """
+        mask = self.is_right
+        if mask.all():
+            return EitherArray(mask, _aligned(f(self.values), len(mask), "map"), self.errors)
+        rights = self.values[mask]
+        mapped = _aligned(f(rights), len(rights), "map")
+        column = np.empty(len(mask), dtype=mapped.dtype)
+        column[mask] = mapped
+        return EitherArray(mask, column, self.errors)
+
+    def bind(self, f: Callable[[NDArray[Any]], tuple[ArrayLike, ...]], error: L | None = None) -> EitherArray[L, Any]:
+        """
+        Aplica `f` aos valores das linhas Right. `f` devolve `(ok, values)` ou
+        `(ok, values, errors)`, alinhados com os valores recebidos; as linhas em
+        que `ok` é False viram Left com o erro correspondente. Na forma
+        `(ok, values)` o erro é `error`, que então é obrigatório.
+        """
+        mask = self.is_right
+        rows = np.flatnonzero(mask)
+        result = f(self.values[rows])
+        if len(result) == 2 and error is None:
+            raise ValueError("bind: informe `error` ou devolva (ok, values, errors) em f")
+        ok = _aligned(np.asarray(result[0], dtype=np.bool_), len(rows), "bind")
+        produced = _aligned(result[1], len(rows), "bind")
+
+        new_mask = mask.copy()
+        new_mask[rows[~ok]] = False
+        column = np.empty(len(mask), dtype=produced.dtype)
+        column[rows] = produced
+        errors = self.errors.copy()
+        failed = rows[~ok]
+        if len(result) > 2:
+            errors[failed] = _aligned(_objects(result[2]), len(rows), "bind")[~ok]
+        else:
+            _fill(errors, failed, error)
+        return EitherArray(new_mask, column, errors)
+
+    def map_left(self, f: Callable[[NDArray[np.object_]], ArrayLike]) -> EitherArray[Any, R]:
+        """Aplica `f` (vetorizada) aos erros das linhas Left."""
+        failed = ~self.is_right
+        errors = self.errors.copy()
+        errors[failed] = _aligned(_objects(f(self.errors[failed])), int(failed.sum()), "map_left")
+        return EitherArray(self.is_right, self.values, errors)
+
+    def fold(self, left_f: Callable[[NDArray[np.object_]], ArrayLike], right_f: Callable[[NDArray[Any]], ArrayLike]) -> NDArray[Any]:
+        """
+        Aplica `left_f` aos erros das linhas Left e `right_f` aos valores das
+        linhas Right, devolvendo uma única coluna.
+        """
+        mask = self.is_right
+        from_right = np.asarray(right_f(self.values[mask]))
+        from_left = np.asarray(left_f(self.errors[~mask]))
+        try:
+            dtype = np.result_type(from_right, from_left)
+        except TypeError:
+            dtype = np.dtype(object)
+        out = np.empty(len(mask), dtype=dtype)
+        out[mask] = from_right
+        out[~mask] = from_left
+        return out
+
+    def get_or_else(self, default: Any) -> NDArray[Any]:
+        """Valores das linhas Right, `default` nas linhas Left."""
+        return np.where(self.is_right, self.values, default)
+
+
+def _aligned(result: ArrayLike, length: int, operation: str) -> NDArray[Any]:
+    """`result` como coluna, exigindo uma linha por valor recebido."""
+    column = np.asarray(result)
+    if column.shape[:1] != (length,):
+        raise ValueError(f"{operation}: f deve devolver uma coluna com {length} linhas, não {column.shape}")
+    return column
+
+
+def _objects(items: object) -> NDArray[np.object_]:
+    """
+    Coluna de objetos com um elemento por item. `np.asarray(..., dtype=object)`
+    transformaria uma lista de tuplas de mesmo tamanho numa matriz.
+    """
+    if isinstance(items, np.ndarray):
+        return cast("NDArray[Any]", items).astype(object, copy=False)
+    listed = list(cast("Iterable[object]", items))
+    return np.fromiter(listed, dtype=object, count=len(listed))
+
+
+def _fill(errors: NDArray[np.object_], index: NDArray[Any], error: object) -> None:
+    """Põe o mesmo `error` em todas as linhas `index`, mesmo que seja uma tupla ou lista."""
+    # Dentro de um array 0-d o erro é espalhado como um objeto só, não como sequência
+    box = np.empty((), dtype=object)
+    box[()] = error
+    errors[index] = box
+
+
+_DIVISION_BY_ZERO = ZeroDivisionError("Division by zero")
+
+
+# Exemplo de uso: o `divide` de either.py sobre colunas inteiras
+def divide(a: ArrayLike, b: ArrayLike) -> EitherArray[ZeroDivisionError, float]:
+    """Divide duas colunas elemento a elemento; divisões por zero viram Left."""
+    numerator = np.asarray(a, dtype=np.float64)
+    denominator = np.asarray(b, dtype=np.float64)
+    ok = denominator != 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = numerator / denominator
+    return EitherArray.where(ok, values, _DIVISION_BY_ZERO)
@@ -0,0 +1,268 @@
+"""
+Instrumentação opcional de estágios de uma cadeia de Either.
+
+`stage(nome, f)` devolve uma versão de `f` que registra, por nome, o número
+de chamadas, quantas terminaram em Left, em Right ou com exceção, e um
+histograma de latência. Serve para qualquer combinador (`map`, `bind`,
+`flat_map` do either7/either9, Pipeline, ...):
+
+    enable()
+    result = Right(raw).map(stage("parse", parse)).flat_map(stage("lookup", lookup))
+    PrometheusExporter("/tmp/eithers.prom")(REGISTRY.snapshot())
+
+Com a instrumentação desligada (o padrão, a menos que a variável de
+ambiente EITHERS_INSTRUMENT seja "1"), `stage` devolve a própria `f`: não
+há custo nenhum. A decisão é tomada quando o estágio é criado, então ligue
+antes de montar as cadeias.
+"""
+
+from __future__ import annotations
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Protocol, TypeVar, TypedDict
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+# Limites superiores dos baldes do histograma, em segundos
+DEFAULT_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0)
+
+_INF = float("inf")
+
+
+class StageSnapshot(TypedDict):
+    calls: int
+    lefts: int
+    rights: int
+    errors: int
+    seconds: float
+    # (limite superior, contagem acumulada), como nos histogramas do Prometheus
+    buckets: list[tuple[float, int]]
+
+
+Snapshot = dict[str, StageSnapshot]
+
+
+class StageStats:
+    """Contadores de um estágio. Só são alterados com o lock do Registry."""
+
+    __slots__ = ("calls", "lefts", "rights", "errors", "total_ns", "counts")
+
+    def __init__(self, buckets: int) -> None:
+        self.calls = 0
+        self.lefts = 0
+        self.rights = 0
+        self.errors = 0
+        self.total_ns = 0
+        # Um contador por balde mais o +Inf
+        self.counts = [0] * (buckets + 1)
+
+
+class Registry:
+    """Estatísticas de todos os estágios, por nome."""
+
+    __slots__ = ("buckets", "_bounds_ns", "_stages", "_lock")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self._bounds_ns = [int(bound * 1e9) for bound in buckets]
+        self._stages: dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, elapsed_ns: int, outcome: str) -> None:
+        """Registra uma chamada de `name`; `outcome` é "left", "right" ou "error"."""
+        bucket = bisect_left(self._bounds_ns, elapsed_ns)
+        with self._lock:
+            stats = self._stages.get(name)
+            if stats is None:
+                stats = self._stages[name] = StageStats(len(self.buckets))
+            stats.calls += 1
+            stats.total_ns += elapsed_ns
+            stats.counts[bucket] += 1
+            if outcome == "right":
+                stats.rights += 1
+            elif outcome == "left":
+                stats.lefts += 1
+            else:
+                stats.errors += 1
+
+    def snapshot(self) -> Snapshot:
+        """Cópia dos contadores atuais, pronta para os exportadores."""
+        with self._lock:
+            result: Snapshot = {}
+            for name, stats in self._stages.items():
+                cumulative = 0
+                buckets: list[tuple[float, int]] = []
+                for bound, count in zip((*self.buckets, _INF), stats.counts):
+                    cumulative += count
+                    buckets.append((bound, cumulative))
+                result[name] = StageSnapshot(
+                    calls=stats.calls,
+                    lefts=stats.lefts,
+                    rights=stats.rights,
+                    errors=stats.errors,
+                    seconds=stats.total_ns / 1e9,
+                    buckets=buckets,
+                )
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+
+
+# Registro usado por `stage` quando nenhum outro é informado
+REGISTRY = Registry()
+
+_enabled = os.environ.get("EITHERS_INSTRUMENT") == "1"
+
+
+def enable() -> None:
+    """Liga a instrumentação para os estágios criados daqui em diante."""
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Desliga a instrumentação para os estágios criados daqui em diante."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def stage(name: str, f: Callable[[T], U], registry: Registry | None = None) -> Callable[[T], U]:
+    """
+    Versão instrumentada de `f` com o nome `name`, ou a própria `f` se a
+    instrumentação estiver desligada.
+
+    O resultado conta como Left ou Right pelo `tag` do Either devolvido
+    (estágios de `bind`); qualquer outro valor (estágios de `map`) conta
+    como Right. Exceções são contadas e propagadas.
+    """
+    if not _enabled:
+        return f
+    target = registry if registry is not None else REGISTRY
+    record = target.record
+    clock = time.perf_counter_ns
+
+    def wrapper(value: T) -> U:
+        start = clock()
+        try:
+            result = f(value)
+        except BaseException:
+            record(name, clock() - start, "error")
+            raise
+        record(name, clock() - start, "left" if getattr(result, "tag", None) == "left" else "right")
+        return result
+
+    wrapper.__name__ = wrapper.__qualname__ = f"stage_{name}"
+    return wrapper
+
+
+def instrumented(name: str, registry: Registry | None = None) -> Callable[[Callable[[T], U]], Callable[[T], U]]:
+    """Forma de decorador de `stage`."""
+
+    def decorate(f: Callable[[T], U]) -> Callable[[T], U]:
+        return stage(name, f, registry)
+
+    return decorate
+
+
+def to_json(snapshot: Snapshot) -> str:
+    """Snapshot em JSON, com a proporção de Left de cada estágio. O último balde tem limite "+Inf"."""
+    payload = {
+        name: {
+            **stats,
+            "buckets": [[bound if bound != _INF else "+Inf", count] for bound, count in stats["buckets"]],
+            "left_ratio": stats["lefts"] / stats["calls"] if stats["calls"] else 0.0,
+        }
+        for name, stats in snapshot.items()
+    }
+    return json.dumps(payload, indent=2)
+
+
+def _label(name: str) -> str:
+    return name.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _bound(value: float) -> str:
+    return "+Inf" if value == _INF else repr(value)
+
+
+def to_prometheus(snapshot: Snapshot, prefix: str = "eithers_stage") -> str:
+    """Snapshot no formato de texto do Prometheus (contadores e histograma)."""
+    lines = [
+        f"# HELP {prefix}_calls_total Chamadas de cada estágio.",
+        f"# TYPE {prefix}_calls_total counter",
+    ]
+    for name, stats in snapshot.items():
+        lines.append(f'{prefix}_calls_total{{stage="{_label(name)}"}} {stats["calls"]}')
+    lines += [
+        f"# HELP {prefix}_results_total Resultados de cada estágio por lado.",
+        f"# TYPE {prefix}_results_total counter",
+    ]
+    for name, stats in snapshot.items():
+        label = _label(name)
+        for outcome in ("lefts", "rights", "errors"):
+            lines.append(f'{prefix}_results_total{{stage="{label}",outcome="{outcome[:-1]}"}} {stats[outcome]}')
+    lines += [
+        f"# HELP {prefix}_latency_seconds Latência de cada estágio.",
+        f"# TYPE {prefix}_latency_seconds histogram",
+    ]
+    for name, stats in snapshot.items():
+        label = _label(name)
+        for bound, count in stats["buckets"]:
+            lines.append(f'{prefix}_latency_seconds_bucket{{stage="{label}",le="{_bound(bound)}"}} {count}')
+        lines.append(f'{prefix}_latency_seconds_sum{{stage="{label}"}} {stats["seconds"]!r}')
+        lines.append(f'{prefix}_latency_seconds_count{{stage="{label}"}} {stats["calls"]}')
+    return "\n".join(lines) + "\n"
+
+
+class Exporter(Protocol):
+    """Qualquer callable que receba um snapshot serve como exportador."""
+
+    def __call__(self, snapshot: Snapshot) -> None: ...
+
+
+def _write_atomic(path: str, text: str) -> None:
+    # Escreve ao lado e renomeia, para quem lê o arquivo nunca ver meio snapshot
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fp:
+        _ = fp.write(text)
+    os.replace(tmp, path)
+
+
+class JsonExporter:
+    """Grava o snapshot em JSON em `path`, substituindo o conteúdo anterior."""
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __call__(self, snapshot: Snapshot) -> None:
+        _write_atomic(self.path, to_json(snapshot))
+
+
+class PrometheusExporter:
+    """Grava o snapshot no formato de texto do Prometheus em `path`."""
+
+    __slots__ = ("path", "prefix")
+
+    def __init__(self, path: str, prefix: str = "eithers_stage") -> None:
+        self.path = path
+        self.prefix = prefix
+
+    def __call__(self, snapshot: Snapshot) -> None:
+        _write_atomic(self.path, to_prometheus(snapshot, self.prefix))
+
+
+def export(exporter: Exporter, registry: Registry | None = None) -> None:
+    """Entrega o snapshot atual de `registry` (padrão: REGISTRY) a `exporter`."""
+    exporter((registry if registry is not None else REGISTRY).snapshot())
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, TypeAlias, TypeVar, Generic, Callable
+from typing import Any, ClassVar, Literal, NoReturn, TypeAlias, TypeVar, Generic, Callable, cast, override
 
 L = TypeVar("L")
 R = TypeVar("R")
@@ -7,10 +7,42 @@ T = TypeVar("T")
 
 
 class Left(Generic[L]):
-    value: L
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+    # Discriminador da união Either: `x.tag == "left"` estreita o tipo sem chamada
+    tag: ClassVar[Literal["left"]] = "left"
+    value: L  # pyright: ignore[reportUninitializedInstanceVariable]
 
     def __init__(self, value: L) -> None:
-        self.value = value
+        # Escreve direto no slot, já que __setattr__ está bloqueado
+        _set_left_value(self, value)
+
+    @override
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    @override
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"cannot delete field {name!r}")
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return self.value == cast("Left[object]", other).value
+        return NotImplemented
+
+    @override
+    def __hash__(self) -> int:
+        return hash((self.value,))
+
+    @override
+    def __repr__(self) -> str:
+        return f"Left(value={self.value!r})"
+
+    @override
+    def __reduce__(self) -> tuple[type[Left[L]], tuple[L]]:
+        # O padrão de pickle para slots usaria setattr, que está bloqueado
+        return (type(self), (self.value,))
 
     def is_left(self) -> bool:
         return True
@@ -29,10 +61,41 @@ class Left(Generic[L]):
 
 
 class Right(Generic[R]):
-    value: R
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+    tag: ClassVar[Literal["right"]] = "right"
+    value: R  # pyright: ignore[reportUninitializedInstanceVariable]
 
     def __init__(self, value: R) -> None:
-        self.value = value
+        # Escreve direto no slot, já que __setattr__ está bloqueado
+        _set_right_value(self, value)
+
+    @override
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    @override
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"cannot delete field {name!r}")
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return self.value == cast("Right[object]", other).value
+        return NotImplemented
+
+    @override
+    def __hash__(self) -> int:
+        return hash((self.value,))
+
+    @override
+    def __repr__(self) -> str:
+        return f"Right(value={self.value!r})"
+
+    @override
+    def __reduce__(self) -> tuple[type[Right[R]], tuple[R]]:
+        # O padrão de pickle para slots usaria setattr, que está bloqueado
+        return (type(self), (self.value,))
 
     def is_left(self) -> bool:
         return False
@@ -50,6 +113,10 @@ class Right(Generic[R]):
         return self.value if self.value is not None else default
 
 
+_set_left_value = Left.__dict__["value"].__set__  # pyright: ignore[reportAny]
+_set_right_value = Right.__dict__["value"].__set__  # pyright: ignore[reportAny]
+
+
 Either: TypeAlias = Left[L] | Right[R]
 
 
@@ -61,4 +128,5 @@ def right(value: R) -> Either[L, R]:
     return Right(value)
 
 
-x = left(ValueError)
+if __name__ == "__main__":
+    x = left(ValueError)
@@ -0,0 +1,166 @@
+"""
+`map` e `traverse` do either7 em um pool de processos, para passos que
+gastam CPU (parsing, hashing, compressão) e não ganham nada com threads.
+
+    hashes = par_map(files, sha256_of, chunk_size=64)
+    records = par_traverse(lines, parse_line)
+
+Os valores dos Right são enviados aos processos em blocos de `chunk_size`
+itens, e os resultados voltam na ordem de entrada. Os Left de `par_map`
+não saem do processo atual: ficam na mesma posição, sem serialização. As
+funções e os valores precisam ser serializáveis com pickle (funções
+definidas no nível do módulo, não lambdas). Blocos maiores diluem o custo
+de envio; blocos menores equilibram melhor a carga entre os processos.
+"""
+
+from __future__ import annotations
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Callable, Generator, Iterable, Iterator, TypeVar, cast
+
+from .either7 import Either, Left, Right
+
+L = TypeVar("L")  # Tipo do erro
+R = TypeVar("R")  # Tipo do sucesso
+T = TypeVar("T")  # Tipo dos itens de entrada / resultado de map
+C = TypeVar("C")  # Tipo do resultado de cada bloco
+F = TypeVar("F")  # Tipo da função enviada aos processos
+
+# Itens enviados por vez a um processo
+DEFAULT_CHUNK_SIZE = 256
+
+_default_executor: ProcessPoolExecutor | None = None
+_default_lock = threading.Lock()
+
+
+def default_executor() -> ProcessPoolExecutor:
+    """Pool de processos compartilhado (um por CPU), criado no primeiro uso."""
+    global _default_executor
+    if _default_executor is None:
+        with _default_lock:
+            if _default_executor is None:
+                _default_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _default_executor
+
+
+def _map_chunk(f: Callable[[R], T], values: list[R]) -> list[T]:
+    return [f(value) for value in values]
+
+
+def _traverse_chunk(f: Callable[[T], Either[L, R]], items: list[T]) -> tuple[list[R], Either[L, R] | None]:
+    # Para no primeiro Left do bloco; os valores antes dele não são usados
+    values: list[R] = []
+    append = values.append
+    for item in items:
+        either = f(item)
+        if type(either) is not Right:
+            return values, either
+        append(cast("Right[L, R]", either).value)
+    return values, None
+
+
+def _chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    chunk: list[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _run_chunks(pool: Executor, worker: Callable[[F, list[T]], C], f: F, chunks: Iterator[list[T]], max_in_flight: int) -> Generator[C, None, None]:
+    """
+    Resultados de `worker(f, chunk)` na ordem dos blocos, com no máximo
+    `max_in_flight` blocos submetidos; ao parar antes do fim, cancela o resto.
+    """
+    pending: list[Future[C]] = []
+    try:
+        for chunk in chunks:
+            pending.append(pool.submit(worker, f, chunk))
+            if len(pending) >= max_in_flight:
+                yield pending.pop(0).result()
+        while pending:
+            yield pending.pop(0).result()
+    finally:
+        for future in pending:
+            _ = future.cancel()
+
+
+def _in_flight(max_in_flight: int | None, workers: int | None) -> int:
+    if max_in_flight is not None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight deve ser pelo menos 1")
+        return max_in_flight
+    if workers is not None and workers < 1:
+        raise ValueError("workers deve ser pelo menos 1")
+    # Dois blocos por processo: um executando e outro já na fila
+    return 2 * (workers or os.cpu_count() or 1)
+
+
+def par_map(
+    eithers: Iterable[Either[L, R]],
+    f: Callable[[R], T],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor | None = None,
+    workers: int | None = None,
+    max_in_flight: int | None = None,
+) -> list[Either[L, T]]:
+    """
+    Equivalente a `[either.map(f) for either in eithers]`, com `f` executada
+    em um pool de processos (o compartilhado, se `executor` não for informado).
+
+    Só os valores dos Right são enviados; cada Left continua na sua posição.
+    Exceções de `f` são propagadas, como em `Right.map`.
+
+    `workers` é o número de processos de `executor` (padrão: `os.cpu_count()`,
+    o tamanho do pool compartilhado); sem `max_in_flight`, ficam no máximo
+    dois blocos por processo submetidos de cada vez.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size deve ser pelo menos 1")
+    pool = executor if executor is not None else default_executor()
+    results: list[Either[L, T]] = list(cast("Iterable[Either[L, T]]", eithers))
+    positions = [index for index, either in enumerate(results) if type(either) is Right]
+    values = (cast("Right[L, R]", results[index]).value for index in positions)
+    chunks = _run_chunks(pool, _map_chunk, f, _chunked(values, chunk_size), _in_flight(max_in_flight, workers))
+    start = 0
+    for mapped in chunks:
+        for index, value in zip(positions[start : start + len(mapped)], mapped):
+            results[index] = Right(value)
+        start += len(mapped)
+    return results
+
+
+def par_traverse(
+    items: Iterable[T],
+    f: Callable[[T], Either[L, R]],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor | None = None,
+    workers: int | None = None,
+    max_in_flight: int | None = None,
+) -> Either[L, list[R]]:
+    """
+    `traverse` em paralelo: aplica `f` a cada item em um pool de processos e
+    devolve Right com os valores na ordem de entrada, ou o primeiro Left (na
+    ordem de entrada, não de término). Depois de um Left, os blocos que
+    ainda não começaram são cancelados e a entrada deixa de ser consumida.
+    `workers` e `max_in_flight` funcionam como em `par_map`.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size deve ser pelo menos 1")
+    pool = executor if executor is not None else default_executor()
+    values: list[R] = []
+    chunks: Generator[tuple[list[R], Either[L, R] | None], None, None] = _run_chunks(pool, _traverse_chunk, f, _chunked(items, chunk_size), _in_flight(max_in_flight, workers))
+    try:
+        for chunk_values, left in chunks:
+            if left is not None:
+                return cast("Left[L, list[R]]", left)
+            values.extend(chunk_values)
+    finally:
+        chunks.close()
+    return Right(values)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+import threading
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar, cast
+
+from . import provenance
+from .either9 import Left, Result, Right
+
+# Definindo tipos genéricos
+L = TypeVar("L")  # Tipo do valor de Left
+R = TypeVar("R")  # Tipo do valor de Right na entrada
+T = TypeVar("T")  # Tipo do valor de Right na saída
+U = TypeVar("U")  # Tipo genérico para transformações
+
+# Um estágio compilado: (é bind?, função, posição da operação em `_ops`)
+_Stage = tuple[bool, Callable[[Any], Any], int]
+
+# Serializa a primeira compilação de cada Pipeline; depois dela o plano só é lido
+_compile_lock = threading.Lock()
+
+
+def _fuse(funcs: tuple[Callable[[Any], Any], ...]) -> Callable[[Any], Any]:
+    """Junta uma sequência de funções de map em uma só."""
+    if len(funcs) == 1:
+        return funcs[0]
+
+    def fused(value: Any) -> Any:
+        for func in funcs:
+            value = func(value)
+        return value
+
+    return fused
+
+
+class Pipeline(Generic[L, R, T]):
+    """
+    Cadeia preguiçosa de map/bind sobre o Either do either9.
+
+    `map` e `bind` só registram a operação e devolvem um novo Pipeline; nada
+    é executado até o pipeline ser aplicado a um Either. Na primeira execução
+    os maps consecutivos são fundidos em uma única função, e a cadeia inteira
+    roda sobre o valor cru, sem criar um Right intermediário por estágio. O
+    mesmo Pipeline pode ser reutilizado para qualquer número de entradas,
+    inclusive de várias threads.
+
+    O ganho vem de fundir maps e de pular os Right intermediários. Uma
+    cadeia de um estágio só não tem o que economizar e paga a chamada a mais
+    do Pipeline (1,5 a 2x o tempo do encadeamento direto), e uma cadeia só
+    de binds cria um Either por estágio de qualquer jeito e empata com ele.
+    Nesses casos, prefira chamar `map`/`bind` no Either.
+
+        parse = Pipeline[str, str, str]().map(str.strip).map(int).bind(positive)
+        parse(Right(" 42 "))  # Right(42)
+    """
+
+    __slots__ = ("_ops", "_plan")
+
+    def __init__(self, ops: tuple[tuple[bool, Callable[[Any], Any]], ...] = ()) -> None:
+        self._ops = ops
+        self._plan: tuple[_Stage, ...] | None = None
+
+    def map(self, func: Callable[[T], U]) -> Pipeline[L, R, U]:
+        """Registra uma transformação do valor de sucesso."""
+        return Pipeline(self._ops + ((False, func),))
+
+    def bind(self, func: Callable[[T], Result[L, U]]) -> Pipeline[L, R, U]:
+        """Registra uma operação que pode falhar (retorna um Either)."""
+        return Pipeline(self._ops + ((True, func),))
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    def _compile(self) -> tuple[_Stage, ...]:
+        with _compile_lock:
+            # Outra thread pode ter compilado enquanto esta esperava o lock
+            if self._plan is not None:
+                return self._plan
+            plan: list[_Stage] = []
+            pending: list[Callable[[Any], Any]] = []
+            for index, (is_bind, func) in enumerate(self._ops):
+                if not is_bind:
+                    pending.append(func)
+                    continue
+                if pending:
+                    plan.append((False, _fuse(tuple(pending)), index - len(pending)))
+                    pending = []
+                plan.append((True, func, index))
+            if pending:
+                plan.append((False, _fuse(tuple(pending)), len(self._ops) - len(pending)))
+            self._plan = tuple(plan)
+            return self._plan
+
+    def __call__(self, either: Result[L, R]) -> Result[L, T]:
+        """Executa a cadeia sobre `either`. Um Left é devolvido sem passar por nenhum estágio."""
+        # Atributo de classe: vale também para subclasses de Right
+        if either.is_right:
+            return self.run_value(cast("Right[L, R]", either).value)
+        return cast("Left[L, T]", either)
+
+    def run_value(self, value: R) -> Result[L, T]:
+        """Executa a cadeia sobre um valor de sucesso cru."""
+        plan = self._plan if self._plan is not None else self._compile()
+        current: Any = value
+        result: Any = None
+        for is_bind, func, step in plan:
+            if is_bind:
+                result = func(current)
+                # `is_left` é atributo de classe: uma leitura, e vale para subclasses como TracedLeft
+                if result.is_left:
+                    if provenance.is_enabled():
+                        return provenance.trace(result, func, step=step)
+                    return result
+                current = result.value
+            else:
+                current = func(current)
+                result = None
+        # Se o último estágio foi um bind, o Either dele já é a resposta
+        if result is not None:
+            return result
+        return Right(current)
+
+    def run_many(self, items: Iterable[Result[L, R]]) -> Iterator[Result[L, T]]:
+        """Aplica a cadeia a cada Either de `items`, preguiçosamente."""
+        for either in items:
+            yield self(either)
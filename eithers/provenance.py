@@ -0,0 +1,158 @@
+"""
+Modo de proveniência para o either9: um Left produzido por um estágio
+marcado vira um `TracedLeft`, que guarda em `origin` a função que o criou
+e, opcionalmente, de onde o `bind` foi chamado. No Pipeline, todo estágio é
+marcado e `origin.step` é a posição da operação na cadeia.
+
+    provenance.enable(call_sites=True)
+    parse, validate, save = traced(parse, 0), traced(validate, 1), traced(save, 2)
+    result = Right(raw).bind(parse).bind(validate).bind(save)
+    if result.is_left:
+        print(origin_of(result))  # Origin(validate, step=1, site='app.py:42')
+
+O either9 não muda: Left e Right continuam sem campo de origem, e o
+`bind` é o mesmo ligado ou desligado. A origem só existe no TracedLeft,
+criado no caminho de falha com a proveniência ligada; o Left devolvido pelo
+estágio não é alterado, então um Left compartilhado entre chamadas não
+carrega a origem de ninguém. Um TracedLeft segue pelo resto da cadeia como
+qualquer Left, fica com a origem do primeiro estágio que falhou e é igual
+(com o mesmo hash) a um Left com o mesmo valor.
+
+Como `instrument.stage`, `traced` decide na hora de marcar: com a
+proveniência desligada, devolve a própria função, sem custo nenhum por
+passo. Marque os estágios depois de `enable`.
+"""
+
+from __future__ import annotations
+import sys
+from typing import Any, Callable, Self, TypeVar, cast, override
+
+from .either9 import Left, Result, Right
+
+L = TypeVar("L")  # Tipo do valor de Left
+R = TypeVar("R")  # Tipo do valor de Right
+T = TypeVar("T")  # Tipo do valor de entrada de um estágio
+
+
+class Origin:
+    """Estágio que produziu um Left."""
+
+    __slots__ = ("func", "step", "site")
+
+    def __init__(self, func: Callable[..., object], step: int | None = None, site: str | None = None) -> None:
+        self.func = func
+        # Posição da operação no Pipeline, ou o `step` dado a `traced`
+        self.step = step
+        # "arquivo:linha" de quem chamou o bind, se os call sites estiverem ligados
+        self.site = site
+
+    @property
+    def qualname(self) -> str:
+        return getattr(self.func, "__qualname__", repr(self.func))
+
+    @override
+    def __repr__(self) -> str:
+        parts = [self.qualname]
+        if self.step is not None:
+            parts.append(f"step={self.step}")
+        if self.site is not None:
+            parts.append(f"site={self.site!r}")
+        return f"Origin({', '.join(parts)})"
+
+
+class TracedLeft(Left[L, R]):
+    """Left com a origem registrada; só é criado com a proveniência ligada."""
+
+    __slots__ = ("origin",)
+    origin: Origin  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    def __init__(self, value: L, origin: Origin) -> None:
+        super().__init__(value)
+        _set_origin(self, origin)
+
+    # Igual a um Left com o mesmo valor: ligar a proveniência não muda
+    # igualdade, hash nem o comportamento em dicts e sets
+    @override
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Left):
+            return self.value == cast("Left[object, object]", other).value
+        return NotImplemented
+
+    @override
+    def __hash__(self) -> int:
+        return hash((self.value,))
+
+    @override
+    def __repr__(self) -> str:
+        return f"TracedLeft(value={self.value!r}, origin={self.origin!r})"
+
+    @override
+    def __reduce__(self) -> tuple[type[Self], tuple[L, Origin]]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return (type(self), (self.value, self.origin))
+
+
+_set_origin = TracedLeft.__dict__["origin"].__set__  # pyright: ignore[reportAny]
+
+_enabled = False
+_call_sites = False
+# Código do `Right.bind`, pulado ao procurar quem chamou o bind
+_BIND_CODE = Right.bind.__code__
+
+
+def enable(call_sites: bool = False) -> None:
+    """
+    Liga a proveniência nos estágios marcados com `traced` e no Pipeline.
+    Com `call_sites`, `traced` guarda também o arquivo e a linha do `bind`
+    que produziu o Left.
+    """
+    global _enabled, _call_sites
+    _enabled = True
+    _call_sites = call_sites
+
+
+def disable() -> None:
+    global _enabled, _call_sites
+    _enabled = False
+    _call_sites = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def trace(left: Left[L, R], func: Callable[..., object], step: int | None = None, site: str | None = None) -> Left[L, R]:
+    """`left` como TracedLeft vindo de `func`; um TracedLeft já marcado é devolvido como está."""
+    if isinstance(left, TracedLeft):
+        return left
+    return TracedLeft(left.value, Origin(func, step, site))
+
+
+def traced(func: Callable[[T], Result[L, R]], step: int | None = None) -> Callable[[T], Result[L, R]]:
+    """
+    Marca um estágio de `bind` na posição `step` da cadeia: um Left
+    devolvido por `func` sai como TracedLeft com a origem. Com a
+    proveniência desligada, devolve a própria `func`.
+    """
+    if not _enabled:
+        return func
+
+    def stage(value: T) -> Result[L, R]:
+        result = func(value)
+        if not isinstance(result, Left):
+            return result
+        site = None
+        if _call_sites:
+            caller = sys._getframe(1)  # pyright: ignore[reportPrivateUsage]
+            if caller.f_code is _BIND_CODE and caller.f_back is not None:
+                caller = caller.f_back
+            site = f"{caller.f_code.co_filename}:{caller.f_lineno}"
+        return trace(result, func, step, site)
+
+    stage.__name__ = stage.__qualname__ = f"traced_{getattr(func, '__name__', 'stage')}"
+    stage.__wrapped__ = func  # pyright: ignore[reportFunctionMemberAccess]
+    return stage
+
+
+def origin_of(either: Result[Any, Any]) -> Origin | None:
+    """Origem de um Left (None para Right ou para Left sem origem registrada)."""
+    return either.origin if isinstance(either, TracedLeft) else None
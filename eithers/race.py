@@ -0,0 +1,163 @@
+"""
+"Primeiro Right vence" entre fontes equivalentes (réplicas de um backend).
+
+    user = race([lambda: replica_a.get(id), lambda: replica_b.get(id)])
+    user = hedge(sources, delay=0.01)
+
+Cada fonte é uma função sem argumentos que devolve um Either do either7.
+`race` chama todas de uma vez; `hedge` chama a primeira e só aciona a
+próxima se nenhuma resposta chegar em `delay` segundos (ou assim que uma
+fonte falhar), o que corta a cauda de latência sem multiplicar a carga.
+O primeiro Right é devolvido e as fontes restantes são canceladas: as que
+ainda não começaram nunca rodam; nas versões async (`arace`, `ahedge`) as
+que estão rodando recebem CancelledError. Threads já em execução não podem
+ser interrompidas, então terminam em segundo plano e o resultado é
+descartado. Se todas falharem, o resultado é um Left com a lista dos erros
+na ordem das fontes. Exceções de uma fonte contam como falha (o erro é a
+exceção).
+"""
+
+from __future__ import annotations
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Awaitable, Callable, Iterable, TypeVar, cast
+
+from .either7 import Either, Left, Right
+from .threaded import default_executor
+
+L = TypeVar("L")  # Tipo do erro de cada fonte
+R = TypeVar("R")  # Tipo do sucesso
+
+
+def _attempt(source: Callable[[], Either[L, R]]) -> Either[L | Exception, R]:
+    try:
+        return cast("Either[L | Exception, R]", source())
+    except Exception as e:
+        return Left(e)
+
+
+async def _aattempt(source: Callable[[], Awaitable[Either[L, R]]]) -> Either[L | Exception, R]:
+    try:
+        return cast("Either[L | Exception, R]", await source())
+    except Exception as e:
+        return Left(e)
+
+
+def _failed(errors: dict[int, L | Exception]) -> Either[list[L | Exception], R]:
+    return Left([errors[index] for index in sorted(errors)])
+
+
+def race(
+    sources: Iterable[Callable[[], Either[L, R]]],
+    *,
+    hedge_delay: float = 0.0,
+    executor: Executor | None = None,
+) -> Either[list[L | Exception], R]:
+    """
+    Executa as fontes em um pool de threads (o compartilhado, se `executor`
+    não for informado) e devolve o primeiro Right. Com `hedge_delay` > 0,
+    cada fonte só é acionada se a anterior não responder nesse tempo ou falhar.
+    """
+    pending = list(sources)
+    if not pending:
+        raise ValueError("é preciso pelo menos uma fonte")
+    pool = executor if executor is not None else default_executor()
+    running: dict[Future[Either[L | Exception, R]], int] = {}
+    errors: dict[int, L | Exception] = {}
+    launched = 0
+
+    def launch() -> None:
+        nonlocal launched
+        running[pool.submit(_attempt, pending[launched])] = launched
+        launched += 1
+
+    launch()
+    if hedge_delay <= 0:
+        while launched < len(pending):
+            launch()
+    try:
+        while running:
+            done, _ = wait(running, timeout=hedge_delay if launched < len(pending) else None, return_when=FIRST_COMPLETED)
+            if not done:
+                # Ninguém respondeu a tempo: aciona a próxima fonte
+                launch()
+                continue
+            for future in done:
+                index = running.pop(future)
+                result = future.result()
+                if type(result) is Right:
+                    return cast("Right[list[L | Exception], R]", result)
+                errors[index] = cast("Left[L | Exception, R]", result).value
+                if launched < len(pending):
+                    launch()
+        return _failed(errors)
+    finally:
+        for future in running:
+            _ = future.cancel()
+
+
+def hedge(
+    sources: Iterable[Callable[[], Either[L, R]]],
+    delay: float,
+    *,
+    executor: Executor | None = None,
+) -> Either[list[L | Exception], R]:
+    """`race` com as fontes acionadas uma a uma, a cada `delay` segundos sem resposta."""
+    if delay <= 0:
+        raise ValueError("delay deve ser positivo; use race para acionar todas as fontes juntas")
+    return race(sources, hedge_delay=delay, executor=executor)
+
+
+async def arace(
+    sources: Iterable[Callable[[], Awaitable[Either[L, R]]]],
+    *,
+    hedge_delay: float = 0.0,
+) -> Either[list[L | Exception], R]:
+    """Versão async de `race`: cada fonte vira uma task, e as perdedoras são canceladas."""
+    pending = list(sources)
+    if not pending:
+        raise ValueError("é preciso pelo menos uma fonte")
+    running: dict[asyncio.Task[Either[L | Exception, R]], int] = {}
+    errors: dict[int, L | Exception] = {}
+    launched = 0
+
+    def launch() -> None:
+        nonlocal launched
+        running[asyncio.ensure_future(_aattempt(pending[launched]))] = launched
+        launched += 1
+
+    launch()
+    if hedge_delay <= 0:
+        while launched < len(pending):
+            launch()
+    try:
+        while running:
+            done, _ = await asyncio.wait(running, timeout=hedge_delay if launched < len(pending) else None, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                launch()
+                continue
+            for task in done:
+                index = running.pop(task)
+                result = task.result()
+                if type(result) is Right:
+                    return cast("Right[list[L | Exception], R]", result)
+                errors[index] = cast("Left[L | Exception, R]", result).value
+                if launched < len(pending):
+                    launch()
+        return _failed(errors)
+    finally:
+        for task in running:
+            _ = task.cancel()
+        if running:
+            # Espera o cancelamento terminar, para nenhuma task ficar solta
+            _ = await asyncio.gather(*running, return_exceptions=True)
+
+
+async def ahedge(
+    sources: Iterable[Callable[[], Awaitable[Either[L, R]]]],
+    delay: float,
+) -> Either[list[L | Exception], R]:
+    """Versão async de `hedge`."""
+    if delay <= 0:
+        raise ValueError("delay deve ser positivo; use arace para acionar todas as fontes juntas")
+    return await arace(sources, hedge_delay=delay)
@@ -0,0 +1,341 @@
+"""
+Executor em estágios para cadeias de `bind` do either9 com custos muito
+diferentes (ler → parsear → enriquecer → gravar).
+
+Cada estágio roda em suas próprias threads e os estágios são ligados por
+filas limitadas: enquanto um item é gravado, o seguinte já está sendo
+enriquecido e outro sendo lido. Quando uma fila enche, o estágio anterior
+espera (backpressure), então a memória fica limitada mesmo com entrada
+infinita. Um Left vai direto para a saída, sem passar pelos estágios
+restantes.
+
+    executor = StagedExecutor(
+        Stage("read", read, workers=8),
+        Stage("parse", parse, workers=2),
+        Stage("write", write, workers=4),
+    )
+    for result in executor.run(Right(path) for path in paths):
+        ...
+    executor.bottleneck()  # "parse"
+
+`metrics()` mostra, por estágio, a profundidade da fila de entrada, o tempo
+ocupado, o tempo ocioso (esperando o estágio anterior), o tempo parado
+com a fila seguinte cheia (esperando o estágio seguinte) e a capacidade
+estimada. O gargalo é o estágio de menor capacidade.
+"""
+
+from __future__ import annotations
+import queue
+import threading
+import time
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar, TypedDict, cast, override
+
+from .either9 import Result
+
+L = TypeVar("L")  # Tipo do valor de Left
+R = TypeVar("R")  # Tipo do valor de Right na entrada
+T = TypeVar("T")  # Tipo do valor de Right na saída
+
+# Vagas da fila de entrada de cada estágio
+DEFAULT_QUEUE_SIZE = 64
+
+# Intervalo com que threads bloqueadas verificam se a execução foi cancelada
+_POLL_SECONDS = 0.05
+
+# Marca de fim da entrada, repassada de estágio em estágio
+_DONE: Any = object()
+
+
+class Stage:
+    """Um estágio: nome, função (valor -> Either) e número de threads."""
+
+    __slots__ = ("name", "func", "workers")
+
+    def __init__(self, name: str, func: Callable[[Any], Result[Any, Any]], workers: int = 1) -> None:
+        if workers < 1:
+            raise ValueError("workers deve ser pelo menos 1")
+        self.name = name
+        self.func = func
+        self.workers = workers
+
+    @override
+    def __repr__(self) -> str:
+        return f"Stage({self.name!r}, workers={self.workers})"
+
+
+class StageMetrics(TypedDict):
+    workers: int
+    processed: int
+    lefts: int
+    queue_size: int
+    # Itens esperando na fila de entrada agora, e o máximo visto
+    queue_depth: int
+    max_queue_depth: int
+    # Somados entre as threads do estágio
+    busy_seconds: float
+    idle_seconds: float
+    stalled_seconds: float
+    # busy / (busy + idle + stalled)
+    utilization: float
+    # Itens por segundo se o estágio nunca esperasse: workers × processed / busy
+    capacity: float
+
+
+class _WorkerStats:
+    """Contadores de uma thread; só ela escreve, então não há lock."""
+
+    __slots__ = ("processed", "lefts", "busy", "idle", "stalled")
+
+    def __init__(self) -> None:
+        self.processed = 0
+        self.lefts = 0
+        self.busy = 0.0
+        self.idle = 0.0
+        self.stalled = 0.0
+
+
+class _Cancelled(Exception):
+    pass
+
+
+class _Run:
+    """Estado de uma execução: filas, threads, contadores e cancelamento."""
+
+    __slots__ = ("stages", "queues", "output", "slots", "cancelled", "error", "workers", "max_depth", "remaining", "lock")
+
+    def __init__(self, stages: tuple[Stage, ...], queue_size: int, max_in_flight: int) -> None:
+        self.stages = stages
+        self.queues: list[queue.Queue[Any]] = [queue.Queue(queue_size) for _ in stages]
+        self.output: queue.Queue[Any] = queue.Queue(queue_size)
+        self.slots = threading.BoundedSemaphore(max_in_flight)
+        self.cancelled = threading.Event()
+        self.error: BaseException | None = None
+        self.workers: list[list[_WorkerStats]] = [[] for _ in stages]
+        self.max_depth = [0] * len(stages)
+        # Threads ainda vivas por estágio; a última repassa o fim adiante
+        self.remaining = [stage.workers for stage in stages]
+        self.lock = threading.Lock()
+
+    def fail(self, error: BaseException) -> None:
+        with self.lock:
+            if self.error is None:
+                self.error = error
+        self.cancelled.set()
+
+    def put(self, target: int, item: Any, stats: _WorkerStats | None) -> None:
+        """Põe `item` na fila do estágio `target` (ou na saída, se for o último)."""
+        if target == len(self.queues):
+            box = self.output
+        else:
+            box = self.queues[target]
+        try:
+            box.put_nowait(item)
+        except queue.Full:
+            start = time.perf_counter()
+            while True:
+                if self.cancelled.is_set():
+                    raise _Cancelled from None
+                try:
+                    box.put(item, timeout=_POLL_SECONDS)
+                    break
+                except queue.Full:
+                    pass
+            if stats is not None:
+                stats.stalled += time.perf_counter() - start
+        if target < len(self.queues):
+            depth = box.qsize()
+            if depth > self.max_depth[target]:
+                self.max_depth[target] = depth
+
+    def get(self, box: queue.Queue[Any], stats: _WorkerStats | None) -> Any:
+        try:
+            return box.get_nowait()
+        except queue.Empty:
+            pass
+        start = time.perf_counter()
+        while True:
+            if self.cancelled.is_set():
+                raise _Cancelled
+            try:
+                item = box.get(timeout=_POLL_SECONDS)
+                break
+            except queue.Empty:
+                pass
+        if stats is not None:
+            stats.idle += time.perf_counter() - start
+        return item
+
+    def acquire_slot(self) -> None:
+        while not self.slots.acquire(timeout=_POLL_SECONDS):
+            if self.cancelled.is_set():
+                raise _Cancelled
+
+    def feed(self, items: Iterable[Result[Any, Any]]) -> None:
+        try:
+            for index, either in enumerate(items):
+                self.acquire_slot()
+                if either.is_left:
+                    # Left na entrada não passa por nenhum estágio
+                    self.put(len(self.queues), (index, either), None)
+                else:
+                    self.put(0, (index, either.value), None)
+            self.finish(0)
+        except _Cancelled:
+            pass
+        except BaseException as e:
+            self.fail(e)
+
+    def finish(self, target: int) -> None:
+        """Avisa o estágio `target` (ou a saída) que não há mais itens."""
+        count = self.stages[target].workers if target < len(self.stages) else 1
+        for _ in range(count):
+            self.put(target, _DONE, None)
+
+    def work(self, index: int, stats: _WorkerStats) -> None:
+        func = self.stages[index].func
+        inbox = self.queues[index]
+        last = index == len(self.stages) - 1
+        output = len(self.queues)
+        clock = time.perf_counter
+        try:
+            while True:
+                item = self.get(inbox, stats)
+                if item is _DONE:
+                    break
+                position, value = item
+                start = clock()
+                result = func(value)
+                stats.busy += clock() - start
+                stats.processed += 1
+                if result.is_left:
+                    stats.lefts += 1
+                    self.put(output, (position, result), stats)
+                elif last:
+                    self.put(output, (position, result), stats)
+                else:
+                    self.put(index + 1, (position, result.value), stats)
+            with self.lock:
+                self.remaining[index] -= 1
+                done = self.remaining[index] == 0
+            if done:
+                self.finish(index + 1)
+        except _Cancelled:
+            pass
+        except BaseException as e:
+            self.fail(e)
+
+    def metrics(self) -> dict[str, StageMetrics]:
+        result: dict[str, StageMetrics] = {}
+        for index, stage in enumerate(self.stages):
+            workers = self.workers[index]
+            busy = sum(stats.busy for stats in workers)
+            idle = sum(stats.idle for stats in workers)
+            stalled = sum(stats.stalled for stats in workers)
+            total = busy + idle + stalled
+            processed = sum(stats.processed for stats in workers)
+            result[stage.name] = StageMetrics(
+                workers=stage.workers,
+                processed=processed,
+                lefts=sum(stats.lefts for stats in workers),
+                queue_size=self.queues[index].maxsize,
+                queue_depth=self.queues[index].qsize(),
+                max_queue_depth=self.max_depth[index],
+                busy_seconds=busy,
+                idle_seconds=idle,
+                stalled_seconds=stalled,
+                utilization=busy / total if total else 0.0,
+                capacity=stage.workers * processed / busy if busy else float("inf"),
+            )
+        return result
+
+
+class StagedExecutor(Generic[L, R, T]):
+    """
+    Executa uma sequência de estágios `valor -> Either` do either9, cada um
+    com suas threads, ligados por filas de `queue_size` vagas.
+
+    `max_in_flight` limita os itens entre a entrada e a saída (padrão: todas
+    as vagas das filas mais uma por thread); com `ordered=True`, isso também
+    limita os resultados guardados à espera de um item mais lento.
+    """
+
+    __slots__ = ("stages", "queue_size", "max_in_flight", "_last_run")
+
+    def __init__(self, *stages: Stage | Callable[[Any], Result[Any, Any]], queue_size: int = DEFAULT_QUEUE_SIZE, max_in_flight: int | None = None) -> None:
+        if not stages:
+            raise ValueError("é preciso pelo menos um estágio")
+        if queue_size < 1:
+            raise ValueError("queue_size deve ser pelo menos 1")
+        self.stages = tuple(stage if isinstance(stage, Stage) else Stage(getattr(stage, "__name__", "stage"), stage) for stage in stages)
+        names = [stage.name for stage in self.stages]
+        if len(set(names)) != len(names):
+            raise ValueError(f"nomes de estágio repetidos: {names}")
+        self.queue_size = queue_size
+        if max_in_flight is None:
+            max_in_flight = queue_size * (len(self.stages) + 1) + sum(stage.workers for stage in self.stages)
+        elif max_in_flight < 1:
+            raise ValueError("max_in_flight deve ser pelo menos 1")
+        self.max_in_flight = max_in_flight
+        self._last_run: _Run | None = None
+
+    def run(self, items: Iterable[Result[L, R]], *, ordered: bool = True) -> Iterator[Result[L, T]]:
+        """
+        Passa cada Either de `items` pelos estágios e produz os resultados:
+        na ordem de entrada com `ordered=True`, ou na ordem em que ficam
+        prontos. Uma exceção em um estágio cancela a execução e é relançada
+        aqui; parar de consumir o iterador também cancela.
+        """
+        run = _Run(self.stages, self.queue_size, self.max_in_flight)
+        self._last_run = run
+        threads = [threading.Thread(target=run.feed, args=(items,), name="eithers-staged-feed", daemon=True)]
+        for index, stage in enumerate(self.stages):
+            for number in range(stage.workers):
+                stats = _WorkerStats()
+                run.workers[index].append(stats)
+                threads.append(threading.Thread(target=run.work, args=(index, stats), name=f"eithers-staged-{stage.name}-{number}", daemon=True))
+        for thread in threads:
+            thread.start()
+
+        ready: dict[int, Result[L, T]] = {}
+        next_index = 0
+        try:
+            while True:
+                try:
+                    item = run.get(run.output, None)
+                except _Cancelled:
+                    break
+                if item is _DONE:
+                    break
+                position, result = cast("tuple[int, Result[L, T]]", item)
+                if not ordered:
+                    run.slots.release()
+                    yield result
+                    continue
+                ready[position] = result
+                while next_index in ready:
+                    run.slots.release()
+                    yield ready.pop(next_index)
+                    next_index += 1
+        finally:
+            run.cancelled.set()
+        if run.error is not None:
+            raise run.error
+
+    def run_all(self, items: Iterable[Result[L, R]]) -> list[Result[L, T]]:
+        """Versão de `run` que devolve todos os resultados em uma lista, na ordem de entrada."""
+        return list(self.run(items))
+
+    def metrics(self) -> dict[str, StageMetrics]:
+        """Métricas por estágio da execução atual (ou da última)."""
+        return self._last_run.metrics() if self._last_run is not None else {}
+
+    def bottleneck(self) -> str | None:
+        """
+        Nome do estágio de menor capacidade na execução atual (ou na última).
+        A ocupação sozinha engana em execuções curtas: antes de as filas
+        encherem, todos os estágios à frente do gargalo também ficam ocupados.
+        """
+        metrics = self.metrics()
+        if not any(stats["processed"] for stats in metrics.values()):
+            return None
+        return min(metrics, key=lambda name: metrics[name]["capacity"])
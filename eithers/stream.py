@@ -0,0 +1,142 @@
+from __future__ import annotations
+from collections import deque
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar, cast
+
+from .either7 import Either, Left, Right
+
+# Define tipos genéricos para Left, Right e transformações
+L = TypeVar("L")  # Tipo do erro
+R = TypeVar("R")  # Tipo do sucesso
+T = TypeVar("T")  # Tipo para transformações
+U = TypeVar("U")  # Tipo adicional para transformações do Left
+
+
+class EitherStream(Generic[L, R]):
+    """
+    Sequência preguiçosa de Either (either7) sobre um iterável qualquer.
+
+    Todas as operações devolvem um novo EitherStream baseado em geradores:
+    nada é lido da fonte até alguém iterar, e só um elemento por vez fica
+    vivo. O stream pode ser percorrido uma única vez se a fonte for um
+    iterador (um arquivo, por exemplo).
+
+        with open(path) as lines:
+            EitherStream.of_values(lines).map(str.strip).bind(parse).partition(log_error, save)
+    """
+
+    __slots__ = ("_source",)
+
+    def __init__(self, source: Iterable[Either[L, R]]) -> None:
+        self._source = source
+
+    @staticmethod
+    def of_values(values: Iterable[R]) -> EitherStream[Any, R]:
+        """Cria um stream de Right a partir de valores crus."""
+        return EitherStream(Right(value) for value in values)
+
+    def __iter__(self) -> Iterator[Either[L, R]]:
+        return iter(self._source)
+
+    def map(self, f: Callable[[R], T]) -> EitherStream[L, T]:
+        """Aplica `f` ao valor de cada Right."""
+        return EitherStream(either.map(f) for either in self._source)
+
+    def bind(self, f: Callable[[R], Either[L, T]]) -> EitherStream[L, T]:
+        """Aplica a cada Right uma função que retorna Either."""
+        return EitherStream(either.flat_map(f) for either in self._source)
+
+    flat_map = bind
+
+    def map_left(self, f: Callable[[L], U]) -> EitherStream[U, R]:
+        """Aplica `f` ao erro de cada Left."""
+        return EitherStream(either.map_left(f) for either in self._source)
+
+    def filter_right(self, predicate: Callable[[R], bool]) -> EitherStream[L, R]:
+        """Descarta os Right cujo valor não satisfaz `predicate`; os Left passam."""
+
+        def run() -> Iterator[Either[L, R]]:
+            for either in self._source:
+                if not isinstance(either, Right) or predicate(either.value):
+                    yield either
+
+        return EitherStream(run())
+
+    def take_while_right(self) -> EitherStream[L, R]:
+        """Para de ler a fonte no primeiro Left (que não é incluído)."""
+
+        def run() -> Iterator[Either[L, R]]:
+            for either in self._source:
+                if isinstance(either, Left):
+                    return
+                yield either
+
+        return EitherStream(run())
+
+    def rights(self) -> Iterator[R]:
+        """Valores dos Right, descartando os Left."""
+        for either in self._source:
+            if isinstance(either, Right):
+                yield either.value
+
+    def lefts(self) -> Iterator[L]:
+        """Erros dos Left, descartando os Right."""
+        for either in self._source:
+            if isinstance(either, Left):
+                yield either.value
+
+    def partition(self, on_left: Callable[[L], object], on_right: Callable[[R], object]) -> tuple[int, int]:
+        """
+        Consome o stream entregando cada erro a `on_left` e cada valor a
+        `on_right`. Nada é acumulado; devolve as contagens (lefts, rights).
+        """
+        lefts = rights = 0
+        for either in self._source:
+            if isinstance(either, Right):
+                on_right(either.value)
+                rights += 1
+            else:
+                on_left(cast("Left[L, R]", either).value)
+                lefts += 1
+        return lefts, rights
+
+    def split(self, max_buffer: int = 1024) -> tuple[Iterator[L], Iterator[R]]:
+        """
+        Divide o stream em dois iteradores preguiçosos, de erros e de valores.
+
+        Ler de um lado guarda os elementos do outro lado em um buffer de até
+        `max_buffer` itens; se o buffer encher, a leitura levanta BufferError.
+        Os dois iteradores devem ser consumidos na mesma thread.
+        """
+        return _Splitter(iter(self._source), max_buffer).iterators()
+
+
+class _Splitter(Generic[L, R]):
+    __slots__ = ("_source", "_max_buffer", "_lefts", "_rights")
+
+    def __init__(self, source: Iterator[Either[L, R]], max_buffer: int) -> None:
+        self._source = source
+        self._max_buffer = max_buffer
+        self._lefts: deque[L] = deque()
+        self._rights: deque[R] = deque()
+
+    def iterators(self) -> tuple[Iterator[L], Iterator[R]]:
+        return self._side(self._lefts, self._rights, want_right=False), self._side(self._rights, self._lefts, want_right=True)
+
+    def _side(self, mine: deque[Any], other: deque[Any], want_right: bool) -> Iterator[Any]:
+        while True:
+            if mine:
+                yield mine.popleft()
+                continue
+            either = next(self._source, None)
+            if either is None:
+                return
+            if isinstance(either, Right):
+                is_right, value = True, either.value
+            else:
+                is_right, value = False, cast("Left[L, R]", either).value
+            if is_right is want_right:
+                yield value
+                continue
+            if len(other) >= self._max_buffer:
+                raise BufferError(f"mais de {self._max_buffer} itens pendentes do outro lado do split")
+            other.append(value)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+import threading
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from .either7 import Either, try_catch
+
+R = TypeVar("R")  # Tipo do sucesso
+
+# Limite padrão de chamadas submetidas e ainda não consumidas
+DEFAULT_MAX_IN_FLIGHT = 64
+
+_default_executor: ThreadPoolExecutor | None = None
+_default_lock = threading.Lock()
+
+
+def default_executor() -> ThreadPoolExecutor:
+    """Pool de threads compartilhado, criado no primeiro uso e reaproveitado depois."""
+    global _default_executor
+    if _default_executor is None:
+        with _default_lock:
+            if _default_executor is None:
+                _default_executor = ThreadPoolExecutor(thread_name_prefix="eithers")
+    return _default_executor
+
+
+def try_catch_stream(
+    thunks: Iterable[Callable[[], R]],
+    *,
+    executor: Executor | None = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ordered: bool = False,
+) -> Iterator[tuple[int, Either[Exception, R]]]:
+    """
+    Executa cada thunk com `try_catch` em um pool de threads e produz pares
+    `(índice, Either)`.
+
+    `thunks` é consumido aos poucos: no máximo `max_in_flight` chamadas ficam
+    submetidas (ou prontas e ainda não entregues) ao mesmo tempo. Com
+    `ordered=False` os resultados saem na ordem em que terminam; com
+    `ordered=True`, na ordem de entrada. Se o consumidor parar antes do fim,
+    as chamadas que ainda não começaram são canceladas.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight deve ser pelo menos 1")
+    pool = executor if executor is not None else default_executor()
+    source = enumerate(thunks)
+    pending: dict[Future[Either[Exception, R]], int] = {}
+    ready: dict[int, Either[Exception, R]] = {}
+    next_index = 0
+    exhausted = False
+
+    def fill() -> None:
+        nonlocal exhausted
+        while not exhausted and len(pending) + len(ready) < max_in_flight:
+            try:
+                index, thunk = next(source)
+            except StopIteration:
+                exhausted = True
+                return
+            pending[pool.submit(try_catch, thunk)] = index
+
+    try:
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                if not ordered:
+                    yield index, future.result()
+                    continue
+                ready[index] = future.result()
+                while next_index in ready:
+                    yield next_index, ready.pop(next_index)
+                    next_index += 1
+            fill()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def try_catch_many(
+    thunks: Iterable[Callable[[], R]],
+    *,
+    executor: Executor | None = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+) -> list[Either[Exception, R]]:
+    """
+    Versão em lote de `try_catch` para chamadas de I/O: executa os thunks em
+    um pool de threads (o compartilhado, se `executor` não for informado) e
+    devolve os resultados na ordem de entrada.
+    """
+    return [either for _, either in try_catch_stream(thunks, executor=executor, max_in_flight=max_in_flight, ordered=True)]
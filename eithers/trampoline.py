@@ -0,0 +1,114 @@
+from __future__ import annotations
+from typing import Any, Callable, Generic, TypeAlias, TypeVar
+
+from . import either7, either9
+
+# Definindo tipos genéricos
+L = TypeVar("L")  # Tipo do valor de Left
+R = TypeVar("R")  # Tipo do valor de Right
+T = TypeVar("T")  # Tipo genérico para transformações
+
+# Eithers aceitos como passo: o Result do either9 ou o Either do either7
+Step: TypeAlias = "Trampoline[L, R] | either9.Result[L, R] | either7.Either[L, R]"
+
+
+class Trampoline(Generic[L, R]):
+    """
+    Computação Either descrita como dados e executada sem recursão.
+
+    `bind`/`map` apenas registram o próximo passo e `suspend` adia a
+    construção de um passo até a hora de executá-lo. `run` interpreta tudo em
+    um laço com uma pilha explícita de continuações, então cadeias e
+    recursões de qualquer profundidade usam pilha constante do Python e
+    tempo linear. Um Left interrompe a execução e descarta o resto.
+
+        def count(n: int) -> Trampoline[str, int]:
+            if n == 0:
+                return done(Right(0))
+            return suspend(lambda: count(n - 1)).map(lambda x: x + 1)
+
+        count(1_000_000).run()  # Right(1000000)
+    """
+
+    __slots__ = ()
+
+    def bind(self, func: Callable[[R], Step[L, T]]) -> Trampoline[L, T]:
+        """Registra uma função que recebe o valor de sucesso e devolve um Either ou outro Trampoline."""
+        return _Bind(self, func)
+
+    flat_map = bind
+
+    def map(self, func: Callable[[R], T]) -> Trampoline[L, T]:
+        """Registra uma transformação do valor de sucesso."""
+        return _Map(self, func)
+
+    def run(self) -> either9.Result[L, R] | either7.Either[L, R]:
+        """Executa a computação e devolve o Either final."""
+        stack: list[_Bind[Any, Any] | _Map[Any, Any]] = []
+        current: Any = self
+        while True:
+            kind = type(current)
+            if kind is _Bind or kind is _Map:
+                stack.append(current)
+                current = current.source
+                continue
+            if kind is _Suspend:
+                current = current.thunk()
+                continue
+
+            either = current.either if kind is _Done else current
+            # `tag` existe nas duas variantes e vale para subclasses como provenance.TracedLeft
+            if either.tag == "left" or not stack:
+                return either
+            right_type = type(either)
+            # maps seguidos são aplicados direto no valor, sem criar um Right por passo
+            value = either.value
+            while stack:
+                node = stack.pop()
+                if type(node) is _Map:
+                    value = node.func(value)
+                else:
+                    current = node.func(value)
+                    break
+            else:
+                return right_type(value)
+
+
+class _Done(Trampoline[L, R]):
+    __slots__ = ("either",)
+
+    def __init__(self, either: either9.Result[L, R] | either7.Either[L, R]) -> None:
+        self.either = either
+
+
+class _Suspend(Trampoline[L, R]):
+    __slots__ = ("thunk",)
+
+    def __init__(self, thunk: Callable[[], Step[L, R]]) -> None:
+        self.thunk = thunk
+
+
+class _Bind(Trampoline[L, R]):
+    __slots__ = ("source", "func")
+
+    def __init__(self, source: Trampoline[L, Any], func: Callable[[Any], Step[L, R]]) -> None:
+        self.source = source
+        self.func = func
+
+
+class _Map(Trampoline[L, R]):
+    __slots__ = ("source", "func")
+
+    def __init__(self, source: Trampoline[L, Any], func: Callable[[Any], R]) -> None:
+        self.source = source
+        self.func = func
+
+
+def done(either: either9.Result[L, R] | either7.Either[L, R]) -> Trampoline[L, R]:
+    """Passo já resolvido."""
+    return _Done(either)
+
+
+def suspend(thunk: Callable[[], Step[L, R]]) -> Trampoline[L, R]:
+    """Passo adiado: `thunk` só é chamado durante `run`, sem aumentar a pilha."""
+    return _Suspend(thunk)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+from typing import Callable, Iterable, Mapping, TypeVar, cast
+
+from .either9 import Left, Result, Right
+
+# Definindo tipos genéricos
+K = TypeVar("K")  # Tipo das chaves nas versões para dict
+L = TypeVar("L")  # Tipo do valor de Left
+R = TypeVar("R")  # Tipo do valor de Right
+T = TypeVar("T")  # Tipo dos itens de entrada de traverse
+
+
+def sequence(items: Iterable[Result[L, R]]) -> Result[L, list[R]]:
+    """
+    Transforma uma sequência de Either em um Either de lista.
+
+    Percorre `items` uma única vez, acumulando os valores em uma lista, e
+    para de consumir a entrada no primeiro Left, que é devolvido. Funciona com
+    iteráveis preguiçosos (geradores, arquivos).
+    """
+    values: list[R] = []
+    append = values.append
+    for either in items:
+        if isinstance(either, Left):
+            return cast("Left[L, list[R]]", either)
+        append(either.value)
+    return Right(values)
+
+
+def traverse(items: Iterable[T], func: Callable[[T], Result[L, R]]) -> Result[L, list[R]]:
+    """Aplica `func` a cada item e junta os resultados como `sequence`, parando no primeiro Left."""
+    values: list[R] = []
+    append = values.append
+    for item in items:
+        either = func(item)
+        if isinstance(either, Left):
+            return cast("Left[L, list[R]]", either)
+        append(either.value)
+    return Right(values)
+
+
+def sequence_dict(items: Mapping[K, Result[L, R]]) -> Result[L, dict[K, R]]:
+    """Versão de `sequence` para dicionários: mantém as chaves, para no primeiro Left."""
+    values: dict[K, R] = {}
+    for key, either in items.items():
+        if isinstance(either, Left):
+            return cast("Left[L, dict[K, R]]", either)
+        values[key] = either.value
+    return Right(values)
+
+
+def traverse_dict(items: Mapping[K, T], func: Callable[[T], Result[L, R]]) -> Result[L, dict[K, R]]:
+    """Versão de `traverse` para dicionários: aplica `func` a cada valor, para no primeiro Left."""
+    values: dict[K, R] = {}
+    for key, item in items.items():
+        either = func(item)
+        if isinstance(either, Left):
+            return cast("Left[L, dict[K, R]]", either)
+        values[key] = either.value
+    return Right(values)
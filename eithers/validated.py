@@ -0,0 +1,265 @@
+"""
+Validação que acumula erros em vez de parar no primeiro.
+
+`Valid(valor)` e `Invalid(erros)` seguem o mesmo desenho de Left/Right
+do either9 (imutáveis, `tag`, `is_left`/`is_right`, `__match_args__`,
+`map`, `fold`), mas `combine` e `traverse`
+juntam os erros dos dois lados. Os erros ficam numa ErrorChain, uma
+lista persistente com concatenação O(1), então acumular n erros custa O(n)
+no total, e não O(n²) como concatenar listas dentro de um `fold`.
+
+    def check_age(form: dict[str, str]) -> Either[str, int]: ...
+    def check_name(form: dict[str, str]) -> Either[str, str]: ...
+
+    result = from_either(check_age(form)).combine(from_either(check_name(form)), User)
+    result.to_either()  # Right(User(...)) ou Left([todos os erros])
+"""
+
+from __future__ import annotations
+from typing import Callable, ClassVar, Generic, Iterable, Iterator, Literal, NoReturn, Self, TypeAlias, TypeVar, cast, override
+
+from .either7 import Either, Left, Right
+
+E = TypeVar("E")  # Tipo de cada erro
+A = TypeVar("A")  # Tipo do valor válido
+B = TypeVar("B")  # Tipo de outro valor válido
+C = TypeVar("C")  # Tipo do resultado de combine
+T = TypeVar("T")  # Tipo dos itens de entrada
+U = TypeVar("U")  # Tipo do resultado de fold
+
+
+class ErrorChain(Generic[E]):
+    """
+    Sequência imutável de erros com `append` e `concat` O(1).
+
+    Cada nó é uma folha (uma tupla de erros) ou a junção de duas cadeias;
+    a iteração percorre a árvore com uma pilha explícita, em O(n) e sem
+    recursão, qualquer que seja a profundidade.
+    """
+
+    __slots__ = ("_items", "_left", "_right", "size")
+    size: int
+
+    def __init__(self, items: tuple[E, ...] = (), left: ErrorChain[E] | None = None, right: ErrorChain[E] | None = None) -> None:
+        self._items = items
+        self._left = left
+        self._right = right
+        self.size = len(items) if left is None or right is None else left.size + right.size
+
+    @staticmethod
+    def of(*errors: E) -> ErrorChain[E]:
+        return ErrorChain(errors)
+
+    def append(self, error: E) -> ErrorChain[E]:
+        return self.concat(ErrorChain((error,)))
+
+    def concat(self, other: ErrorChain[E]) -> ErrorChain[E]:
+        if not other.size:
+            return self
+        if not self.size:
+            return other
+        return ErrorChain(left=self, right=other)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[E]:
+        stack: list[ErrorChain[E]] = [self]
+        while stack:
+            node = stack.pop()
+            if node._left is not None and node._right is not None:
+                stack.append(node._right)
+                stack.append(node._left)
+            else:
+                yield from node._items
+
+    def to_list(self) -> list[E]:
+        return list(self)
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if type(other) is ErrorChain:
+            other = cast("ErrorChain[object]", other)
+            return self.size == other.size and self.to_list() == other.to_list()
+        return NotImplemented
+
+    @override
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    @override
+    def __repr__(self) -> str:
+        return f"ErrorChain({self.to_list()!r})"
+
+
+class Valid(Generic[E, A]):
+    """Valor que passou em todas as validações."""
+
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+    tag: ClassVar[Literal["right"]] = "right"
+    is_left: ClassVar[Literal[False]] = False
+    is_right: ClassVar[Literal[True]] = True
+    value: A  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    def __init__(self, value: A) -> None:
+        # Escreve direto no slot, já que __setattr__ está bloqueado
+        _set_valid_value(self, value)
+
+    @override
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    @override
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"cannot delete field {name!r}")
+
+    def map(self, f: Callable[[A], B]) -> Validated[E, B]:
+        return Valid(f(self.value))
+
+    def combine(self, other: Validated[E, B], f: Callable[[A, B], C]) -> Validated[E, C]:
+        """Aplica `f` aos dois valores se ambos forem válidos; senão, devolve os erros."""
+        if type(other) is Valid:
+            return Valid(f(self.value, other.value))
+        return cast("Invalid[E, C]", other)
+
+    def fold(self, invalid_f: Callable[[ErrorChain[E]], U], valid_f: Callable[[A], U]) -> U:  # pyright: ignore[reportUnusedParameter]
+        return valid_f(self.value)
+
+    def to_either(self) -> Either[list[E], A]:
+        return Right(self.value)
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if type(other) is Valid:
+            return self.value == cast("Valid[object, object]", other).value
+        return NotImplemented
+
+    @override
+    def __hash__(self) -> int:
+        return hash((Valid, self.value))
+
+    @override
+    def __repr__(self) -> str:
+        return f"Valid({self.value!r})"
+
+    @override
+    def __reduce__(self) -> tuple[type[Self], tuple[A]]:
+        return (type(self), (self.value,))
+
+
+class Invalid(Generic[E, A]):
+    """Resultado com um ou mais erros."""
+
+    __slots__ = ("errors",)
+    __match_args__ = ("errors",)
+    tag: ClassVar[Literal["left"]] = "left"
+    is_left: ClassVar[Literal[True]] = True
+    is_right: ClassVar[Literal[False]] = False
+    errors: ErrorChain[E]  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    def __init__(self, errors: ErrorChain[E]) -> None:
+        _set_invalid_errors(self, errors)
+
+    @override
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    @override
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"cannot delete field {name!r}")
+
+    @staticmethod
+    def of(*errors: E) -> Invalid[E, A]:
+        return Invalid(ErrorChain(errors))
+
+    def map(self, f: Callable[[A], B]) -> Validated[E, B]:  # pyright: ignore[reportUnusedParameter]
+        # A só existe no tipo: o mesmo Invalid serve para qualquer B
+        return cast("Invalid[E, B]", self)
+
+    def combine(self, other: Validated[E, B], f: Callable[[A, B], C]) -> Validated[E, C]:  # pyright: ignore[reportUnusedParameter]
+        """Junta os erros dos dois lados (os deste primeiro)."""
+        if type(other) is Invalid:
+            return Invalid(self.errors.concat(other.errors))
+        return cast("Invalid[E, C]", self)
+
+    def fold(self, invalid_f: Callable[[ErrorChain[E]], U], valid_f: Callable[[A], U]) -> U:  # pyright: ignore[reportUnusedParameter]
+        return invalid_f(self.errors)
+
+    def to_either(self) -> Either[list[E], A]:
+        return Left(self.errors.to_list())
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if type(other) is Invalid:
+            return self.errors == cast("Invalid[object, object]", other).errors
+        return NotImplemented
+
+    @override
+    def __hash__(self) -> int:
+        return hash((Invalid, self.errors))
+
+    @override
+    def __repr__(self) -> str:
+        return f"Invalid({self.errors.to_list()!r})"
+
+    @override
+    def __reduce__(self) -> tuple[type[Self], tuple[ErrorChain[E]]]:
+        return (type(self), (self.errors,))
+
+
+_set_valid_value = Valid.__dict__["value"].__set__  # pyright: ignore[reportAny]
+_set_invalid_errors = Invalid.__dict__["errors"].__set__  # pyright: ignore[reportAny]
+
+
+Validated: TypeAlias = "Valid[E, A] | Invalid[E, A]"
+
+
+def from_either(either: Either[E, A]) -> Validated[E, A]:
+    """Converte um Either do either7: Right vira Valid e Left vira Invalid com um erro."""
+    if type(either) is Right:
+        return Valid(cast("Right[E, A]", either).value)
+    return Invalid(ErrorChain((cast("Left[E, A]", either).value,)))
+
+
+def traverse(items: Iterable[T], f: Callable[[T], Validated[E, A] | Either[E, A]]) -> Validated[E, list[A]]:
+    """
+    Valida cada item com `f` (que pode devolver Validated ou um Either do
+    either7) e junta tudo: Valid com a lista de valores se nenhum falhar,
+    ou Invalid com todos os erros, na ordem dos itens. Tempo O(n + erros).
+    """
+    values: list[A] = []
+    errors: list[E] = []
+    chains: list[ErrorChain[E]] = []
+    for item in items:
+        result = f(item)
+        kind = type(result)
+        if kind is Valid or kind is Right:
+            if not errors and not chains:
+                values.append(cast("Valid[E, A]", result).value)
+        elif kind is Left:
+            errors.append(cast("Left[E, A]", result).value)
+        else:
+            invalid = cast("Invalid[E, A]", result)
+            if errors:
+                # Fecha os erros avulsos antes, para manter a ordem
+                chains.append(ErrorChain(tuple(errors)))
+                errors = []
+            chains.append(invalid.errors)
+    if not errors and not chains:
+        return Valid(values)
+    if errors:
+        chains.append(ErrorChain(tuple(errors)))
+    chain = chains[0]
+    for other in chains[1:]:
+        chain = chain.concat(other)
+    return Invalid(chain)
+
+
+def sequence(items: Iterable[Validated[E, A] | Either[E, A]]) -> Validated[E, list[A]]:
+    """Junta uma sequência de Validated (ou de Either do either7) em um só."""
+    return traverse(items, _identity)
+
+
+def _identity(item: Validated[E, A] | Either[E, A]) -> Validated[E, A] | Either[E, A]:
+    return item